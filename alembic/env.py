@@ -31,12 +31,13 @@ from app.models import (  # pylint: disable=wrong-import-position  # noqa: E402
     hospedaje,
     pedido,
     producto,
+    refresh_token,
     tarifa,
     usuario,
 )
 
 # Evitar warnings de imports no utilizados - estos son necesarios para Alembic
-_ = (habitacion, hospedaje, pedido, producto, tarifa, usuario)
+_ = (habitacion, hospedaje, pedido, producto, refresh_token, tarifa, usuario)
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
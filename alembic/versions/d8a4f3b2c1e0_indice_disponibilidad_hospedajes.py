@@ -0,0 +1,42 @@
+"""Indice de disponibilidad en hospedajes
+
+Revision ID: d8a4f3b2c1e0
+Revises: c51e0a7d9b12
+Create Date: 2026-10-18 11:02:37.904512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8a4f3b2c1e0'
+down_revision: Union[str, Sequence[str], None] = 'c51e0a7d9b12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # En PostgreSQL, CONCURRENTLY no bloquea las reservas mientras se crea y
+    # no puede ejecutarse dentro de una transacción
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_hospedajes_habitacion_salida',
+            'hospedajes',
+            ['numero_habitacion', 'fecha_check_out', 'fecha_check_in', 'estado'],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_hospedajes_habitacion_salida',
+            table_name='hospedajes',
+            postgresql_concurrently=True,
+        )
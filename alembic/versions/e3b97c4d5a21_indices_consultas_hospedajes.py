@@ -0,0 +1,50 @@
+"""Indices de consultas en hospedajes
+
+Revision ID: e3b97c4d5a21
+Revises: d8a4f3b2c1e0
+Create Date: 2026-10-18 14:20:11.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3b97c4d5a21'
+down_revision: Union[str, Sequence[str], None] = 'd8a4f3b2c1e0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Las consultas por habitación ya usan ix_hospedajes_habitacion_salida
+# (numero_habitacion primero), creado en d8a4f3b2c1e0
+INDICES = {
+    'ix_hospedajes_estado_check_in': ['estado', 'fecha_check_in'],
+    'ix_hospedajes_check_in': ['fecha_check_in'],
+    'ix_hospedajes_fecha_actualizacion': ['fecha_actualizacion'],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # En PostgreSQL, CONCURRENTLY no bloquea las escrituras mientras se crean
+    # y no puede ejecutarse dentro de una transacción
+    with op.get_context().autocommit_block():
+        for nombre, columnas in INDICES.items():
+            op.create_index(
+                nombre,
+                'hospedajes',
+                columnas,
+                unique=False,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for nombre in INDICES:
+            op.drop_index(
+                nombre, table_name='hospedajes', postgresql_concurrently=True
+            )
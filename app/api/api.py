@@ -6,7 +6,9 @@ from fastapi import APIRouter
 
 # Asegúrate de que todos estos módulos y sus routers existan
 from app.api.endpoints import (
+    admin,
     auth,
+    exportaciones,
     habitaciones,
     hospedaje,
     productos,
@@ -14,16 +16,46 @@ from app.api.endpoints import (
     tarifas,
     usuarios,
 )
+from app.core.config import get_settings
 
-api_router = APIRouter(prefix="/api/v1")
+settings = get_settings()
 
-# Incluimos todos los routers de nuestros módulos
-api_router.include_router(auth.router, prefix="/auth", tags=["Autenticación"])
-api_router.include_router(usuarios.router, prefix="/usuarios", tags=["Usuarios"])
-api_router.include_router(hospedaje.router, prefix="/hospedajes", tags=["Hospedajes"])
-api_router.include_router(
-    habitaciones.router, prefix="/habitaciones", tags=["Habitaciones"]
-)
-api_router.include_router(productos.router, prefix="/productos", tags=["Productos"])
-api_router.include_router(tarifas.router, prefix="/tarifas", tags=["Tarifas"])
-api_router.include_router(reportes.router, prefix="/reportes", tags=["Reportes"])
+
+def build_api_router(async_reads: bool = False) -> APIRouter:
+    """
+    Router /api/v1 con todos los endpoints
+
+    Con `async_reads` las lecturas calientes de app.api.endpoints.lecturas_async
+    se registran primero para que tengan prioridad sobre sus equivalentes
+    síncronos; cada ruta estática de un router síncrono que coincida con un
+    patrón asíncrono (p. ej. /habitaciones/disponibilidad frente a
+    /habitaciones/{numero}) necesita su versión asíncrona.
+    """
+    router = APIRouter(prefix="/api/v1")
+    if async_reads:
+        from app.api.endpoints import lecturas_async
+
+        router.include_router(
+            lecturas_async.habitaciones_router, prefix="/habitaciones"
+        )
+        router.include_router(lecturas_async.hospedajes_router, prefix="/hospedajes")
+        router.include_router(lecturas_async.productos_router, prefix="/productos")
+        router.include_router(lecturas_async.tarifas_router, prefix="/tarifas")
+
+    router.include_router(auth.router, prefix="/auth", tags=["Autenticación"])
+    router.include_router(usuarios.router, prefix="/usuarios", tags=["Usuarios"])
+    router.include_router(hospedaje.router, prefix="/hospedajes", tags=["Hospedajes"])
+    router.include_router(
+        habitaciones.router, prefix="/habitaciones", tags=["Habitaciones"]
+    )
+    router.include_router(productos.router, prefix="/productos", tags=["Productos"])
+    router.include_router(tarifas.router, prefix="/tarifas", tags=["Tarifas"])
+    router.include_router(reportes.router, prefix="/reportes", tags=["Reportes"])
+    router.include_router(
+        exportaciones.router, prefix="/exportaciones", tags=["Exportaciones"]
+    )
+    router.include_router(admin.router, prefix="/admin", tags=["Administración"])
+    return router
+
+
+api_router = build_api_router(async_reads=settings.DATABASE_ASYNC)
@@ -6,7 +6,10 @@ from collections.abc import Generator
 
 from sqlalchemy.orm import Session
 
-from app.db.session import SessionLocal
+from app.db.async_session import get_async_db, get_async_read_db
+from app.db.session import ReadSessionLocal, SessionLocal
+
+__all__ = ["get_async_db", "get_async_read_db", "get_db", "get_read_db"]
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -19,3 +22,16 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    Generador de dependencia para obtener una sesión de solo lectura.
+    Usa la réplica (DATABASE_READ_URL) si está configurada; los endpoints que
+    escriben o leen sus propias escrituras deben usar get_db.
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
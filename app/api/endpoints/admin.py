@@ -0,0 +1,35 @@
+"""
+Endpoints de administración y diagnóstico (solo superusuarios)
+"""
+
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Depends, Query
+
+from app.api.endpoints.auth import get_current_superuser
+from app.db.slow_queries import clear_slow_queries, get_slow_queries
+from app.schemas.auth import TokenClaims
+
+router = APIRouter()
+
+
+@router.get("/consultas-lentas")
+def read_consultas_lentas(
+    _current_user: Annotated[TokenClaims, Depends(get_current_superuser)],
+    limit: Annotated[int | None, Query(ge=1)] = None,
+) -> list[dict[str, Any]]:
+    """
+    Obtener las consultas lentas registradas, de la más reciente a la más antigua
+    """
+    return get_slow_queries(limit)
+
+
+@router.delete("/consultas-lentas")
+def delete_consultas_lentas(
+    _current_user: Annotated[TokenClaims, Depends(get_current_superuser)],
+) -> dict[str, str]:
+    """
+    Vaciar el registro de consultas lentas
+    """
+    clear_slow_queries()
+    return {"message": "Registro de consultas lentas vaciado"}
@@ -5,63 +5,152 @@ Authentication endpoints
 from datetime import timedelta
 from typing import Annotated
 
+import anyio
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
-from jose import JWTError, jwt
 from sqlalchemy.orm import Session
 
-from ...core import security
+from ...core import revocation, security
+from ...core.cache_backends import CacheBackendError
 from ...core.config import settings
-from ...crud import crud_usuario
+from ...core.logging import get_logger
+from ...core.password_pool import PasswordPoolBusyError
+from ...crud import crud_refresh_token, crud_usuario
 from ...database import get_db
 from ...models.usuario import Usuario
-from ...schemas.auth import Token
+from ...schemas.auth import RefreshTokenRequest, Token, TokenClaims
 
 router = APIRouter()
+logger = get_logger(__name__)
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
 
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+def _active_user(db: Session, email: str) -> Usuario:
+    # Instantánea en caché: update_usuario y delete_usuario la invalidan, así
+    # que una desactivación se aplica en la siguiente petición
+    user = crud_usuario.get_usuario_snapshot(db=db, email=email)
+    if user is None:
+        raise _credentials_exception()
+    if not user.is_active:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
+        )
+    return user
+
+
+def get_current_claims(
+    db: Annotated[Session, Depends(get_db)],
+    token: Annotated[str, Depends(oauth2_scheme)],
+) -> TokenClaims:
+    """
+    Authorize the request from the signed token claims, without a DB query
+
+    Tokens without claims (issued before they existed), a per-process
+    revocation list (CACHE_BACKEND=memory) and an unreachable one fall back
+    to the user lookup.
+    """
+    payload = security.decode_access_token(token)
+    if payload is None or payload.get("sub") is None:
+        raise _credentials_exception()
+
+    if "uid" in payload:
+        try:
+            revocado = revocation.is_revoked(payload)
+        except CacheBackendError:
+            logger.warning("Lista de revocación no disponible: se consulta la base")
+        else:
+            if revocado:
+                raise _credentials_exception()
+            # Una lista del proceso no ve las revocaciones de otros workers
+            if revocation.is_shared():
+                return TokenClaims(
+                    id=payload["uid"],
+                    email=payload["sub"],
+                    is_superuser=payload.get("su", False),
+                    puesto=payload.get("pst"),
+                    jti=payload.get("jti"),
+                    exp=payload.get("exp"),
+                )
+
+    user = _active_user(db, payload["sub"])
+    return TokenClaims(
+        id=user.id,
+        email=user.email,
+        is_superuser=user.is_superuser,
+        puesto=user.puesto,
+        jti=payload.get("jti"),
+        exp=payload.get("exp"),
+    )
+
+
 def get_current_user(
     db: Annotated[Session, Depends(get_db)],
     token: Annotated[str, Depends(oauth2_scheme)],
 ) -> Usuario:
     """
-    Get current user based on JWT token
+    Get current user based on JWT token (for endpoints that need the full user)
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-    try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
+    claims = get_current_claims(db, token)
+    return _active_user(db, claims.email)
+
+
+def get_current_superuser(
+    current_user: Annotated[TokenClaims, Depends(get_current_claims)],
+) -> TokenClaims:
+    """
+    Require the current user to be a superuser
+    """
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough privileges",
         )
-        username: str | None = payload.get("sub")
-        if username is None:
-            raise credentials_exception from None
-    except JWTError as exc:
-        raise credentials_exception from exc
+    return current_user
 
-    user = crud_usuario.get_usuario_by_email(db=db, email=username)
-    if user is None:
-        raise credentials_exception from None
-    return user
+
+def _token_response(user: Usuario, refresh_token: str) -> Token:
+    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    return Token(
+        access_token=security.create_access_token(
+            subject=user.email,
+            expires_delta=access_token_expires,
+            claims={"uid": user.id, "su": user.is_superuser, "pst": user.puesto},
+        ),
+        token_type="bearer",
+        refresh_token=refresh_token,
+        expires_in=int(access_token_expires.total_seconds()),
+    )
 
 
 @router.post("/login", response_model=Token)
-def login_access_token(
+async def login_access_token(
     db: Annotated[Session, Depends(get_db)],
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
 ) -> Token:
     """
     OAuth2 compatible token login, get an access token for future requests
     """
-    user = crud_usuario.authenticate_usuario(
-        db=db, email=form_data.username, password=form_data.password
-    )
+    try:
+        user = await crud_usuario.authenticate_usuario_async(
+            db=db, email=form_data.username, password=form_data.password
+        )
+    except PasswordPoolBusyError:
+        # Pico de inicios de sesión: se rechaza al momento en vez de encolar
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Demasiados inicios de sesión simultáneos, reintente",
+            headers={"Retry-After": "1"},
+        ) from None
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -72,13 +161,58 @@ def login_access_token(
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail="Inactive user"
         )
-    access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    return Token(
-        access_token=security.create_access_token(
-            subject=user.email, expires_delta=access_token_expires
-        ),
-        token_type="bearer",
+    refresh_token = await anyio.to_thread.run_sync(
+        lambda: crud_refresh_token.create_refresh_token(db, usuario_id=user.id)
     )
+    return _token_response(user, refresh_token)
+
+
+@router.post("/refresh", response_model=Token)
+def refresh_access_token(
+    db: Annotated[Session, Depends(get_db)],
+    datos: RefreshTokenRequest,
+) -> Token:
+    """
+    Exchange a refresh token for a new access token and a new refresh token
+
+    Each refresh token works once; reusing one revokes the whole session.
+    """
+    rotado = crud_refresh_token.rotate_refresh_token(db, token=datos.refresh_token)
+    if rotado is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+        )
+    usuario_id, refresh_token = rotado
+    user = crud_usuario.get_usuario(db, usuario_id)
+    if user is None or not user.is_active:
+        crud_refresh_token.revoke_usuario_refresh_tokens(db, usuario_id=usuario_id)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+        )
+    return _token_response(user, refresh_token)
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+def logout(
+    db: Annotated[Session, Depends(get_db)],
+    current_user: Annotated[TokenClaims, Depends(get_current_claims)],
+    datos: RefreshTokenRequest | None = None,
+) -> None:
+    """
+    Revoke the current access token and, if given, its refresh token session
+    """
+    if datos is not None:
+        crud_refresh_token.revoke_refresh_token(db, token=datos.refresh_token)
+    if current_user.jti and current_user.exp:
+        try:
+            revocation.revoke_token(current_user.jti, current_user.exp)
+        except CacheBackendError:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="No se pudo revocar el token, reintente",
+            ) from None
 
 
 @router.post("/test-token")
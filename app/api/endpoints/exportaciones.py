@@ -0,0 +1,78 @@
+"""
+Endpoints de exportación masiva (NDJSON / CSV) por rango de fechas
+"""
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.api.streaming import ExportFormat, export_response
+from app.core.config import settings
+from app.crud.export import stream_export_rows
+from app.db.base_class import Base
+from app.models.hospedaje import Hospedaje
+from app.models.pedido import Pedido
+from app.models.producto import Producto
+
+router = APIRouter()
+
+RANGO_INVALIDO = "La fecha 'desde' no puede ser posterior a 'hasta'"
+
+
+def _exportar(
+    db: Session,
+    model: type[Base],
+    date_column: str,
+    desde: date,
+    hasta: date,
+    formato: ExportFormat,
+) -> StreamingResponse:
+    if desde > hasta:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=RANGO_INVALIDO
+        )
+    return export_response(
+        db,
+        stream_export_rows(
+            db, model, date_column, desde, hasta, yield_per=settings.STREAM_YIELD_PER
+        ),
+        model.__table__.columns.keys(),
+        formato,
+        filename=f"{model.__tablename__}_{desde}_{hasta}",
+    )
+
+
+@router.get("/hospedajes")
+def exportar_hospedajes(
+    desde: date,
+    hasta: date,
+    formato: ExportFormat = "ndjson",
+    db: Session = Depends(deps.get_read_db),
+) -> StreamingResponse:
+    """Hospedajes con check-in entre `desde` y `hasta` (inclusive)"""
+    return _exportar(db, Hospedaje, "fecha_check_in", desde, hasta, formato)
+
+
+@router.get("/pedidos")
+def exportar_pedidos(
+    desde: date,
+    hasta: date,
+    formato: ExportFormat = "ndjson",
+    db: Session = Depends(deps.get_read_db),
+) -> StreamingResponse:
+    """Pedidos creados entre `desde` y `hasta` (inclusive)"""
+    return _exportar(db, Pedido, "fecha_creacion", desde, hasta, formato)
+
+
+@router.get("/productos")
+def exportar_productos(
+    desde: date,
+    hasta: date,
+    formato: ExportFormat = "ndjson",
+    db: Session = Depends(deps.get_read_db),
+) -> StreamingResponse:
+    """Productos dados de alta entre `desde` y `hasta` (inclusive)"""
+    return _exportar(db, Producto, "fecha_creacion", desde, hasta, formato)
@@ -2,40 +2,111 @@
 Endpoints para gestión de habitaciones
 """
 
+from datetime import date
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.etag import (
+    apply_etag,
+    check_if_match,
+    collection_etag,
+    entity_etag,
+)
+from app.api.fast_json import fast_json_enabled, rows_response, schema_columns
+from app.api.fieldsets import parse_fields
+from app.api.pagination import decode_cursor, set_next_cursor
 from app.crud.crud_habitacion import (
     create_habitacion,
     delete_habitacion,
     get_habitacion_by_numero,
     get_habitaciones,
+    get_habitaciones_libres,
+    get_habitaciones_rows,
     update_habitacion,
 )
 from app.models import Habitacion
 from app.schemas import habitacion as habitacion_schema
 
 HABITACION_NOT_FOUND = "Habitación no encontrada"
+RANGO_INVALIDO = "La fecha 'hasta' debe ser posterior a 'desde'"
 
 router = APIRouter()
 
 
-@router.get("/", response_model=list[habitacion_schema.HabitacionRead])
+@router.get(
+    "/",
+    response_model=list[habitacion_schema.HabitacionRead],
+    dependencies=[Depends(collection_etag(Habitacion))],
+)
 def read_habitaciones(
-    db: Session = Depends(deps.get_db),
+    response: Response,
+    db: Session = Depends(deps.get_read_db),
     skip: int = 0,
     limit: int = 100,
-) -> list[Habitacion]:
+    cursor: str | None = None,
+    fields: str | None = None,
+) -> list[Habitacion] | Response:
     """
     Obtener todas las habitaciones
+
+    Paginación por offset (`skip`) o por cursor: `cursor` es el valor de la
+    cabecera X-Next-Cursor de la página anterior
+
+    Con `fields` (p. ej. `numero,tipo,estado`) solo se leen y devuelven esos campos
+    y el `id`
     """
-    habitaciones = get_habitaciones(db, skip=skip, limit=limit)
+    campos = parse_fields(fields, habitacion_schema.HabitacionRead)
+    if campos or fast_json_enabled():
+        filas = get_habitaciones_rows(
+            db,
+            schema_columns(Habitacion, habitacion_schema.HabitacionRead, campos),
+            skip=skip,
+            limit=limit,
+            after_id=decode_cursor(cursor),
+        )
+        respuesta = rows_response(filas, headers=response.headers)
+        set_next_cursor(respuesta, filas, limit)
+        return respuesta
+    habitaciones = get_habitaciones(
+        db, skip=skip, limit=limit, after_id=decode_cursor(cursor)
+    )
+    set_next_cursor(response, habitaciones, limit)
     return habitaciones
 
 
+@router.get("/disponibilidad", response_model=list[habitacion_schema.HabitacionRead])
+def read_habitaciones_libres(
+    desde: date,
+    hasta: date,
+    db: Session = Depends(deps.get_read_db),
+    tipo: str | None = None,
+    capacidad: int | None = Query(default=None, ge=1),
+) -> list[Habitacion]:
+    """
+    Habitaciones libres para las noches de `desde` a `hasta` (día de salida)
+
+    Filtros opcionales: `tipo` de habitación y `capacidad` mínima de personas
+    """
+    if hasta <= desde:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=RANGO_INVALIDO
+        )
+    return get_habitaciones_libres(
+        db, desde=desde, hasta=hasta, tipo=tipo, capacidad=capacidad
+    )
+
+
 @router.post("/", response_model=habitacion_schema.HabitacionRead)
 def create_habitacion_endpoint(
     *,
@@ -60,6 +131,8 @@ def create_habitacion_endpoint(
 @router.put("/{numero}", response_model=habitacion_schema.HabitacionRead)
 def update_habitacion_endpoint(
     *,
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     numero: str,
     habitacion_in: habitacion_schema.HabitacionUpdate,
@@ -73,15 +146,19 @@ def update_habitacion_endpoint(
             status_code=status.HTTP_404_NOT_FOUND, detail=HABITACION_NOT_FOUND
         )
 
+    check_if_match(request, db, habitacion)
     habitacion = update_habitacion(
         db=db, db_habitacion=habitacion, habitacion_in=habitacion_in
     )
+    response.headers["ETag"] = entity_etag(habitacion)
     return habitacion
 
 
 @router.get("/{numero}", response_model=habitacion_schema.HabitacionRead)
 def read_habitacion(
     *,
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     numero: str,
 ) -> Any:
@@ -93,6 +170,7 @@ def read_habitacion(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=HABITACION_NOT_FOUND
         )
+    apply_etag(request, response, entity_etag(habitacion))
     return habitacion
 
 
@@ -118,6 +196,8 @@ def delete_habitacion_endpoint(
 @router.put("/{numero}/estado", response_model=habitacion_schema.HabitacionRead)
 def update_habitacion_estado(
     *,
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     numero: str,
     estado_data: habitacion_schema.HabitacionEstadoUpdate,
@@ -131,8 +211,10 @@ def update_habitacion_estado(
             status_code=status.HTTP_404_NOT_FOUND, detail=HABITACION_NOT_FOUND
         )
 
+    check_if_match(request, db, habitacion)
     habitacion_update = habitacion_schema.HabitacionUpdate(estado=estado_data.estado)
     habitacion = update_habitacion(
         db=db, db_habitacion=habitacion, habitacion_in=habitacion_update
     )
+    response.headers["ETag"] = entity_etag(habitacion)
     return habitacion
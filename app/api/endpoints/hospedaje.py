@@ -2,23 +2,49 @@
 API endpoints para la entidad Hospedaje
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.etag import (
+    apply_etag,
+    check_if_match,
+    collection_etag,
+    entity_etag,
+)
+from app.api.fast_json import fast_json_enabled, rows_response, schema_columns
+from app.api.fieldsets import parse_fields
+from app.api.pagination import decode_cursor, set_next_cursor
+from app.api.streaming import stream_response
+from app.core.config import settings
 from app.crud import (
     create_hospedaje,
+    create_hospedajes_lote,
     delete_hospedaje,
     get_hospedaje,
     get_hospedajes,
     get_hospedajes_by_estado,
     get_hospedajes_by_habitacion,
+    get_hospedajes_rows,
+    stream_hospedajes_by_estado,
+    stream_hospedajes_by_habitacion,
     update_hospedaje,
 )
+from app.crud.crud_hospedaje import HabitacionOcupadaError
 from app.models.hospedaje import Hospedaje
 from app.schemas.hospedaje import (
     Hospedaje as HospedajeSchema,
     HospedajeCreate,
+    HospedajeLoteRespuesta,
     HospedajeUpdate,
 )
 
@@ -26,18 +52,47 @@ router = APIRouter()
 
 # Constante para evitar duplicación de strings
 HOSPEDAJE_NOT_FOUND = "Hospedaje no encontrado"
+MAX_LOTE = 500
 
 
-@router.get("/", response_model=list[HospedajeSchema])
+@router.get(
+    "/",
+    response_model=list[HospedajeSchema],
+    dependencies=[Depends(collection_etag(Hospedaje))],
+)
 def read_hospedajes(
-    db: Session = Depends(deps.get_db),
+    response: Response,
+    db: Session = Depends(deps.get_read_db),
     skip: int = 0,
     limit: int = 100,
-) -> list[Hospedaje]:
+    cursor: str | None = None,
+    fields: str | None = None,
+) -> list[Hospedaje] | Response:
     """
     Obtener lista de hospedajes con paginación
+
+    Paginación por offset (`skip`) o por cursor: `cursor` es el valor de la
+    cabecera X-Next-Cursor de la página anterior
+
+    Con `fields` (p. ej. `nombre_huesped,estado`) solo se leen y devuelven esos campos
+    y el `id`
     """
-    hospedajes = get_hospedajes(db, skip=skip, limit=limit)
+    campos = parse_fields(fields, HospedajeSchema)
+    if campos or fast_json_enabled():
+        filas = get_hospedajes_rows(
+            db,
+            schema_columns(Hospedaje, HospedajeSchema, campos),
+            skip=skip,
+            limit=limit,
+            after_id=decode_cursor(cursor),
+        )
+        respuesta = rows_response(filas, headers=response.headers)
+        set_next_cursor(respuesta, filas, limit)
+        return respuesta
+    hospedajes = get_hospedajes(
+        db, skip=skip, limit=limit, after_id=decode_cursor(cursor)
+    )
+    set_next_cursor(response, hospedajes, limit)
     return hospedajes
 
 
@@ -49,14 +104,42 @@ def create_hospedaje_endpoint(
 ) -> Hospedaje:
     """
     Crear nuevo hospedaje
+
+    409 si la habitación ya está ocupada en alguna de esas noches
     """
-    hospedaje = create_hospedaje(db=db, hospedaje_in=hospedaje_in)
+    try:
+        hospedaje = create_hospedaje(db=db, hospedaje_in=hospedaje_in)
+    except HabitacionOcupadaError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from None
     return hospedaje
 
 
+@router.post("/lote", response_model=HospedajeLoteRespuesta)
+def create_hospedajes_lote_endpoint(
+    *,
+    db: Session = Depends(deps.get_db),
+    hospedajes_in: list[HospedajeCreate] = Body(..., min_length=1, max_length=MAX_LOTE),
+) -> HospedajeLoteRespuesta:
+    """
+    Crear los hospedajes de un grupo (lista de huéspedes) en una sola llamada
+
+    Devuelve un resultado por fila, en el mismo orden: `creado` con su `id`,
+    `conflicto` si la habitación ya está ocupada (también por otra fila
+    anterior del lote) o `invalido`. Las filas creadas se guardan aunque
+    otras fallen.
+    """
+    resultados = create_hospedajes_lote(db, hospedajes_in=hospedajes_in)
+    return HospedajeLoteRespuesta(
+        creados=sum(r.estado == "creado" for r in resultados),
+        resultados=resultados,
+    )
+
+
 @router.get("/{hospedaje_id}", response_model=HospedajeSchema)
 def read_hospedaje(
     *,
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     hospedaje_id: int,
 ) -> Hospedaje:
@@ -66,12 +149,15 @@ def read_hospedaje(
     hospedaje = get_hospedaje(db=db, hospedaje_id=hospedaje_id)
     if not hospedaje:
         raise HTTPException(status_code=404, detail=HOSPEDAJE_NOT_FOUND)
+    apply_etag(request, response, entity_etag(hospedaje))
     return hospedaje
 
 
 @router.put("/{hospedaje_id}", response_model=HospedajeSchema)
 def update_hospedaje_endpoint(
     *,
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     hospedaje_id: int,
     hospedaje_in: HospedajeUpdate,
@@ -83,9 +169,14 @@ def update_hospedaje_endpoint(
     if not hospedaje:
         raise HTTPException(status_code=404, detail=HOSPEDAJE_NOT_FOUND)
 
-    hospedaje = update_hospedaje(
-        db=db, db_hospedaje=hospedaje, hospedaje_in=hospedaje_in
-    )
+    check_if_match(request, db, hospedaje)
+    try:
+        hospedaje = update_hospedaje(
+            db=db, db_hospedaje=hospedaje, hospedaje_in=hospedaje_in
+        )
+    except HabitacionOcupadaError as exc:
+        raise HTTPException(status_code=409, detail=str(exc)) from None
+    response.headers["ETag"] = entity_etag(hospedaje)
     return hospedaje
 
 
@@ -109,12 +200,26 @@ def delete_hospedaje_endpoint(
 @router.get("/habitacion/{numero_habitacion}", response_model=list[HospedajeSchema])
 def read_hospedajes_by_habitacion(
     *,
+    request: Request,
     db: Session = Depends(deps.get_db),
     numero_habitacion: str,
-) -> list[Hospedaje]:
+    stream: bool = False,
+) -> list[Hospedaje] | StreamingResponse:
     """
     Obtener hospedajes por número de habitación
+
+    Con `stream=true` la respuesta se envía por bloques (NDJSON si se pide
+    `Accept: application/x-ndjson`)
     """
+    if stream:
+        return stream_response(
+            request,
+            db,
+            stream_hospedajes_by_habitacion(
+                db, numero_habitacion, yield_per=settings.STREAM_YIELD_PER
+            ),
+            HospedajeSchema,
+        )
     hospedajes = get_hospedajes_by_habitacion(
         db=db, numero_habitacion=numero_habitacion
     )
@@ -124,11 +229,25 @@ def read_hospedajes_by_habitacion(
 @router.get("/estado/{estado}", response_model=list[HospedajeSchema])
 def read_hospedajes_by_estado(
     *,
-    db: Session = Depends(deps.get_db),
+    request: Request,
+    db: Session = Depends(deps.get_read_db),
     estado: str,
-) -> list[Hospedaje]:
+    stream: bool = False,
+) -> list[Hospedaje] | StreamingResponse:
     """
     Obtener hospedajes por estado específico
+
+    Con `stream=true` la respuesta se envía por bloques (NDJSON si se pide
+    `Accept: application/x-ndjson`)
     """
+    if stream:
+        return stream_response(
+            request,
+            db,
+            stream_hospedajes_by_estado(
+                db, estado, yield_per=settings.STREAM_YIELD_PER
+            ),
+            HospedajeSchema,
+        )
     hospedajes = get_hospedajes_by_estado(db=db, estado=estado)
     return hospedajes
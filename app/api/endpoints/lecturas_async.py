@@ -0,0 +1,319 @@
+"""
+Endpoints de lectura asíncronos (AsyncSession) para los catálogos más consultados
+
+Se registran antes que los routers síncronos cuando DATABASE_ASYNC está
+habilitado, de modo que las lecturas calientes se atienden en el event loop
+sin pasar por el threadpool. Las escrituras siguen en los routers síncronos.
+"""
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api import deps
+from app.api.endpoints.habitaciones import HABITACION_NOT_FOUND, RANGO_INVALIDO
+from app.api.endpoints.hospedaje import HOSPEDAJE_NOT_FOUND
+from app.api.endpoints.productos import PRODUCTO_NOT_FOUND
+from app.api.endpoints.tarifas import TARIFA_NOT_FOUND
+from app.api.etag import apply_etag, async_collection_etag, entity_etag
+from app.api.fast_json import fast_json_enabled, rows_response, schema_columns
+from app.api.fieldsets import STREAM_WITH_FIELDS, parse_fields
+from app.api.pagination import decode_cursor, set_next_cursor
+from app.api.streaming import STREAM_REQUIRES_ACTIVOS, async_stream_response
+from app.core.config import settings
+from app.crud.aio import crud_habitacion, crud_hospedaje, crud_producto, crud_tarifa
+from app.models import Habitacion, Hospedaje, Producto, Tarifa
+from app.schemas import (
+    habitacion as habitacion_schema,
+    producto as producto_schema,
+    tarifa as tarifa_schema,
+)
+from app.schemas.hospedaje import Hospedaje as HospedajeSchema
+
+# Los contratos son idénticos a los síncronos, que ya documentan /docs
+habitaciones_router = APIRouter(include_in_schema=False)
+hospedajes_router = APIRouter(include_in_schema=False)
+productos_router = APIRouter(include_in_schema=False)
+tarifas_router = APIRouter(include_in_schema=False)
+
+
+@habitaciones_router.get(
+    "/",
+    response_model=list[habitacion_schema.HabitacionRead],
+    dependencies=[Depends(async_collection_etag(Habitacion))],
+)
+async def read_habitaciones_async(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    fields: str | None = None,
+) -> list[Habitacion] | Response:
+    """
+    Obtener todas las habitaciones
+    """
+    campos = parse_fields(fields, habitacion_schema.HabitacionRead)
+    if campos or fast_json_enabled():
+        filas = await crud_habitacion.get_habitaciones_rows(
+            db,
+            schema_columns(Habitacion, habitacion_schema.HabitacionRead, campos),
+            skip=skip,
+            limit=limit,
+            after_id=decode_cursor(cursor),
+        )
+        respuesta = rows_response(filas, headers=response.headers)
+        set_next_cursor(respuesta, filas, limit)
+        return respuesta
+    habitaciones = await crud_habitacion.get_habitaciones(
+        db, skip=skip, limit=limit, after_id=decode_cursor(cursor)
+    )
+    set_next_cursor(response, habitaciones, limit)
+    return habitaciones
+
+
+# Las rutas estáticas van antes de /{numero}, que las capturaría
+@habitaciones_router.get(
+    "/disponibilidad", response_model=list[habitacion_schema.HabitacionRead]
+)
+async def read_habitaciones_libres_async(
+    desde: date,
+    hasta: date,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    tipo: str | None = None,
+    capacidad: int | None = Query(default=None, ge=1),
+) -> list[Habitacion]:
+    """
+    Habitaciones libres para las noches de `desde` a `hasta` (día de salida)
+    """
+    if hasta <= desde:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=RANGO_INVALIDO
+        )
+    return await crud_habitacion.get_habitaciones_libres(
+        db, desde=desde, hasta=hasta, tipo=tipo, capacidad=capacidad
+    )
+
+
+@habitaciones_router.get("/{numero}", response_model=habitacion_schema.HabitacionRead)
+async def read_habitacion_async(
+    *,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    numero: str,
+) -> Habitacion:
+    """
+    Obtener habitación por número
+    """
+    habitacion = await crud_habitacion.get_habitacion_by_numero(db, numero=numero)
+    if not habitacion:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=HABITACION_NOT_FOUND
+        )
+    apply_etag(request, response, entity_etag(habitacion))
+    return habitacion
+
+
+@hospedajes_router.get(
+    "/",
+    response_model=list[HospedajeSchema],
+    dependencies=[Depends(async_collection_etag(Hospedaje))],
+)
+async def read_hospedajes_async(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    fields: str | None = None,
+) -> list[Hospedaje] | Response:
+    """
+    Obtener lista de hospedajes con paginación
+    """
+    campos = parse_fields(fields, HospedajeSchema)
+    if campos or fast_json_enabled():
+        filas = await crud_hospedaje.get_hospedajes_rows(
+            db,
+            schema_columns(Hospedaje, HospedajeSchema, campos),
+            skip=skip,
+            limit=limit,
+            after_id=decode_cursor(cursor),
+        )
+        respuesta = rows_response(filas, headers=response.headers)
+        set_next_cursor(respuesta, filas, limit)
+        return respuesta
+    hospedajes = await crud_hospedaje.get_hospedajes(
+        db, skip=skip, limit=limit, after_id=decode_cursor(cursor)
+    )
+    set_next_cursor(response, hospedajes, limit)
+    return hospedajes
+
+
+@hospedajes_router.get("/{hospedaje_id}", response_model=HospedajeSchema)
+async def read_hospedaje_async(
+    *,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    hospedaje_id: int,
+) -> Hospedaje:
+    """
+    Obtener un hospedaje específico por su ID
+    """
+    hospedaje = await crud_hospedaje.get_hospedaje(db, hospedaje_id=hospedaje_id)
+    if not hospedaje:
+        raise HTTPException(status_code=404, detail=HOSPEDAJE_NOT_FOUND)
+    apply_etag(request, response, entity_etag(hospedaje))
+    return hospedaje
+
+
+@productos_router.get(
+    "/",
+    response_model=list[producto_schema.ProductoRead],
+    dependencies=[Depends(async_collection_etag(Producto))],
+)
+async def read_productos_async(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    fields: str | None = None,
+    activos_solo: bool = False,
+    stream: bool = False,
+) -> list[Producto] | Response:
+    """
+    Obtener productos
+    """
+    campos = parse_fields(fields, producto_schema.ProductoRead)
+    if stream and not activos_solo:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=STREAM_REQUIRES_ACTIVOS,
+        )
+    if stream:
+        if campos:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=STREAM_WITH_FIELDS
+            )
+        return async_stream_response(
+            request,
+            db,
+            crud_producto.stream_productos_activos(
+                db, yield_per=settings.STREAM_YIELD_PER
+            ),
+            producto_schema.ProductoRead,
+        )
+    if activos_solo and (campos or fast_json_enabled()):
+        return rows_response(
+            await crud_producto.get_productos_activos_rows(
+                db, schema_columns(Producto, producto_schema.ProductoRead, campos)
+            ),
+            headers=response.headers,
+        )
+    if activos_solo:
+        return await crud_producto.get_productos_activos(db)
+    if campos or fast_json_enabled():
+        filas = await crud_producto.get_productos_rows(
+            db,
+            schema_columns(Producto, producto_schema.ProductoRead, campos),
+            skip=skip,
+            limit=limit,
+            after_id=decode_cursor(cursor),
+        )
+        respuesta = rows_response(filas, headers=response.headers)
+        set_next_cursor(respuesta, filas, limit)
+        return respuesta
+    productos = await crud_producto.get_productos(
+        db, skip=skip, limit=limit, after_id=decode_cursor(cursor)
+    )
+    set_next_cursor(response, productos, limit)
+    return productos
+
+
+@productos_router.get("/{producto_id}", response_model=producto_schema.ProductoRead)
+async def read_producto_async(
+    *,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    producto_id: int,
+) -> Producto:
+    """
+    Obtener producto por ID
+    """
+    producto = await crud_producto.get_producto(db, producto_id=producto_id)
+    if not producto:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=PRODUCTO_NOT_FOUND
+        )
+    apply_etag(request, response, entity_etag(producto))
+    return producto
+
+
+@tarifas_router.get(
+    "/",
+    response_model=list[tarifa_schema.TarifaRead],
+    dependencies=[Depends(async_collection_etag(Tarifa))],
+)
+async def read_tarifas_async(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    skip: int = 0,
+    limit: int = 100,
+    cursor: str | None = None,
+    fields: str | None = None,
+    activas_solo: bool = False,
+) -> list[Tarifa] | Response:
+    """
+    Obtener tarifas
+    """
+    campos = parse_fields(fields, tarifa_schema.TarifaRead)
+    if activas_solo and (campos or fast_json_enabled()):
+        return rows_response(
+            await crud_tarifa.get_tarifas_activas_rows(
+                db, schema_columns(Tarifa, tarifa_schema.TarifaRead, campos)
+            ),
+            headers=response.headers,
+        )
+    if activas_solo:
+        return await crud_tarifa.get_tarifas_activas(db)
+    if campos or fast_json_enabled():
+        filas = await crud_tarifa.get_tarifas_rows(
+            db,
+            schema_columns(Tarifa, tarifa_schema.TarifaRead, campos),
+            skip=skip,
+            limit=limit,
+            after_id=decode_cursor(cursor),
+        )
+        respuesta = rows_response(filas, headers=response.headers)
+        set_next_cursor(respuesta, filas, limit)
+        return respuesta
+    tarifas = await crud_tarifa.get_tarifas(
+        db, skip=skip, limit=limit, after_id=decode_cursor(cursor)
+    )
+    set_next_cursor(response, tarifas, limit)
+    return tarifas
+
+
+@tarifas_router.get("/{tarifa_id}", response_model=tarifa_schema.TarifaRead)
+async def read_tarifa_async(
+    *,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_db),
+    tarifa_id: int,
+) -> Tarifa:
+    """
+    Obtener tarifa por ID
+    """
+    tarifa = await crud_tarifa.get_tarifa(db, tarifa_id=tarifa_id)
+    if not tarifa:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=TARIFA_NOT_FOUND
+        )
+    apply_etag(request, response, entity_etag(tarifa))
+    return tarifa
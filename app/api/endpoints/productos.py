@@ -4,17 +4,32 @@ Endpoints para gestión de productos
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.etag import (
+    apply_etag,
+    check_if_match,
+    collection_etag,
+    entity_etag,
+)
+from app.api.fast_json import fast_json_enabled, rows_response, schema_columns
+from app.api.fieldsets import STREAM_WITH_FIELDS, parse_fields
+from app.api.pagination import decode_cursor, set_next_cursor
+from app.api.streaming import STREAM_REQUIRES_ACTIVOS, stream_response
+from app.core.config import settings
 from app.crud.crud_producto import (
     create_producto,
     delete_producto,
     get_producto,
     get_productos,
     get_productos_activos,
+    get_productos_activos_rows,
     get_productos_por_categoria,
+    get_productos_rows,
+    stream_productos_activos,
+    stream_productos_por_categoria,
     update_producto,
 )
 from app.models import Producto
@@ -25,20 +40,75 @@ PRODUCTO_NOT_FOUND = "Producto no encontrado"
 router = APIRouter()
 
 
-@router.get("/", response_model=list[producto_schema.ProductoRead])
+@router.get(
+    "/",
+    response_model=list[producto_schema.ProductoRead],
+    dependencies=[Depends(collection_etag(Producto))],
+)
 def read_productos(
-    db: Session = Depends(deps.get_db),
+    request: Request,
+    response: Response,
+    db: Session = Depends(deps.get_read_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
+    fields: str | None = None,
     activos_solo: bool = False,
-) -> list[Producto]:
+    stream: bool = False,
+) -> list[Producto] | Response:
     """
     Obtener productos
+
+    Paginación por offset (`skip`) o por cursor: `cursor` es el valor de la
+    cabecera X-Next-Cursor de la página anterior. Con `activos_solo=true` y
+    `stream=true` la respuesta se envía por bloques (NDJSON si se pide
+    `Accept: application/x-ndjson`); `stream=true` sin `activos_solo` es un 422
+
+    Con `fields` (p. ej. `nombre,precio`) solo se leen y devuelven esos campos
+    y el `id`
     """
+    campos = parse_fields(fields, producto_schema.ProductoRead)
+    if stream and not activos_solo:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=STREAM_REQUIRES_ACTIVOS,
+        )
+    if stream:
+        if campos:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST, detail=STREAM_WITH_FIELDS
+            )
+        return stream_response(
+            request,
+            db,
+            stream_productos_activos(db, yield_per=settings.STREAM_YIELD_PER),
+            producto_schema.ProductoRead,
+        )
+    if activos_solo and (campos or fast_json_enabled()):
+        return rows_response(
+            get_productos_activos_rows(
+                db, schema_columns(Producto, producto_schema.ProductoRead, campos)
+            ),
+            headers=response.headers,
+        )
     if activos_solo:
         productos = get_productos_activos(db)
+    elif campos or fast_json_enabled():
+        filas = get_productos_rows(
+            db,
+            schema_columns(Producto, producto_schema.ProductoRead, campos),
+            skip=skip,
+            limit=limit,
+            after_id=decode_cursor(cursor),
+        )
+        respuesta = rows_response(filas, headers=response.headers)
+        set_next_cursor(respuesta, filas, limit)
+        return respuesta
     else:
-        productos = get_productos(db, skip=skip, limit=limit)
+        productos = get_productos(
+            db, skip=skip, limit=limit, after_id=decode_cursor(cursor)
+        )
+        set_next_cursor(response, productos, limit)
     return productos
 
 
@@ -58,6 +128,8 @@ def create_producto_endpoint(
 @router.put("/{producto_id}", response_model=producto_schema.ProductoRead)
 def update_producto_endpoint(
     *,
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     producto_id: int,
     producto_in: producto_schema.ProductoUpdate,
@@ -71,13 +143,17 @@ def update_producto_endpoint(
             status_code=status.HTTP_404_NOT_FOUND, detail=PRODUCTO_NOT_FOUND
         )
 
+    check_if_match(request, db, producto)
     producto = update_producto(db=db, db_producto=producto, producto_in=producto_in)
+    response.headers["ETag"] = entity_etag(producto)
     return producto
 
 
 @router.get("/{producto_id}", response_model=producto_schema.ProductoRead)
 def read_producto(
     *,
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     producto_id: int,
 ) -> Any:
@@ -89,6 +165,7 @@ def read_producto(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=PRODUCTO_NOT_FOUND
         )
+    apply_etag(request, response, entity_etag(producto))
     return producto
 
 
@@ -114,11 +191,25 @@ def delete_producto_endpoint(
 @router.get("/categoria/{categoria}", response_model=list[producto_schema.ProductoRead])
 def read_productos_por_categoria(
     *,
-    db: Session = Depends(deps.get_db),
+    request: Request,
+    db: Session = Depends(deps.get_read_db),
     categoria: str,
+    stream: bool = False,
 ) -> Any:
     """
     Obtener productos por categoría
+
+    Con `stream=true` la respuesta se envía por bloques (NDJSON si se pide
+    `Accept: application/x-ndjson`)
     """
+    if stream:
+        return stream_response(
+            request,
+            db,
+            stream_productos_por_categoria(
+                db, categoria, yield_per=settings.STREAM_YIELD_PER
+            ),
+            producto_schema.ProductoRead,
+        )
     productos = get_productos_por_categoria(db, categoria=categoria)
     return productos
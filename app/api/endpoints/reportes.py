@@ -5,22 +5,79 @@ Endpoints para reportes y estadísticas - Dashboard Ejecutivo
 # pylint: disable=not-callable
 # Lo anterior deshabilita el falso positivo de Pylint para func.count y func.avg
 
-from datetime import datetime
+from datetime import date, datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
+from app.api.deps import get_read_db
+from app.core.config import settings
+from app.crud.ocupacion import FormatoOcupacion, get_ocupacion
 from app.models.habitacion import Habitacion
 from app.models.pedido import LineaPedido
 from app.models.producto import Producto
+from app.schemas.ocupacion import CalendarioOcupacion
 
 router = APIRouter()
 
+MAX_DIAS_OCUPACION = 731
+RANGO_OCUPACION_INVALIDO = (
+    f"La fecha 'hasta' debe ser posterior a 'desde' y el rango de como mucho "
+    f"{MAX_DIAS_OCUPACION} días"
+)
+
+
+@router.get("/ocupacion", response_model=CalendarioOcupacion)
+def get_calendario_ocupacion(
+    desde: date,
+    hasta: date,
+    tipo: str | None = None,
+    formato: FormatoOcupacion = "rle",
+    db: Session = Depends(get_read_db),
+) -> Response:
+    """
+    Calendario de ocupación: para cada habitación, las noches de `desde` a
+    `hasta` (exclusivo) ocupadas por un hospedaje pendiente, confirmado o en
+    curso
+
+    `formato=rle` devuelve tramos `[día, noches]` contados desde `desde`;
+    `formato=bits`, un bit por día en base64 (el primer día es el bit más
+    significativo)
+    """
+    if not 0 < (hasta - desde).days <= MAX_DIAS_OCUPACION:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=RANGO_OCUPACION_INVALIDO
+        )
+    habitaciones = get_ocupacion(
+        db,
+        desde,
+        hasta,
+        tipo=tipo,
+        formato=formato,
+        yield_per=settings.STREAM_YIELD_PER,
+    )
+    # Miles de tramos: se serializan con orjson sin pasar por el schema
+    return Response(
+        content=orjson.dumps(
+            {
+                "desde": desde,
+                "hasta": hasta,
+                "dias": (hasta - desde).days,
+                "formato": formato,
+                "habitaciones": [
+                    {"numero": numero, "ocupacion": ocupacion}
+                    for numero, ocupacion in habitaciones
+                ],
+            }
+        ),
+        media_type="application/json",
+    )
+
 
 @router.get("/dashboard-ejecutivo/")
-def get_dashboard_ejecutivo(db: Session = Depends(get_db)):
+def get_dashboard_ejecutivo(db: Session = Depends(get_read_db)):
     """
     Endpoint principal del dashboard ejecutivo.
     Proporciona KPIs y datos clave para la administración.
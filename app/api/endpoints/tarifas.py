@@ -4,17 +4,28 @@ Endpoints para gestión de tarifas
 
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.api import deps
+from app.api.etag import (
+    apply_etag,
+    check_if_match,
+    collection_etag,
+    entity_etag,
+)
+from app.api.fast_json import fast_json_enabled, rows_response, schema_columns
+from app.api.fieldsets import parse_fields
+from app.api.pagination import decode_cursor, set_next_cursor
 from app.crud.crud_tarifa import (
     create_tarifa,
     delete_tarifa,
     get_tarifa,
     get_tarifas,
     get_tarifas_activas,
+    get_tarifas_activas_rows,
     get_tarifas_por_tipo_habitacion,
+    get_tarifas_rows,
     update_tarifa,
 )
 from app.models import Tarifa
@@ -25,20 +36,55 @@ TARIFA_NOT_FOUND = "Tarifa no encontrada"
 router = APIRouter()
 
 
-@router.get("/", response_model=list[tarifa_schema.TarifaRead])
+@router.get(
+    "/",
+    response_model=list[tarifa_schema.TarifaRead],
+    dependencies=[Depends(collection_etag(Tarifa))],
+)
 def read_tarifas(
-    db: Session = Depends(deps.get_db),
+    response: Response,
+    db: Session = Depends(deps.get_read_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
+    fields: str | None = None,
     activas_solo: bool = False,
-) -> list[Tarifa]:
+) -> list[Tarifa] | Response:
     """
     Obtener tarifas
+
+    Paginación por offset (`skip`) o por cursor: `cursor` es el valor de la
+    cabecera X-Next-Cursor de la página anterior
+
+    Con `fields` (p. ej. `nombre,precio`) solo se leen y devuelven esos campos
+    y el `id`
     """
+    campos = parse_fields(fields, tarifa_schema.TarifaRead)
+    if activas_solo and (campos or fast_json_enabled()):
+        return rows_response(
+            get_tarifas_activas_rows(
+                db, schema_columns(Tarifa, tarifa_schema.TarifaRead, campos)
+            ),
+            headers=response.headers,
+        )
     if activas_solo:
         tarifas = get_tarifas_activas(db)
+    elif campos or fast_json_enabled():
+        filas = get_tarifas_rows(
+            db,
+            schema_columns(Tarifa, tarifa_schema.TarifaRead, campos),
+            skip=skip,
+            limit=limit,
+            after_id=decode_cursor(cursor),
+        )
+        respuesta = rows_response(filas, headers=response.headers)
+        set_next_cursor(respuesta, filas, limit)
+        return respuesta
     else:
-        tarifas = get_tarifas(db, skip=skip, limit=limit)
+        tarifas = get_tarifas(
+            db, skip=skip, limit=limit, after_id=decode_cursor(cursor)
+        )
+        set_next_cursor(response, tarifas, limit)
     return tarifas
 
 
@@ -58,6 +104,8 @@ def create_tarifa_endpoint(
 @router.put("/{tarifa_id}", response_model=tarifa_schema.TarifaRead)
 def update_tarifa_endpoint(
     *,
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     tarifa_id: int,
     tarifa_in: tarifa_schema.TarifaUpdate,
@@ -71,13 +119,17 @@ def update_tarifa_endpoint(
             status_code=status.HTTP_404_NOT_FOUND, detail=TARIFA_NOT_FOUND
         )
 
+    check_if_match(request, db, tarifa)
     tarifa = update_tarifa(db=db, db_tarifa=tarifa, tarifa_in=tarifa_in)
+    response.headers["ETag"] = entity_etag(tarifa)
     return tarifa
 
 
 @router.get("/{tarifa_id}", response_model=tarifa_schema.TarifaRead)
 def read_tarifa(
     *,
+    request: Request,
+    response: Response,
     db: Session = Depends(deps.get_db),
     tarifa_id: int,
 ) -> Any:
@@ -89,6 +141,7 @@ def read_tarifa(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail=TARIFA_NOT_FOUND
         )
+    apply_etag(request, response, entity_etag(tarifa))
     return tarifa
 
 
@@ -114,7 +167,7 @@ def delete_tarifa_endpoint(
 @router.get("/tipo/{tipo_habitacion}", response_model=list[tarifa_schema.TarifaRead])
 def read_tarifas_por_tipo(
     *,
-    db: Session = Depends(deps.get_db),
+    db: Session = Depends(deps.get_read_db),
     tipo_habitacion: str,
 ) -> Any:
     """
@@ -4,13 +4,15 @@ API endpoints para la entidad Usuario
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy.orm import Session
 
-from ...api.endpoints.auth import get_current_user
+from ...api.endpoints.auth import get_current_claims
+from ...api.pagination import decode_cursor, set_next_cursor
 from ...crud import crud_usuario
 from ...database import get_db
 from ...models.usuario import Usuario
+from ...schemas.auth import TokenClaims
 from ...schemas.usuario import (
     Usuario as UsuarioSchema,
     UsuarioCreate,
@@ -27,14 +29,22 @@ EMAIL_ALREADY_EXISTS = "Ya existe un usuario con este email"
 @router.get("/", response_model=list[UsuarioSchema])
 def get_usuarios_endpoint(
     db: Annotated[Session, Depends(get_db)],
-    _current_user: Annotated[Usuario, Depends(get_current_user)],
+    _current_user: Annotated[TokenClaims, Depends(get_current_claims)],
+    response: Response,
     skip: int = 0,
     limit: int = 100,
+    cursor: str | None = None,
 ) -> list[Usuario]:
     """
     Obtener lista de usuarios con paginación
+
+    Paginación por offset (`skip`) o por cursor: `cursor` es el valor de la
+    cabecera X-Next-Cursor de la página anterior
     """
-    usuarios = crud_usuario.get_usuarios(db, skip=skip, limit=limit)
+    usuarios = crud_usuario.get_usuarios(
+        db, skip=skip, limit=limit, after_id=decode_cursor(cursor)
+    )
+    set_next_cursor(response, usuarios, limit)
     return usuarios
 
 
@@ -42,7 +52,7 @@ def get_usuarios_endpoint(
 def create_usuario_endpoint(
     *,
     db: Annotated[Session, Depends(get_db)],
-    _current_user: Annotated[Usuario, Depends(get_current_user)],
+    _current_user: Annotated[TokenClaims, Depends(get_current_claims)],
     usuario_in: UsuarioCreate,
 ) -> Usuario:
     """
@@ -64,7 +74,7 @@ def create_usuario_endpoint(
 def get_usuario_endpoint(
     *,
     db: Annotated[Session, Depends(get_db)],
-    _current_user: Annotated[Usuario, Depends(get_current_user)],
+    _current_user: Annotated[TokenClaims, Depends(get_current_claims)],
     usuario_id: int,
 ) -> Usuario:
     """
@@ -80,7 +90,7 @@ def get_usuario_endpoint(
 def update_usuario_endpoint(
     *,
     db: Annotated[Session, Depends(get_db)],
-    _current_user: Annotated[Usuario, Depends(get_current_user)],
+    _current_user: Annotated[TokenClaims, Depends(get_current_claims)],
     usuario_id: int,
     usuario_in: UsuarioUpdate,
 ) -> Usuario:
@@ -110,7 +120,7 @@ def update_usuario_endpoint(
 def delete_usuario_endpoint(
     *,
     db: Annotated[Session, Depends(get_db)],
-    _current_user: Annotated[Usuario, Depends(get_current_user)],
+    _current_user: Annotated[TokenClaims, Depends(get_current_claims)],
     usuario_id: int,
 ) -> dict[str, str]:
     """
@@ -128,7 +138,7 @@ def delete_usuario_endpoint(
 def get_usuario_by_email_endpoint(
     *,
     db: Annotated[Session, Depends(get_db)],
-    _current_user: Annotated[Usuario, Depends(get_current_user)],
+    _current_user: Annotated[TokenClaims, Depends(get_current_claims)],
     email: str,
 ) -> Usuario:
     """
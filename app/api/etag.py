@@ -0,0 +1,121 @@
+"""
+ETags y peticiones condicionales (If-None-Match / If-Match)
+
+- Entidades: ETag fuerte derivado de id + fecha_actualizacion.
+- Listados: ETag débil derivado de max(fecha_actualizacion) + count de la
+  tabla; se calcula en una dependencia antes de leer la página, de modo que un
+  304 no carga ni serializa filas.
+- PUT con If-Match: 412 si la entidad cambió desde que el cliente la leyó.
+
+El ETag de colección cuesta una consulta más en cada listado, también sin
+If-None-Match: hay que publicarlo para que el cliente pueda revalidar. Las
+respuestas comprimidas llevan el sufijo de su codificación en el ETag (ver
+`app.core.compression.encoded_etag`), que se ignora al comparar.
+"""
+
+import hashlib
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+
+from fastapi import Depends, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.api import deps
+from app.core.compression import strip_etag_encoding
+from app.crud.aio import versioning as aio_versioning
+from app.crud.versioning import get_collection_version
+from app.db.base_class import Base
+
+PRECONDITION_FAILED = "El recurso fue modificado por otra petición"
+
+
+def _tag(*partes: object) -> str:
+    texto = "|".join(str(parte) for parte in partes)
+    return hashlib.blake2s(texto.encode(), digest_size=8).hexdigest()
+
+
+def _naive(valor: datetime | None) -> str | None:
+    # Recién creada la instancia conserva el datetime con zona; leída de la
+    # base llega sin ella. Ambas deben producir el mismo ETag.
+    return valor.replace(tzinfo=None).isoformat() if valor else None
+
+
+def entity_etag(entidad: Base) -> str:
+    """ETag fuerte de una entidad"""
+    version = _naive(entidad.fecha_actualizacion)
+    return f'"{_tag(type(entidad).__name__, entidad.id, version)}"'
+
+
+def collection_etag_value(model: type[Base], version: tuple) -> str:
+    """ETag débil de una colección a partir de su versión"""
+    ultima, total = version
+    return f'W/"{_tag(model.__name__, _naive(ultima), total)}"'
+
+
+def _parse(header: str) -> set[str]:
+    return {
+        strip_etag_encoding(etag.strip()) for etag in header.split(",") if etag.strip()
+    }
+
+
+def apply_etag(request: Request, response: Response, etag: str) -> None:
+    """Publicar `etag`; responde 304 sin cuerpo si coincide con If-None-Match"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # If-None-Match usa comparación débil: se ignora el prefijo W/. El 304
+        # no pasa por la compresión, así que devuelve la etiqueta que envió el
+        # cliente (con el sufijo de su codificación, si lo traía)
+        for enviada in if_none_match.split(","):
+            enviada = enviada.strip()
+            debil = strip_etag_encoding(enviada).removeprefix("W/")
+            if debil == "*" or debil == etag.removeprefix("W/"):
+                raise HTTPException(
+                    status_code=status.HTTP_304_NOT_MODIFIED,
+                    headers={"ETag": etag if debil == "*" else enviada},
+                )
+    response.headers["ETag"] = etag
+
+
+def check_if_match(request: Request, db: Session, entidad: Base) -> None:
+    """412 si If-Match no contiene el ETag actual (comparación fuerte)"""
+    if_match = request.headers.get("if-match")
+    if if_match is None:
+        return
+    # Releer con bloqueo de fila (FOR UPDATE en PostgreSQL) para que nadie
+    # modifique la entidad entre la comprobación y el commit de la escritura
+    db.refresh(entidad, with_for_update=True)
+    etiquetas = _parse(if_match)
+    if "*" not in etiquetas and entity_etag(entidad) not in etiquetas:
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=PRECONDITION_FAILED,
+        )
+
+
+def collection_etag(model: type[Base]) -> Callable[..., None]:
+    """Dependencia de listado: ETag de la colección y 304 si no cambió"""
+
+    def dependency(
+        request: Request,
+        response: Response,
+        db: Session = Depends(deps.get_read_db),
+    ) -> None:
+        etag = collection_etag_value(model, get_collection_version(db, model))
+        apply_etag(request, response, etag)
+
+    return dependency
+
+
+def async_collection_etag(model: type[Base]) -> Callable[..., Awaitable[None]]:
+    """Variante de `collection_etag` para los listados asíncronos"""
+
+    async def dependency(
+        request: Request,
+        response: Response,
+        db: AsyncSession = Depends(deps.get_async_read_db),
+    ) -> None:
+        version = await aio_versioning.get_collection_version(db, model)
+        apply_etag(request, response, collection_etag_value(model, version))
+
+    return dependency
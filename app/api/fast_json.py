@@ -0,0 +1,73 @@
+"""
+Ruta rápida de serialización para listados (FAST_JSON_RESPONSES)
+
+En lugar de instanciar objetos ORM y validarlos fila a fila con el schema
+`...Read`, se leen como filas Core exactamente las columnas del schema y se
+serializan directamente a bytes con orjson. Los endpoints conservan su
+response_model, así que /docs no cambia, y la salida es la misma que produce
+Pydantic (Decimal como texto, float, fechas ISO 8601).
+"""
+
+from collections.abc import Mapping, Sequence
+from decimal import Decimal
+from functools import lru_cache
+from typing import Any, get_args
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Float, Row, type_coerce
+
+from app.core.config import get_settings
+from app.db.base_class import Base
+
+
+def fast_json_enabled() -> bool:
+    """Indica si los listados usan la ruta rápida"""
+    return get_settings().FAST_JSON_RESPONSES
+
+
+def _is_float(annotation: Any) -> bool:
+    return annotation is float or float in get_args(annotation)
+
+
+@lru_cache(maxsize=256)
+def schema_columns(
+    model: type[Base],
+    schema: type[BaseModel],
+    fields: tuple[str, ...] | None = None,
+) -> tuple[ColumnElement, ...]:
+    """
+    Columnas del modelo que expone `schema`, con el tipo de su salida JSON
+
+    Con `fields` (sparse fieldset) solo se incluyen esos campos y el `id`.
+    """
+    tabla = model.__table__
+    columnas = []
+    for nombre, campo in schema.model_fields.items():
+        if fields is not None and nombre != "id" and nombre not in fields:
+            continue
+        columna: ColumnElement = tabla.c[nombre]
+        # Numeric devuelve Decimal; si el schema declara float se lee como float
+        if _is_float(campo.annotation) and getattr(columna.type, "asdecimal", False):
+            columna = type_coerce(columna, Float)
+        columnas.append(columna.label(nombre))
+    return tuple(columnas)
+
+
+def json_default(valor: Any) -> Any:
+    """Serializar con orjson los tipos que no soporta (Decimal como texto)"""
+    if isinstance(valor, Decimal):
+        return str(valor)
+    raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
+
+
+def rows_response(
+    rows: Sequence[Row], headers: Mapping[str, str] | None = None
+) -> Response:
+    """Respuesta JSON con las filas serializadas por orjson"""
+    return Response(
+        content=orjson.dumps([fila._asdict() for fila in rows], default=json_default),
+        media_type="application/json",
+        headers=headers,
+    )
@@ -0,0 +1,29 @@
+"""
+Sparse fieldsets (`?fields=`) para los endpoints de listado
+
+`fields=numero,tipo,estado` limita tanto la proyección SQL (solo se leen esas
+columnas) como el cuerpo de la respuesta. El `id` se incluye siempre para que
+el cliente pueda identificar las filas y paginar por cursor.
+"""
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel
+
+STREAM_WITH_FIELDS = "`fields` no es compatible con `stream`"
+
+
+def parse_fields(fields: str | None, schema: type[BaseModel]) -> tuple[str, ...] | None:
+    """Validar `fields` contra el schema; 400 si pide campos inexistentes"""
+    if not fields:
+        return None
+    campos = tuple(dict.fromkeys(c.strip() for c in fields.split(",") if c.strip()))
+    desconocidos = [c for c in campos if c not in schema.model_fields]
+    if desconocidos or not campos:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=(
+                f"Campos no válidos: {', '.join(desconocidos) or fields!r}. "
+                f"Disponibles: {', '.join(schema.model_fields)}"
+            ),
+        )
+    return campos
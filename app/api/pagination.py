@@ -0,0 +1,49 @@
+"""
+Paginación por cursor (keyset) para los endpoints de listado
+
+El cursor es opaco para el cliente: codifica el último id entregado. Con
+`?cursor=` la página se lee con `WHERE id > :after_id ORDER BY id LIMIT :limit`
+(las sentencias SELECT_*_AFTER del CRUD), cuyo coste no crece con la
+profundidad como el de OFFSET. El cuerpo de la respuesta no cambia; el cursor
+de la página siguiente viaja en la cabecera X-Next-Cursor (ausente en la
+última página).
+"""
+
+import base64
+import binascii
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from fastapi import HTTPException, Response, status
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+INVALID_CURSOR = "Cursor de paginación inválido"
+
+
+def encode_cursor(last_id: int) -> str:
+    """Cursor opaco que apunta a la fila siguiente a `last_id`"""
+    payload = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str | None) -> int | None:
+    """Obtener el id de un cursor; 400 si fue manipulado o está corrupto"""
+    if cursor is None:
+        return None
+    try:
+        payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        last_id = json.loads(payload)["id"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        last_id = None
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=INVALID_CURSOR
+        )
+    return last_id
+
+
+def set_next_cursor(response: Response, items: Sequence[Any], limit: int) -> None:
+    """Publicar el cursor de la página siguiente si la actual vino completa"""
+    if items and len(items) >= limit:
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(items[-1].id)
@@ -0,0 +1,188 @@
+"""
+Respuestas en streaming para listados sin límite de filas
+
+Las filas se leen por bloques con `yield_per` (cursor del lado del servidor en
+PostgreSQL) y cada bloque se valida y serializa antes de pedir el siguiente,
+de modo que la memoria pico no depende del número de filas. Con
+`Accept: application/x-ndjson` se emite un objeto JSON por línea; en otro caso
+un array JSON escrito de forma incremental.
+"""
+
+import csv
+import io
+from collections.abc import AsyncIterator, Iterator, Sequence
+from datetime import date
+from typing import Any, Literal
+
+import orjson
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.api.fast_json import json_default
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+CSV_MEDIA_TYPE = "text/csv; charset=utf-8"
+# Los listados paginados solo admiten `stream` sobre el catálogo de activos
+STREAM_REQUIRES_ACTIVOS = "`stream` requiere `activos_solo=true`"
+
+ExportFormat = Literal["ndjson", "csv"]
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Indica si el cliente pidió NDJSON en la cabecera Accept"""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _json_block(bloque: Sequence[Any], adapter: TypeAdapter) -> bytes:
+    modelos = adapter.validate_python(bloque, from_attributes=True)
+    # dump_json del bloque sin los corchetes exteriores
+    return adapter.dump_json(modelos)[1:-1]
+
+
+def _ndjson_block(bloque: Sequence[Any], schema: type[BaseModel]) -> bytes:
+    return b"".join(
+        schema.model_validate(fila, from_attributes=True).model_dump_json().encode()
+        + b"\n"
+        for fila in bloque
+    )
+
+
+def _json_array(
+    partitions: Iterator[Sequence[Any]], adapter: TypeAdapter
+) -> Iterator[bytes]:
+    yield b"["
+    separador = b""
+    for bloque in partitions:
+        yield separador + _json_block(bloque, adapter)
+        separador = b","
+    yield b"]"
+
+
+def _ndjson(
+    partitions: Iterator[Sequence[Any]], schema: type[BaseModel]
+) -> Iterator[bytes]:
+    for bloque in partitions:
+        yield _ndjson_block(bloque, schema)
+
+
+def stream_response(
+    request: Request,
+    db: Session,
+    partitions: Iterator[Sequence[Any]],
+    schema: type[BaseModel],
+) -> StreamingResponse:
+    """
+    Respuesta que serializa `partitions` a medida que se consumen
+
+    `partitions` debe ser perezoso (un generador de la capa CRUD): la consulta
+    se ejecuta al empezar a enviar el cuerpo, y la sesión se cierra al terminar
+    o si el cliente corta la conexión.
+    """
+    if wants_ndjson(request):
+        cuerpo, media_type = _ndjson(partitions, schema), NDJSON_MEDIA_TYPE
+    else:
+        cuerpo = _json_array(partitions, TypeAdapter(list[schema]))
+        media_type = "application/json"
+
+    def contenido() -> Iterator[bytes]:
+        try:
+            yield from cuerpo
+        finally:
+            db.close()
+
+    return StreamingResponse(contenido(), media_type=media_type)
+
+
+def async_stream_response(
+    request: Request,
+    db: AsyncSession,
+    partitions: AsyncIterator[Sequence[Any]],
+    schema: type[BaseModel],
+) -> StreamingResponse:
+    """Variante de `stream_response` para el CRUD asíncrono"""
+    ndjson = wants_ndjson(request)
+    adapter = TypeAdapter(list[schema])
+
+    async def contenido() -> AsyncIterator[bytes]:
+        try:
+            if ndjson:
+                async for bloque in partitions:
+                    yield _ndjson_block(bloque, schema)
+                return
+            yield b"["
+            separador = b""
+            async for bloque in partitions:
+                yield separador + _json_block(bloque, adapter)
+                separador = b","
+            yield b"]"
+        finally:
+            await db.close()
+
+    return StreamingResponse(
+        contenido(), media_type=NDJSON_MEDIA_TYPE if ndjson else "application/json"
+    )
+
+
+def _ndjson_rows(partitions: Iterator[Sequence[Row]]) -> Iterator[bytes]:
+    for bloque in partitions:
+        yield b"".join(
+            orjson.dumps(fila._asdict(), default=json_default) + b"\n"
+            for fila in bloque
+        )
+
+
+def _csv_value(valor: Any) -> Any:
+    if isinstance(valor, date):
+        return valor.isoformat()
+    return valor
+
+
+def _csv_rows(
+    partitions: Iterator[Sequence[Row]], columns: Sequence[str]
+) -> Iterator[bytes]:
+    buffer = io.StringIO()
+    escritor = csv.writer(buffer)
+    escritor.writerow(columns)
+    for bloque in partitions:
+        escritor.writerows([_csv_value(v) for v in fila] for fila in bloque)
+        yield buffer.getvalue().encode()
+        buffer.seek(0)
+        buffer.truncate()
+    # Sin filas solo se envía la cabecera
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+
+def export_response(
+    db: Session,
+    partitions: Iterator[Sequence[Row]],
+    columns: Sequence[str],
+    formato: ExportFormat,
+    filename: str,
+) -> StreamingResponse:
+    """
+    Descarga en NDJSON o CSV de filas Core leídas por bloques
+
+    Cada bloque se serializa y se envía antes de leer el siguiente; la sesión
+    se cierra al terminar o si el cliente corta la descarga.
+    """
+    if formato == "csv":
+        cuerpo, media_type = _csv_rows(partitions, columns), CSV_MEDIA_TYPE
+    else:
+        cuerpo, media_type = _ndjson_rows(partitions), NDJSON_MEDIA_TYPE
+
+    def contenido() -> Iterator[bytes]:
+        try:
+            yield from cuerpo
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        contenido(),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{formato}"'},
+    )
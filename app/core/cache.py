@@ -0,0 +1,271 @@
+"""
+Cachés de la aplicación
+
+`TTLCache` es la caché en memoria del proceso, LRU acotada y con caducidad.
+`SharedCache` le añade un almacén compartido entre workers (ver
+`app.core.cache_backends`) e invalidación por sellos de versión.
+
+Las claves son tuplas cuyo primer elemento es el espacio de nombres
+("productos", "tarifas"...). `invalidate(namespace)` borra todas sus entradas
+e incrementa su generación: un valor cargado antes de la invalidación ya no
+se guarda, aunque la carga termine después.
+"""
+
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from app.core.cache_backends import CacheBackend, CacheBackendError
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Marca de ausencia (None puede ser un valor cacheado)
+MISSING = object()
+
+
+class TTLCache:
+    """Caché LRU de como máximo `maxsize` entradas que caducan a los `ttl` s"""
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._data: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._generations: dict[Hashable, int] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: tuple, default: Any = None) -> Any:
+        """Valor vigente de `key` (y lo marca como reciente) o `default`"""
+        with self._lock:
+            entrada = self._data.get(key)
+            if entrada is not None:
+                caduca, valor = entrada
+                if caduca > self._clock():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return valor
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def generation(self, namespace: Hashable) -> int:
+        """Generación actual del espacio de nombres (cambia al invalidarlo)"""
+        with self._lock:
+            return self._generations.get(namespace, 0)
+
+    def set(self, key: tuple, value: Any, generation: int | None = None) -> None:
+        """
+        Guardar `value`; si se indica `generation` y el espacio de nombres se
+        invalidó desde entonces, el valor se descarta por obsoleto
+        """
+        with self._lock:
+            if (
+                generation is not None
+                and self._generations.get(key[0], 0) != generation
+            ):
+                return
+            self._data[key] = (self._clock() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_or_load(self, key: tuple, loader: Callable[[], T]) -> T:
+        """Valor de `key` o, si falta, el de `loader()` (que queda guardado)"""
+        valor = self.get(key, MISSING)
+        if valor is not MISSING:
+            return valor
+        generacion = self.generation(key[0])
+        valor = loader()
+        self.set(key, valor, generacion)
+        return valor
+
+    def invalidate(self, namespace: Hashable) -> None:
+        """Borrar las entradas del espacio de nombres"""
+        with self._lock:
+            self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            for key in [k for k in self._data if k[0] == namespace]:
+                del self._data[key]
+
+    def clear(self) -> None:
+        """Vaciar la caché y reiniciar los contadores"""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Contadores de aciertos, fallos y ocupación"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+                "evictions": self.evictions,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl_seconds": self.ttl,
+            }
+
+
+class SharedCache:
+    """
+    Caché de dos niveles coherente entre workers
+
+    Nivel 1: `TTLCache` del proceso. Nivel 2: un `CacheBackend` compartido,
+    donde cada valor se guarda bajo la versión vigente de su espacio de
+    nombres. `invalidate` incrementa esa versión en el almacén; los demás
+    workers la consultan como mucho cada `check_interval` segundos y, si
+    cambió, vacían su nivel 1. El retraso máximo de una invalidación en otro
+    worker es, por tanto, `check_interval`.
+
+    Los valores se serializan con pickle: el almacén debe ser de confianza.
+    Con `share_values=False` el almacén solo guarda las versiones y los
+    valores no salen del proceso. Si el almacén falla, la caché se omite y se
+    lee de la base de datos.
+    """
+
+    def __init__(
+        self,
+        local: TTLCache,
+        backend: CacheBackend,
+        check_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        share_values: bool = True,
+    ) -> None:
+        self.local = local
+        self.backend = backend
+        self.check_interval = check_interval
+        self.share_values = share_values
+        self._clock = clock
+        self._lock = threading.Lock()
+        # Por espacio de nombres: (versión conocida, instante de la consulta)
+        self._versions: dict[str, tuple[int, float]] = {}
+        self.shared_hits = 0
+        self.backend_errors = 0
+
+    def _version(self, namespace: str) -> int | None:
+        """Versión vigente; vacía el nivel 1 si otro worker la cambió"""
+        ahora = self._clock()
+        with self._lock:
+            conocida = self._versions.get(namespace)
+        if conocida is not None and ahora - conocida[1] < self.check_interval:
+            return conocida[0]
+        try:
+            version = self.backend.get_version(namespace)
+        except CacheBackendError:
+            self._backend_failed(namespace)
+            return None
+        if conocida is not None and conocida[0] != version:
+            self.local.invalidate(namespace)
+        with self._lock:
+            self._versions[namespace] = (version, ahora)
+        return version
+
+    def _backend_failed(self, namespace: str) -> None:
+        # Sin almacén no se puede saber si otro worker invalidó: se descarta
+        # el nivel 1 y se vuelve a consultar la versión en la próxima lectura
+        logger.warning("Caché compartida no disponible (%s)", self.backend.name)
+        self.backend_errors += 1
+        self.local.invalidate(namespace)
+        with self._lock:
+            self._versions.pop(namespace, None)
+
+    @staticmethod
+    def _shared_key(key: tuple, version: int) -> str:
+        return f"{key[0]}:{version}:{key[1:]!r}"
+
+    def lookup(self, key: tuple) -> tuple[Any, int | None, int]:
+        """
+        Buscar `key` en ambos niveles
+
+        Devuelve (valor o `MISSING`, versión del almacén, generación local); si
+        falta, la versión y la generación se pasan a `store` tras cargar.
+        """
+        version = self._version(key[0])
+        if version is None:
+            return MISSING, None, 0
+        generacion = self.local.generation(key[0])
+        valor = self.local.get(key, MISSING)
+        if valor is not MISSING or not self.share_values:
+            return valor, version, generacion
+        try:
+            datos = self.backend.get(self._shared_key(key, version))
+        except CacheBackendError:
+            self._backend_failed(key[0])
+            return MISSING, None, 0
+        if datos is None:
+            return MISSING, version, generacion
+        valor = pickle.loads(datos)
+        self.shared_hits += 1
+        self.local.set(key, valor, generacion)
+        return valor, version, generacion
+
+    def store(
+        self, key: tuple, value: Any, version: int | None, generation: int
+    ) -> None:
+        """Guardar en ambos niveles un valor cargado tras un `lookup` fallido"""
+        if version is None:
+            return
+        if not self.share_values:
+            self.local.set(key, value, generation)
+            return
+        try:
+            self.backend.set(
+                self._shared_key(key, version), pickle.dumps(value), self.local.ttl
+            )
+        except CacheBackendError:
+            self._backend_failed(key[0])
+            return
+        self.local.set(key, value, generation)
+
+    def get_or_load(self, key: tuple, loader: Callable[[], T]) -> T:
+        """Valor de `key` desde la caché o desde `loader()`"""
+        valor, version, generacion = self.lookup(key)
+        if valor is MISSING:
+            valor = loader()
+            self.store(key, valor, version, generacion)
+        return valor
+
+    def invalidate(self, namespace: str) -> None:
+        """Invalidar el espacio de nombres en este worker y en los demás"""
+        self.local.invalidate(namespace)
+        try:
+            version = self.backend.incr_version(namespace)
+        except CacheBackendError:
+            self._backend_failed(namespace)
+            return
+        with self._lock:
+            self._versions[namespace] = (version, self._clock())
+
+    def clear(self) -> None:
+        """Vaciar ambos niveles y reiniciar los contadores"""
+        self.local.clear()
+        self.backend.clear()
+        with self._lock:
+            self._versions.clear()
+        self.shared_hits = self.backend_errors = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Contadores del nivel 1 más los del almacén compartido"""
+        return {
+            **self.local.stats(),
+            "backend": self.backend.name,
+            "shared_hits": self.shared_hits,
+            "backend_errors": self.backend_errors,
+            "check_interval_seconds": self.check_interval,
+        }
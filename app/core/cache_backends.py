@@ -0,0 +1,316 @@
+"""
+Almacenes compartidos para la caché entre workers
+
+Todos exponen la misma interfaz mínima (`CacheBackend`): valores binarios con
+caducidad y contadores de versión por espacio de nombres.
+
+- `MemoryBackend`: diccionario LRU acotado del proceso (un solo worker, y tests).
+- `SQLiteBackend`: fichero SQLite en modo WAL compartido por los workers de
+  una misma máquina, al estilo de diskcache.
+- `RedisBackend`: cliente mínimo del protocolo de Redis (RESP) sobre socket,
+  sin dependencias; sirve igual contra Redis, Valkey o un sustituto local.
+"""
+
+import socket
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+from urllib.parse import unquote, urlparse
+
+from app.core.config import get_settings
+
+KEY_PREFIX = "gestorhr:cache:"
+VERSION_PREFIX = "gestorhr:version:"
+# La lista de revocación de tokens comparte almacén pero no es caché: clear()
+# nunca borra las claves con este prefijo (vaciar la caché no des-revoca)
+REVOCATION_PREFIX = "revocados:"
+
+
+class CacheBackendError(Exception):
+    """Fallo de comunicación con el almacén de la caché"""
+
+
+class CacheBackend(ABC):
+    """Almacén de valores con TTL y versiones por espacio de nombres"""
+
+    name = "abstract"
+
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        """Valor vigente de `key` o None"""
+
+    @abstractmethod
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        """Guardar `value` durante `ttl` segundos"""
+
+    @abstractmethod
+    def get_version(self, namespace: str) -> int:
+        """Versión actual del espacio de nombres (0 si nunca se invalidó)"""
+
+    @abstractmethod
+    def incr_version(self, namespace: str) -> int:
+        """Incrementar la versión del espacio de nombres y devolverla"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Borrar los valores y versiones de la caché (salvo REVOCATION_PREFIX)"""
+
+
+class MemoryBackend(CacheBackend):
+    """
+    Almacén en memoria del proceso, de como máximo `maxsize` valores
+
+    Las claves llevan la versión del espacio de nombres, así que tras cada
+    invalidación las anteriores ya no se vuelven a leer: al llenarse se
+    descartan primero las caducadas y después las menos usadas.
+    """
+
+    name = "memory"
+
+    def __init__(self, maxsize: int = 4096) -> None:
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._values: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._versions: dict[str, int] = {}
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entrada = self._values.get(key)
+            if entrada is None:
+                return None
+            if entrada[0] <= time.monotonic():
+                del self._values[key]
+                return None
+            self._values.move_to_end(key)
+            return entrada[1]
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        ahora = time.monotonic()
+        with self._lock:
+            self._values[key] = (ahora + ttl, value)
+            self._values.move_to_end(key)
+            if len(self._values) <= self.maxsize:
+                return
+            for caducada in [
+                k for k, (caduca, _) in self._values.items() if caduca <= ahora
+            ]:
+                del self._values[caducada]
+            while len(self._values) > self.maxsize:
+                self._values.popitem(last=False)
+
+    def get_version(self, namespace: str) -> int:
+        with self._lock:
+            return self._versions.get(namespace, 0)
+
+    def incr_version(self, namespace: str) -> int:
+        with self._lock:
+            self._versions[namespace] = self._versions.get(namespace, 0) + 1
+            return self._versions[namespace]
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in [k for k in self._values if not k.startswith(REVOCATION_PREFIX)]:
+                del self._values[key]
+            self._versions.clear()
+
+
+class SQLiteBackend(CacheBackend):
+    """Almacén en un fichero SQLite compartido por los procesos de la máquina"""
+
+    name = "sqlite"
+    # Las entradas caducadas se purgan cada PURGE_EVERY escrituras, no en todas
+    PURGE_EVERY = 256
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+        self._sets = 0
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries "
+            "(key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL NOT NULL)"
+        )
+        self._execute(
+            "CREATE INDEX IF NOT EXISTS ix_cache_entries_expires "
+            "ON cache_entries (expires)"
+        )
+        self._execute(
+            "CREATE TABLE IF NOT EXISTS cache_versions "
+            "(namespace TEXT PRIMARY KEY, version INTEGER NOT NULL)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        # Una conexión por hilo; en autocommit cada sentencia es su transacción
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _execute(self, sql: str, params: tuple = ()) -> sqlite3.Cursor:
+        try:
+            # _connection() dentro del try: una ruta inválida también es un
+            # fallo del almacén
+            return self._connection().execute(sql, params)
+        except sqlite3.Error as exc:
+            raise CacheBackendError(str(exc)) from exc
+
+    def get(self, key: str) -> bytes | None:
+        # Caducidad con reloj de pared: se compara entre procesos distintos
+        fila = self._execute(
+            "SELECT value FROM cache_entries WHERE key = ? AND expires > ?",
+            (key, time.time()),
+        ).fetchone()
+        return fila[0] if fila else None
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        ahora = time.time()
+        self._execute(
+            "INSERT OR REPLACE INTO cache_entries VALUES (?, ?, ?)",
+            (key, value, ahora + ttl),
+        )
+        # Las caducadas ya no se leen (get filtra por expires); basta con
+        # purgarlas de vez en cuando, usando el índice sobre expires
+        self._sets += 1
+        if self._sets % self.PURGE_EVERY == 0:
+            self._execute("DELETE FROM cache_entries WHERE expires <= ?", (ahora,))
+
+    def get_version(self, namespace: str) -> int:
+        fila = self._execute(
+            "SELECT version FROM cache_versions WHERE namespace = ?", (namespace,)
+        ).fetchone()
+        return fila[0] if fila else 0
+
+    def incr_version(self, namespace: str) -> int:
+        return self._execute(
+            "INSERT INTO cache_versions VALUES (?, 1) ON CONFLICT(namespace) "
+            "DO UPDATE SET version = version + 1 RETURNING version",
+            (namespace,),
+        ).fetchone()[0]
+
+    def clear(self) -> None:
+        self._execute(
+            "DELETE FROM cache_entries WHERE key NOT GLOB ?", (REVOCATION_PREFIX + "*",)
+        )
+        self._execute("DELETE FROM cache_versions")
+
+
+class RedisBackend(CacheBackend):
+    """Almacén en un servidor que habla el protocolo de Redis (RESP2)"""
+
+    name = "redis"
+
+    def __init__(self, url: str, timeout: float = 1.0) -> None:
+        partes = urlparse(url)
+        self.host = partes.hostname or "localhost"
+        self.port = partes.port or 6379
+        self.db = int(partes.path.lstrip("/") or 0)
+        self.password = unquote(partes.password) if partes.password else None
+        self.timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self) -> tuple[socket.socket, Any]:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            sock = socket.create_connection((self.host, self.port), self.timeout)
+            conn = self._local.conn = (sock, sock.makefile("rb"))
+            if self.password:
+                self._send(*conn, "AUTH", self.password)
+            if self.db:
+                self._send(*conn, "SELECT", str(self.db))
+        return conn
+
+    def command(self, *args: str | bytes) -> Any:
+        """Ejecutar un comando; reintenta una vez si la conexión se cayó"""
+        try:
+            return self._send(*self._connection(), *args)
+        except OSError:
+            # Reinicio del servidor o conexión ociosa cerrada: se reconecta
+            self._local.conn = None
+        try:
+            return self._send(*self._connection(), *args)
+        except OSError as exc:
+            self._local.conn = None
+            raise CacheBackendError(str(exc)) from exc
+
+    def _send(self, sock: socket.socket, lector: Any, *args: str | bytes) -> Any:
+        partes = [f"*{len(args)}\r\n".encode()]
+        for arg in args:
+            dato = arg.encode() if isinstance(arg, str) else arg
+            partes.append(b"$%d\r\n%s\r\n" % (len(dato), dato))
+        sock.sendall(b"".join(partes))
+        return self._read(lector)
+
+    def _read(self, lector: Any) -> Any:
+        linea = lector.readline()
+        if not linea:
+            raise ConnectionError("Conexión cerrada por el servidor")
+        tipo, resto = linea[:1], linea[1:-2]
+        if tipo == b"+":
+            return resto.decode()
+        if tipo == b"-":
+            raise CacheBackendError(resto.decode())
+        if tipo == b":":
+            return int(resto)
+        if tipo == b"$":
+            tamano = int(resto)
+            return None if tamano < 0 else lector.read(tamano + 2)[:-2]
+        if tipo == b"*":
+            tamano = int(resto)
+            return None if tamano < 0 else [self._read(lector) for _ in range(tamano)]
+        raise CacheBackendError(f"Respuesta RESP no válida: {linea!r}")
+
+    def get(self, key: str) -> bytes | None:
+        return self.command("GET", KEY_PREFIX + key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self.command("SET", KEY_PREFIX + key, value, "PX", str(max(1, int(ttl * 1000))))
+
+    def get_version(self, namespace: str) -> int:
+        valor = self.command("GET", VERSION_PREFIX + namespace)
+        return int(valor) if valor is not None else 0
+
+    def incr_version(self, namespace: str) -> int:
+        return self.command("INCR", VERSION_PREFIX + namespace)
+
+    def clear(self) -> None:
+        # Solo las claves de la aplicación, nunca FLUSHDB
+        revocadas = (KEY_PREFIX + REVOCATION_PREFIX).encode()
+        for patron in (KEY_PREFIX + "*", VERSION_PREFIX + "*"):
+            cursor = "0"
+            while True:
+                cursor, claves = self.command("SCAN", cursor, "MATCH", patron)
+                claves = [c for c in claves if not c.startswith(revocadas)]
+                if claves:
+                    self.command("DEL", *claves)
+                cursor = cursor.decode()
+                if cursor == "0":
+                    break
+
+
+def create_backend(
+    kind: str, sqlite_path: str, redis_url: str, memory_maxsize: int = 4096
+) -> CacheBackend:
+    """Crear el almacén configurado (CACHE_BACKEND)"""
+    if kind == "sqlite":
+        return SQLiteBackend(sqlite_path)
+    if kind == "redis":
+        return RedisBackend(redis_url)
+    return MemoryBackend(memory_maxsize)
+
+
+@lru_cache
+def get_backend() -> CacheBackend:
+    """Almacén compartido del proceso según la configuración"""
+    settings = get_settings()
+    return create_backend(
+        settings.CACHE_BACKEND,
+        sqlite_path=settings.CACHE_SQLITE_PATH,
+        redis_url=settings.CACHE_REDIS_URL,
+        memory_maxsize=settings.CACHE_MEMORY_MAXSIZE,
+    )
@@ -0,0 +1,318 @@
+"""
+Compresión de respuestas HTTP (gzip, y brotli si está instalado)
+
+- `CompressionMiddleware`: comprime al vuelo las respuestas de la API cuyo
+  Content-Type está en la lista permitida y superan el tamaño mínimo. Las
+  respuestas en streaming se comprimen por bloques sin perder el streaming.
+- `PrecompressedStaticFiles`: sirve las variantes .br/.gz de los estáticos,
+  generadas una sola vez con `precompress_directory`, como paso de build
+  (``python -m app.core.compression frontend``) o al arrancar con
+  PRECOMPRESS_STATIC=true.
+"""
+
+import gzip
+import mimetypes
+import os
+import sys
+import zlib
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - dependencia opcional
+    brotli = None
+
+DEFAULT_CONTENT_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "application/javascript",
+    "image/svg+xml",
+    "text/",
+)
+
+# Extensión de la variante precomprimida de cada codificación
+_SUFFIXES = {"br": ".br", "gzip": ".gz"}
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """
+    ETag de la variante comprimida: `"abc"` pasa a `"abc-gzip"` (o `-br`)
+
+    Cada codificación es una representación distinta y no puede compartir un
+    validador fuerte con las demás.
+    """
+    if not etag.endswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def strip_etag_encoding(etag: str) -> str:
+    """ETag de la representación sin comprimir (inverso de `encoded_etag`)"""
+    for encoding in _SUFFIXES:
+        sufijo = f'-{encoding}"'
+        if etag.endswith(sufijo):
+            return etag.removesuffix(sufijo) + '"'
+    return etag
+
+
+def available_encodings() -> tuple[str, ...]:
+    """Codificaciones soportadas en orden de preferencia"""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def accepted_encodings(accept_encoding: str) -> list[str]:
+    """Codificaciones soportadas que acepta el cliente (respeta q=0)"""
+    aceptadas = set()
+    for parte in accept_encoding.lower().split(","):
+        nombre, _, parametros = parte.partition(";")
+        calidad = parametros.strip().removeprefix("q=")
+        if parametros and calidad.replace(".", "").strip("0") == "":
+            continue
+        aceptadas.add(nombre.strip())
+    return [e for e in available_encodings() if e in aceptadas or "*" in aceptadas]
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """Codificación preferida para la respuesta, o None si no hay ninguna"""
+    encodings = accepted_encodings(accept_encoding)
+    return encodings[0] if encodings else None
+
+
+def is_compressible(content_type: str, content_types: Iterable[str]) -> bool:
+    """Indica si el Content-Type está en la lista (entradas "text/" = prefijo)"""
+    tipo = content_type.split(";", 1)[0].strip().lower()
+    return any(
+        tipo.startswith(permitido) if permitido.endswith("/") else tipo == permitido
+        for permitido in content_types
+    )
+
+
+class _Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+    def flush(self) -> bytes: ...
+    def finish(self) -> bytes: ...
+
+
+class _GzipCompressor:
+    def __init__(self, level: int) -> None:
+        self._obj = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.compress(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._obj.flush()
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int) -> None:
+        self._obj = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._obj.process(data)
+
+    def flush(self) -> bytes:
+        return self._obj.flush()
+
+    def finish(self) -> bytes:
+        return self._obj.finish()
+
+
+class CompressionMiddleware:
+    """Middleware ASGI de compresión con umbral y lista de Content-Types"""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        content_types: Iterable[str] = DEFAULT_CONTENT_TYPES,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = tuple(content_types)
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def compressor(self, encoding: str) -> _Compressor:
+        if encoding == "br":
+            return _BrotliCompressor(self.brotli_quality)
+        return _GzipCompressor(self.gzip_level)
+
+
+class _CompressionResponder:
+    """Decide con el primer bloque del cuerpo si la respuesta se comprime"""
+
+    def __init__(
+        self, middleware: CompressionMiddleware, encoding: str, send: Send
+    ) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Message | None = None
+        self._compressor: _Compressor | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body" or self._passthrough:
+            await self._send(message)
+            return
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self._compressor is None:
+            if not self._should_compress(body, more_body):
+                self._passthrough = True
+                await self._send(self._start)
+                await self._send(message)
+                return
+            self._compressor = self.middleware.compressor(self.encoding)
+            headers = MutableHeaders(raw=self._start["headers"])
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            if "etag" in headers:
+                headers["ETag"] = encoded_etag(headers["etag"], self.encoding)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                body = self._compressor.compress(body) + self._compressor.finish()
+                headers["Content-Length"] = str(len(body))
+                await self._send(self._start)
+                await self._send({"type": "http.response.body", "body": body})
+                return
+            await self._send(self._start)
+
+        # Streaming: cada bloque sale comprimido y con flush para no retenerlo
+        chunk = self._compressor.compress(body)
+        chunk += self._compressor.flush() if more_body else self._compressor.finish()
+        await self._send(
+            {"type": "http.response.body", "body": chunk, "more_body": more_body}
+        )
+
+    def _should_compress(self, body: bytes, more_body: bool) -> bool:
+        headers = Headers(raw=self._start["headers"])
+        if self._start["status"] in (204, 206, 304) or "content-encoding" in headers:
+            return False
+        if not is_compressible(
+            headers.get("content-type", ""), self.middleware.content_types
+        ):
+            return False
+        if more_body:
+            tamano = headers.get("content-length")
+            return tamano is None or int(tamano) >= self.middleware.minimum_size
+        return len(body) >= self.middleware.minimum_size
+
+
+def _variant(path: Path, encoding: str) -> Path:
+    return path.with_name(path.name + _SUFFIXES[encoding])
+
+
+def _compress_file(data: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(data, quality=11)
+    # mtime=0: la misma entrada produce siempre el mismo fichero
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def precompress_directory(
+    directory: str | Path,
+    minimum_size: int = 1024,
+    content_types: Iterable[str] = DEFAULT_CONTENT_TYPES,
+) -> int:
+    """
+    Generar las variantes .br/.gz de los estáticos comprimibles
+
+    Solo se regeneran las que faltan o son más antiguas que el original, y no
+    se guardan las que no reducen el tamaño. Devuelve cuántas se escribieron.
+    """
+    content_types = tuple(content_types)
+    escritas = 0
+    for ruta in sorted(Path(directory).rglob("*")):
+        if not ruta.is_file() or ruta.suffix in _SUFFIXES.values():
+            continue
+        tipo, _ = mimetypes.guess_type(ruta.name)
+        estado = ruta.stat()
+        if (
+            tipo is None
+            or not is_compressible(tipo, content_types)
+            or estado.st_size < minimum_size
+        ):
+            continue
+        datos = None
+        for encoding in available_encodings():
+            destino = _variant(ruta, encoding)
+            if destino.exists() and destino.stat().st_mtime >= estado.st_mtime:
+                continue
+            datos = datos if datos is not None else ruta.read_bytes()
+            comprimido = _compress_file(datos, encoding)
+            if len(comprimido) >= len(datos):
+                continue
+            temporal = destino.with_name(destino.name + ".tmp")
+            temporal.write_bytes(comprimido)
+            os.replace(temporal, destino)
+            escritas += 1
+    return escritas
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles que sirve la variante .br/.gz cuando el cliente la acepta"""
+
+    def file_response(
+        self,
+        full_path: Any,
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        request_headers = Headers(scope=scope)
+        ruta = Path(full_path)
+        for encoding in accepted_encodings(request_headers.get("accept-encoding", "")):
+            variante = _variant(ruta, encoding)
+            try:
+                estado = variante.stat()
+            except OSError:
+                continue
+            if estado.st_mtime < stat_result.st_mtime:
+                continue  # variante desactualizada: se sirve el original
+            response = FileResponse(
+                variante,
+                status_code=status_code,
+                stat_result=estado,
+                media_type=mimetypes.guess_type(ruta.name)[0] or "text/plain",
+                headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+            )
+            if self.is_not_modified(response.headers, request_headers):
+                return NotModifiedResponse(response.headers)
+            return response
+        return super().file_response(full_path, stat_result, scope, status_code)
+
+
+if __name__ == "__main__":
+    for directorio in sys.argv[1:] or ["frontend"]:
+        print(f"{directorio}: {precompress_directory(directorio)} variantes generadas")
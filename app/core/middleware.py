@@ -0,0 +1,50 @@
+"""
+Middlewares HTTP de la aplicación
+"""
+
+from collections.abc import Awaitable, Callable
+
+from fastapi import Request, Response
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.db.query_stats import count_queries
+from app.db.slow_queries import set_request_path
+
+logger = get_logger(__name__)
+
+
+async def request_context_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """Asociar las consultas SQL de la petición a su ruta (registro de lentas)"""
+    set_request_path(f"{request.method} {request.url.path}")
+    return await call_next(request)
+
+
+async def query_stats_middleware(
+    request: Request, call_next: Callable[[Request], Awaitable[Response]]
+) -> Response:
+    """
+    Contar las sentencias SQL de cada petición (solo en modo debug)
+
+    Añade las cabeceras X-DB-Query-Count y X-DB-Time-Ms y avisa en el log
+    cuando una misma sentencia se repite lo suficiente como para sugerir N+1.
+    """
+    settings = get_settings()
+    with count_queries() as stats:
+        response = await call_next(request)
+
+    response.headers["X-DB-Query-Count"] = str(stats.count)
+    response.headers["X-DB-Time-Ms"] = f"{stats.total_ms:.2f}"
+
+    repetidas = stats.repeated(settings.QUERY_N_PLUS_ONE_THRESHOLD)
+    for statement, veces in repetidas.items():
+        logger.warning(
+            "Posible N+1 en %s %s: %d ejecuciones de %s",
+            request.method,
+            request.url.path,
+            veces,
+            statement,
+        )
+    return response
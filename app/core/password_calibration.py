@@ -0,0 +1,107 @@
+"""
+Calibración del coste de los hashes de contraseña en el hardware actual
+
+Elige el mayor coste cuya verificación no supera el tiempo objetivo: las
+rondas de bcrypt (cada ronda duplica el tiempo) o la memoria de argon2 (con
+time_cost y parallelism fijos). Uso, en la máquina de producción:
+
+    python -m app.core.password_calibration --target-ms 250 [--scheme argon2]
+
+e imprime las variables de entorno a copiar en .env.
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+
+from passlib.hash import argon2, bcrypt
+
+from app.core.security import argon2_available
+
+# Mínimos razonables hoy: por debajo no se recomienda aunque la máquina sea lenta
+MIN_BCRYPT_ROUNDS = 10
+MAX_BCRYPT_ROUNDS = 16
+MIN_ARGON2_MEMORY_COST = 19456  # KiB (19 MiB)
+MAX_ARGON2_MEMORY_COST = 1048576  # KiB (1 GiB)
+
+
+def measure_verify_ms(handler: type, samples: int = 3) -> float:
+    """Mediana en ms de verificar una contraseña con `handler`"""
+    hashed = handler.hash("calibracion")
+    tiempos = []
+    for _ in range(samples):
+        inicio = time.perf_counter()
+        handler.verify("calibracion", hashed)
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+
+def calibrate_bcrypt(
+    target_ms: float, measure: Callable[[int], float] | None = None
+) -> tuple[int, float]:
+    """Rondas de bcrypt y su tiempo de verificación medido"""
+    measure = measure or (lambda rounds: measure_verify_ms(bcrypt.using(rounds=rounds)))
+    rondas, tiempo = MIN_BCRYPT_ROUNDS, measure(MIN_BCRYPT_ROUNDS)
+    while rondas < MAX_BCRYPT_ROUNDS:
+        # El coste es exponencial: se estima antes de medir la ronda siguiente
+        if tiempo * 2 > target_ms * 1.25:
+            break
+        siguiente = measure(rondas + 1)
+        if siguiente > target_ms:
+            break
+        rondas, tiempo = rondas + 1, siguiente
+    return rondas, tiempo
+
+
+def calibrate_argon2(
+    target_ms: float,
+    time_cost: int = 3,
+    parallelism: int = 1,
+    measure: Callable[[int], float] | None = None,
+) -> tuple[int, float]:
+    """Memoria de argon2 (KiB) y su tiempo de verificación medido"""
+    measure = measure or (
+        lambda memory_cost: measure_verify_ms(
+            argon2.using(
+                memory_cost=memory_cost, time_cost=time_cost, parallelism=parallelism
+            )
+        )
+    )
+    memoria, tiempo = MIN_ARGON2_MEMORY_COST, measure(MIN_ARGON2_MEMORY_COST)
+    while memoria * 2 <= MAX_ARGON2_MEMORY_COST:
+        siguiente = measure(memoria * 2)
+        if siguiente > target_ms:
+            break
+        memoria, tiempo = memoria * 2, siguiente
+    return memoria, tiempo
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target-ms", type=float, default=250)
+    parser.add_argument("--scheme", choices=["bcrypt", "argon2"], default="bcrypt")
+    parser.add_argument("--argon2-time-cost", type=int, default=3)
+    parser.add_argument("--argon2-parallelism", type=int, default=1)
+    args = parser.parse_args()
+
+    if args.scheme == "argon2":
+        if not argon2_available():
+            parser.error("argon2 requiere: pip install argon2-cffi")
+        memoria, tiempo = calibrate_argon2(
+            args.target_ms, args.argon2_time_cost, args.argon2_parallelism
+        )
+        print(f"# verificación: {tiempo:.0f} ms (objetivo {args.target_ms:.0f} ms)")
+        print("PASSWORD_SCHEME=argon2")
+        print(f"ARGON2_MEMORY_COST={memoria}")
+        print(f"ARGON2_TIME_COST={args.argon2_time_cost}")
+        print(f"ARGON2_PARALLELISM={args.argon2_parallelism}")
+    else:
+        rondas, tiempo = calibrate_bcrypt(args.target_ms)
+        print(f"# verificación: {tiempo:.0f} ms (objetivo {args.target_ms:.0f} ms)")
+        print("PASSWORD_SCHEME=bcrypt")
+        print(f"BCRYPT_ROUNDS={rondas}")
+
+
+if __name__ == "__main__":
+    main()
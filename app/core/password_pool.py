@@ -0,0 +1,151 @@
+"""
+Pool acotado de procesos para el hash y la verificación de contraseñas
+
+bcrypt consume ~0,25 s de CPU por operación. Ejecutado en el threadpool
+compartido, un pico de inicios de sesión (cambio de turno) ocupa los hilos y
+ralentiza el resto de endpoints. Aquí las operaciones van a un pool dedicado
+de PASSWORD_POOL_WORKERS procesos con admisión: como mucho
+workers + PASSWORD_POOL_QUEUE operaciones en curso o en cola; las siguientes
+fallan al instante con `PasswordPoolBusyError` (503 en la API).
+
+El pool solo se usa una vez habilitado por la aplicación (`enable()`); los
+scripts y utilidades que importan `app.core.security` siguen calculando el
+hash en línea.
+"""
+
+import asyncio
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, TypeVar
+
+import anyio
+
+from app.core.config import get_settings
+
+T = TypeVar("T")
+
+WORKER_NICENESS = 10
+
+
+class PasswordPoolBusyError(Exception):
+    """La cola del pool de contraseñas está llena"""
+
+
+class HashingPool:
+    """Ejecutor de operaciones de contraseña con límite de cola"""
+
+    def __init__(
+        self,
+        workers: int,
+        queue_limit: int,
+        executor_factory: Callable[[int], Executor] | None = None,
+    ) -> None:
+        self.workers = workers
+        self.queue_limit = queue_limit
+        self.enabled = False
+        self._executor_factory = executor_factory or _process_executor
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self.pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def enable(self) -> None:
+        """Empezar a usar el pool (el ejecutor se crea con la primera operación)"""
+        self.enabled = True
+
+    def _get_executor(self) -> Executor | None:
+        if self.workers <= 0:
+            return None
+        with self._lock:
+            if self._executor is None:
+                self._executor = self._executor_factory(self.workers)
+            return self._executor
+
+    def _admit(self) -> None:
+        with self._lock:
+            if self.pending >= max(self.workers, 1) + self.queue_limit:
+                self.rejected += 1
+                raise PasswordPoolBusyError
+            self.pending += 1
+
+    def _release(self, _future: Future | None = None) -> None:
+        with self._lock:
+            self.pending -= 1
+            self.completed += 1
+
+    def _submit(self, fn: Callable[..., T], *args: Any) -> Future:
+        self._admit()
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        return future
+
+    def call(self, fn: Callable[..., T], *args: Any) -> T:
+        """Ejecutar `fn` en el pool esperando el resultado en este hilo"""
+        if not self.enabled:
+            return fn(*args)
+        if self._get_executor() is None:
+            self._admit()
+            try:
+                return fn(*args)
+            finally:
+                self._release()
+        return self._submit(fn, *args).result()
+
+    async def acall(self, fn: Callable[..., T], *args: Any) -> T:
+        """Ejecutar `fn` en el pool sin ocupar un hilo mientras espera"""
+        if not self.enabled or self._get_executor() is None:
+            # Sin procesos dedicados: en el threadpool, con la misma admisión
+            self._admit()
+            try:
+                return await anyio.to_thread.run_sync(fn, *args)
+            finally:
+                self._release()
+        return await asyncio.wrap_future(self._submit(fn, *args))
+
+    def shutdown(self) -> None:
+        """Detener los procesos del pool"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def stats(self) -> dict[str, Any]:
+        """Operaciones en curso, completadas y rechazadas"""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "workers": self.workers,
+                "queue_limit": self.queue_limit,
+                "pending": self.pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+
+def _lower_priority() -> None:
+    # Con pocos núcleos, el resto de endpoints tiene prioridad sobre bcrypt
+    if hasattr(os, "nice"):
+        os.nice(WORKER_NICENESS)
+
+
+def _process_executor(workers: int) -> Executor:
+    # "spawn": los procesos no heredan hilos ni conexiones del servidor
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_lower_priority,
+    )
+
+
+password_pool = HashingPool(
+    workers=get_settings().PASSWORD_POOL_WORKERS,
+    queue_limit=get_settings().PASSWORD_POOL_QUEUE,
+)
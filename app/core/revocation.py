@@ -0,0 +1,60 @@
+"""
+Lista de revocación de tokens de acceso
+
+Los tokens de acceso se autorizan sin consultar la base (claims firmados),
+así que su revocación se apunta en el almacén compartido de la caché
+(CACHE_BACKEND), solo mientras el token podría seguir siendo válido, bajo
+REVOCATION_PREFIX para que vaciar la caché no la borre:
+
+- por token (`jti`): cierre de sesión;
+- por usuario: todos los tokens emitidos hasta ese instante (baja, cambio
+  de contraseña o de permisos).
+
+Con CACHE_BACKEND=memory la lista es del proceso: un cierre de sesión o una
+baja en otro worker no llegaría a este, así que los claims solo se aceptan
+sin consultar la base con un almacén compartido (sqlite o redis).
+"""
+
+import time
+from typing import Any
+
+from app.core.cache_backends import REVOCATION_PREFIX, get_backend
+from app.core.config import get_settings
+
+TOKEN_KEY = REVOCATION_PREFIX + "jti:"
+USER_KEY = REVOCATION_PREFIX + "usuario:"
+
+
+def is_shared() -> bool:
+    """Indicar si la lista de revocación es común a todos los workers"""
+    return get_backend().name != "memory"
+
+
+def revoke_token(jti: str, expires_at: float) -> None:
+    """Revocar un token de acceso hasta su caducidad (timestamp `exp`)"""
+    ttl = expires_at - time.time()
+    if ttl > 0:
+        get_backend().set(TOKEN_KEY + jti, b"1", ttl)
+
+
+def revoke_user_tokens(usuario_id: int) -> None:
+    """Revocar los tokens de acceso del usuario emitidos hasta ahora"""
+    get_backend().set(
+        USER_KEY + str(usuario_id),
+        repr(time.time()).encode(),
+        ttl=get_settings().ACCESS_TOKEN_EXPIRE_MINUTES * 60,
+    )
+
+
+def is_revoked(claims: dict[str, Any]) -> bool:
+    """
+    Indicar si los claims de un token están revocados
+
+    Raises:
+        CacheBackendError: si el almacén compartido no responde
+    """
+    backend = get_backend()
+    if backend.get(TOKEN_KEY + str(claims.get("jti"))) is not None:
+        return True
+    corte = backend.get(USER_KEY + str(claims.get("uid")))
+    return corte is not None and float(claims.get("iat", 0)) <= float(corte)
@@ -2,24 +2,75 @@
 Security utilities for authentication and authorization
 """
 
+import hashlib
+import math
+import secrets
 from datetime import UTC, datetime, timedelta, timezone
 from typing import Any, Union
 
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
+from passlib.hash import argon2
 
 from app.core.config import settings
+from app.core.password_pool import password_pool
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+
+def argon2_available() -> bool:
+    """argon2 requiere el paquete opcional argon2-cffi"""
+    return argon2.has_backend()
+
+
+def build_password_context(
+    scheme: str = "bcrypt",
+    bcrypt_rounds: int = 12,
+    argon2_memory_cost: int = 65536,
+    argon2_time_cost: int = 3,
+    argon2_parallelism: int = 1,
+) -> CryptContext:
+    """
+    Contexto de passlib: `scheme` para los hashes nuevos; el resto de
+    esquemas solo verifica y queda marcado para rehash (`needs_update`),
+    igual que un bcrypt con menos rondas o un argon2 con otros costes
+    """
+    schemes = ["bcrypt", "argon2"] if argon2_available() else ["bcrypt"]
+    if scheme not in schemes:
+        raise RuntimeError(
+            f"Esquema de contraseñas no disponible: {scheme} "
+            "(argon2 requiere: pip install argon2-cffi)"
+        )
+    schemes.sort(key=lambda nombre: nombre != scheme)
+    opciones: dict[str, Any] = {
+        "bcrypt__rounds": bcrypt_rounds,
+        "bcrypt__min_rounds": bcrypt_rounds,
+    }
+    if "argon2" in schemes:
+        opciones |= {
+            "argon2__memory_cost": argon2_memory_cost,
+            "argon2__time_cost": argon2_time_cost,
+            "argon2__parallelism": argon2_parallelism,
+        }
+    return CryptContext(schemes=schemes, deprecated="auto", **opciones)
+
+
 # Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = build_password_context(
+    settings.PASSWORD_SCHEME,
+    bcrypt_rounds=settings.BCRYPT_ROUNDS,
+    argon2_memory_cost=settings.ARGON2_MEMORY_COST,
+    argon2_time_cost=settings.ARGON2_TIME_COST,
+    argon2_parallelism=settings.ARGON2_PARALLELISM,
+)
 
 
 def create_access_token(
-    subject: str | Any, expires_delta: timedelta | None = None
+    subject: str | Any,
+    expires_delta: timedelta | None = None,
+    claims: dict[str, Any] | None = None,
 ) -> str:
     """
     Crear un token JWT de acceso
@@ -27,28 +78,85 @@ def create_access_token(
     Args:
         subject: El sujeto del token (generalmente el user ID o email)
         expires_delta: Tiempo de expiración personalizado
+        claims: Claims adicionales firmados con el token (id, rol, puesto)
 
     Returns:
         Token JWT como string
     """
+    ahora = datetime.now(UTC)
     if expires_delta:
-        expire = datetime.now(UTC) + expires_delta
+        expire = ahora + expires_delta
     else:
-        expire = datetime.now(UTC) + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-
-    to_encode: dict[str, Any] = {"exp": expire, "sub": str(subject)}
+        expire = ahora + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
+    # jti identifica el token en la lista de revocación; iat permite revocar
+    # de una vez todos los tokens de un usuario emitidos antes de un instante
+    to_encode: dict[str, Any] = {
+        **(claims or {}),
+        "exp": expire,
+        # NumericDate con milisegundos: una revocación no alcanza a los
+        # tokens emitidos en el mismo segundo justo después
+        "iat": math.floor(ahora.timestamp() * 1000) / 1000,
+        "jti": secrets.token_urlsafe(12),
+        "sub": str(subject),
+    }
     encoded_jwt = jwt.encode(
         to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM
     )
     return encoded_jwt
 
 
+def decode_access_token(token: str) -> dict[str, Any] | None:
+    """
+    Verificar firma y caducidad de un token JWT
+
+    Returns:
+        Claims del token si es válido, None en caso contrario
+    """
+    try:
+        return jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    except JWTError:
+        return None
+
+
+def create_refresh_token() -> tuple[str, str]:
+    """
+    Generar un token de refresco opaco
+
+    Returns:
+        (token para el cliente, hash SHA-256 que se guarda en la base)
+    """
+    token = secrets.token_urlsafe(32)
+    return token, hash_refresh_token(token)
+
+
+def hash_refresh_token(token: str) -> str:
+    """Hash con el que se busca un token de refresco en la base"""
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def _verify(plain_password: str, hashed_password: str) -> bool:
+    # Funciones de módulo: se ejecutan en los procesos del pool de contraseñas
+    return pwd_context.verify(plain_password, hashed_password)
+
+
+def _hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+def _verify_and_update(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verificar que una contraseña en texto plano coincida con el hash
 
+    Con el pool de contraseñas habilitado se ejecuta en él y puede lanzar
+    PasswordPoolBusyError si la cola está llena.
+
     Args:
         plain_password: Contraseña en texto plano
         hashed_password: Contraseña hasheada
@@ -56,7 +164,34 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         True si coinciden, False en caso contrario
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_pool.call(_verify, plain_password, hashed_password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Como verify_password, sin ocupar un hilo mientras espera al pool"""
+    return await password_pool.acall(_verify, plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """
+    Verificar la contraseña y, si el hash usa un esquema o coste anterior
+    a la configuración actual, devolver también el hash actualizado
+
+    Returns:
+        (coincide, nuevo hash o None si no hace falta actualizarlo)
+    """
+    return password_pool.call(_verify_and_update, plain_password, hashed_password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """Como verify_and_update_password, sin ocupar un hilo mientras espera"""
+    return await password_pool.acall(
+        _verify_and_update, plain_password, hashed_password
+    )
 
 
 def get_password_hash(password: str) -> str:
@@ -69,7 +204,7 @@ def get_password_hash(password: str) -> str:
     Returns:
         Hash de la contraseña
     """
-    return pwd_context.hash(password)
+    return password_pool.call(_hash, password)
 
 
 def verify_token(token: str) -> str | None:
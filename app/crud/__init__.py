@@ -1,15 +1,23 @@
 """
 Operaciones CRUD para todos los modelos
+
+Las sentencias de cada módulo (SELECT_*, INSERT_*) se construyen una sola vez
+al importarlo: cada llamada solo liga parámetros y reutiliza la entrada de la
+caché de compilación de SQLAlchemy.
 """
 
 # Importaciones directas para mejor tipado
 from app.crud.crud_hospedaje import (
     create_hospedaje,
+    create_hospedajes_lote,
     delete_hospedaje,
     get_hospedaje,
     get_hospedajes,
     get_hospedajes_by_estado,
     get_hospedajes_by_habitacion,
+    get_hospedajes_rows,
+    stream_hospedajes_by_estado,
+    stream_hospedajes_by_habitacion,
     update_hospedaje,
 )
 from app.crud.crud_usuario import (
@@ -32,9 +40,13 @@ __all__ = [
     # Hospedaje operations
     "get_hospedaje",
     "get_hospedajes",
+    "get_hospedajes_rows",
     "get_hospedajes_by_habitacion",
     "get_hospedajes_by_estado",
+    "stream_hospedajes_by_habitacion",
+    "stream_hospedajes_by_estado",
     "create_hospedaje",
+    "create_hospedajes_lote",
     "update_hospedaje",
     "delete_hospedaje",
 ]
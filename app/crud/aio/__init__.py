@@ -0,0 +1,24 @@
+"""
+Operaciones CRUD asíncronas (AsyncSession) para los endpoints de lectura
+
+Las escrituras siguen en los módulos síncronos de app.crud para mantener
+un único camino transaccional.
+"""
+
+from app.crud.aio import (
+    crud_habitacion,
+    crud_hospedaje,
+    crud_producto,
+    crud_tarifa,
+    crud_usuario,
+    versioning,
+)
+
+__all__ = [
+    "crud_habitacion",
+    "crud_hospedaje",
+    "crud_producto",
+    "crud_tarifa",
+    "crud_usuario",
+    "versioning",
+]
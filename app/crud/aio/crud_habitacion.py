@@ -0,0 +1,88 @@
+"""
+Operaciones CRUD asíncronas para el modelo Habitacion
+"""
+
+from collections.abc import Sequence
+from datetime import date
+
+from sqlalchemy import ColumnElement, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.catalog_cache import HABITACIONES, cached_models_async
+from app.crud.crud_habitacion import (
+    SELECT_HABITACION_BY_NUMERO,
+    SELECT_HABITACIONES,
+    SELECT_HABITACIONES_AFTER,
+    SELECT_HABITACIONES_DISPONIBLES,
+    habitaciones_libres_statement,
+)
+from app.crud.projection import fetch_rows_async
+from app.models.habitacion import Habitacion
+
+
+async def get_habitacion(db: AsyncSession, habitacion_id: int) -> Habitacion | None:
+    """Obtener una habitacion por ID"""
+    return await db.get(Habitacion, habitacion_id)
+
+
+async def get_habitacion_by_numero(db: AsyncSession, numero: str) -> Habitacion | None:
+    """Obtener una habitacion por numero"""
+    result = await db.scalars(SELECT_HABITACION_BY_NUMERO, {"numero": numero})
+    return result.first()
+
+
+async def get_habitaciones(
+    db: AsyncSession, skip: int = 0, limit: int = 100, after_id: int | None = None
+) -> list[Habitacion]:
+    """Obtener lista de habitaciones con paginación (offset o a partir de `after_id`)"""
+    if after_id is not None:
+        result = await db.scalars(
+            SELECT_HABITACIONES_AFTER, {"after_id": after_id, "limit": limit}
+        )
+    else:
+        result = await db.scalars(SELECT_HABITACIONES, {"skip": skip, "limit": limit})
+    return list(result.all())
+
+
+async def get_habitaciones_rows(
+    db: AsyncSession,
+    columns: tuple[ColumnElement, ...],
+    skip: int = 0,
+    limit: int = 100,
+    after_id: int | None = None,
+) -> Sequence[Row]:
+    """Listado de habitaciones como filas Core con solo `columns`"""
+    if after_id is not None:
+        return await fetch_rows_async(
+            db,
+            SELECT_HABITACIONES_AFTER,
+            {"after_id": after_id, "limit": limit},
+            columns,
+        )
+    return await fetch_rows_async(
+        db, SELECT_HABITACIONES, {"skip": skip, "limit": limit}, columns
+    )
+
+
+async def get_habitaciones_disponibles(db: AsyncSession) -> list[Habitacion]:
+    """Obtener solo habitaciones disponibles (catálogo en caché)"""
+    return await cached_models_async(
+        db,
+        (HABITACIONES, "disponibles"),
+        lambda s: s.scalars(SELECT_HABITACIONES_DISPONIBLES),
+    )
+
+
+async def get_habitaciones_libres(
+    db: AsyncSession,
+    desde: date,
+    hasta: date,
+    tipo: str | None = None,
+    capacidad: int | None = None,
+) -> list[Habitacion]:
+    """Habitaciones sin hospedajes activos entre `desde` y `hasta`"""
+    result = await db.scalars(
+        habitaciones_libres_statement(tipo, capacidad),
+        {"desde": desde, "hasta": hasta},
+    )
+    return list(result.all())
@@ -0,0 +1,68 @@
+"""
+Operaciones CRUD asíncronas para el modelo Hospedaje
+"""
+
+from collections.abc import Sequence
+
+from sqlalchemy import ColumnElement, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.crud_hospedaje import (
+    SELECT_HOSPEDAJES,
+    SELECT_HOSPEDAJES_AFTER,
+    SELECT_HOSPEDAJES_BY_ESTADO,
+    SELECT_HOSPEDAJES_BY_HABITACION,
+)
+from app.crud.projection import fetch_rows_async
+from app.models.hospedaje import Hospedaje
+
+
+async def get_hospedaje(db: AsyncSession, hospedaje_id: int) -> Hospedaje | None:
+    """Obtener un hospedaje por ID"""
+    return await db.get(Hospedaje, hospedaje_id)
+
+
+async def get_hospedajes(
+    db: AsyncSession, skip: int = 0, limit: int = 100, after_id: int | None = None
+) -> list[Hospedaje]:
+    """Obtener lista de hospedajes con paginación (offset o a partir de `after_id`)"""
+    if after_id is not None:
+        result = await db.scalars(
+            SELECT_HOSPEDAJES_AFTER, {"after_id": after_id, "limit": limit}
+        )
+    else:
+        result = await db.scalars(SELECT_HOSPEDAJES, {"skip": skip, "limit": limit})
+    return list(result.all())
+
+
+async def get_hospedajes_rows(
+    db: AsyncSession,
+    columns: tuple[ColumnElement, ...],
+    skip: int = 0,
+    limit: int = 100,
+    after_id: int | None = None,
+) -> Sequence[Row]:
+    """Listado de hospedajes como filas Core con solo `columns`"""
+    if after_id is not None:
+        return await fetch_rows_async(
+            db, SELECT_HOSPEDAJES_AFTER, {"after_id": after_id, "limit": limit}, columns
+        )
+    return await fetch_rows_async(
+        db, SELECT_HOSPEDAJES, {"skip": skip, "limit": limit}, columns
+    )
+
+
+async def get_hospedajes_by_habitacion(
+    db: AsyncSession, numero_habitacion: str
+) -> list[Hospedaje]:
+    """Obtener hospedajes por número de habitación"""
+    result = await db.scalars(
+        SELECT_HOSPEDAJES_BY_HABITACION, {"numero_habitacion": numero_habitacion}
+    )
+    return list(result.all())
+
+
+async def get_hospedajes_by_estado(db: AsyncSession, estado: str) -> list[Hospedaje]:
+    """Obtener hospedajes por estado"""
+    result = await db.scalars(SELECT_HOSPEDAJES_BY_ESTADO, {"estado": estado})
+    return list(result.all())
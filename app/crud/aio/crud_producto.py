@@ -0,0 +1,98 @@
+"""
+Operaciones CRUD asíncronas para el modelo Producto
+"""
+
+from collections.abc import AsyncIterator, Sequence
+
+from sqlalchemy import ColumnElement, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.catalog_cache import (
+    PRODUCTOS,
+    cached_models_async,
+    cached_rows_async,
+    rows_key,
+)
+from app.crud.crud_producto import (
+    SELECT_PRODUCTOS,
+    SELECT_PRODUCTOS_ACTIVOS,
+    SELECT_PRODUCTOS_AFTER,
+    SELECT_PRODUCTOS_POR_CATEGORIA,
+)
+from app.crud.projection import fetch_rows_async
+from app.models.producto import Producto
+
+
+async def get_producto(db: AsyncSession, producto_id: int) -> Producto | None:
+    """Obtener un producto por ID"""
+    return await db.get(Producto, producto_id)
+
+
+async def get_productos(
+    db: AsyncSession, skip: int = 0, limit: int = 100, after_id: int | None = None
+) -> list[Producto]:
+    """Obtener lista de productos con paginación (offset o a partir de `after_id`)"""
+    if after_id is not None:
+        result = await db.scalars(
+            SELECT_PRODUCTOS_AFTER, {"after_id": after_id, "limit": limit}
+        )
+    else:
+        result = await db.scalars(SELECT_PRODUCTOS, {"skip": skip, "limit": limit})
+    return list(result.all())
+
+
+async def get_productos_rows(
+    db: AsyncSession,
+    columns: tuple[ColumnElement, ...],
+    skip: int = 0,
+    limit: int = 100,
+    after_id: int | None = None,
+) -> Sequence[Row]:
+    """Listado de productos como filas Core con solo `columns`"""
+    if after_id is not None:
+        return await fetch_rows_async(
+            db, SELECT_PRODUCTOS_AFTER, {"after_id": after_id, "limit": limit}, columns
+        )
+    return await fetch_rows_async(
+        db, SELECT_PRODUCTOS, {"skip": skip, "limit": limit}, columns
+    )
+
+
+async def get_productos_activos(db: AsyncSession) -> list[Producto]:
+    """Obtener solo productos activos (catálogo en caché)"""
+    return await cached_models_async(
+        db, (PRODUCTOS, "activos"), lambda s: s.scalars(SELECT_PRODUCTOS_ACTIVOS)
+    )
+
+
+async def get_productos_activos_rows(
+    db: AsyncSession, columns: tuple[ColumnElement, ...]
+) -> Sequence[Row]:
+    """Listado de productos activos como filas Core con solo `columns`"""
+    return await cached_rows_async(
+        db,
+        rows_key(PRODUCTOS, "activos", columns),
+        lambda s: fetch_rows_async(s, SELECT_PRODUCTOS_ACTIVOS, {}, columns),
+    )
+
+
+async def get_productos_por_categoria(
+    db: AsyncSession, categoria: str
+) -> list[Producto]:
+    """Obtener productos por categoría (catálogo en caché)"""
+    return await cached_models_async(
+        db,
+        (PRODUCTOS, "categoria", categoria),
+        lambda s: s.scalars(SELECT_PRODUCTOS_POR_CATEGORIA, {"categoria": categoria}),
+    )
+
+
+async def stream_productos_activos(
+    db: AsyncSession, yield_per: int = 1000
+) -> AsyncIterator[Sequence[Producto]]:
+    """Productos activos, en bloques de `yield_per` filas"""
+    result = await db.stream_scalars(
+        SELECT_PRODUCTOS_ACTIVOS, execution_options={"yield_per": yield_per}
+    )
+    async for bloque in result.partitions():
+        yield bloque
@@ -0,0 +1,89 @@
+"""
+Operaciones CRUD asíncronas para el modelo Tarifa
+"""
+
+from collections.abc import Sequence
+
+from sqlalchemy import ColumnElement, Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.catalog_cache import (
+    TARIFAS,
+    cached_models_async,
+    cached_rows_async,
+    rows_key,
+)
+from app.crud.crud_tarifa import (
+    SELECT_TARIFAS,
+    SELECT_TARIFAS_ACTIVAS,
+    SELECT_TARIFAS_AFTER,
+    SELECT_TARIFAS_POR_TIPO_HABITACION,
+)
+from app.crud.projection import fetch_rows_async
+from app.models.tarifa import Tarifa
+
+
+async def get_tarifa(db: AsyncSession, tarifa_id: int) -> Tarifa | None:
+    """Obtener una tarifa por ID"""
+    return await db.get(Tarifa, tarifa_id)
+
+
+async def get_tarifas(
+    db: AsyncSession, skip: int = 0, limit: int = 100, after_id: int | None = None
+) -> list[Tarifa]:
+    """Obtener lista de tarifas con paginación (offset o a partir de `after_id`)"""
+    if after_id is not None:
+        result = await db.scalars(
+            SELECT_TARIFAS_AFTER, {"after_id": after_id, "limit": limit}
+        )
+    else:
+        result = await db.scalars(SELECT_TARIFAS, {"skip": skip, "limit": limit})
+    return list(result.all())
+
+
+async def get_tarifas_rows(
+    db: AsyncSession,
+    columns: tuple[ColumnElement, ...],
+    skip: int = 0,
+    limit: int = 100,
+    after_id: int | None = None,
+) -> Sequence[Row]:
+    """Listado de tarifas como filas Core con solo `columns`"""
+    if after_id is not None:
+        return await fetch_rows_async(
+            db, SELECT_TARIFAS_AFTER, {"after_id": after_id, "limit": limit}, columns
+        )
+    return await fetch_rows_async(
+        db, SELECT_TARIFAS, {"skip": skip, "limit": limit}, columns
+    )
+
+
+async def get_tarifas_activas(db: AsyncSession) -> list[Tarifa]:
+    """Obtener solo tarifas activas (catálogo en caché)"""
+    return await cached_models_async(
+        db, (TARIFAS, "activas"), lambda s: s.scalars(SELECT_TARIFAS_ACTIVAS)
+    )
+
+
+async def get_tarifas_activas_rows(
+    db: AsyncSession, columns: tuple[ColumnElement, ...]
+) -> Sequence[Row]:
+    """Listado de tarifas activas como filas Core con solo `columns`"""
+    return await cached_rows_async(
+        db,
+        rows_key(TARIFAS, "activas", columns),
+        lambda s: fetch_rows_async(s, SELECT_TARIFAS_ACTIVAS, {}, columns),
+    )
+
+
+async def get_tarifas_por_tipo_habitacion(
+    db: AsyncSession, tipo_habitacion: str
+) -> list[Tarifa]:
+    """Obtener tarifas por tipo de habitación (catálogo en caché)"""
+    return await cached_models_async(
+        db,
+        (TARIFAS, "tipo_habitacion", tipo_habitacion),
+        lambda s: s.scalars(
+            SELECT_TARIFAS_POR_TIPO_HABITACION, {"tipo_habitacion": tipo_habitacion}
+        ),
+    )
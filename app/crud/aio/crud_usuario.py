@@ -0,0 +1,36 @@
+"""
+Operaciones CRUD asíncronas para el modelo Usuario
+"""
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.crud_usuario import (
+    SELECT_USUARIO_BY_EMAIL,
+    SELECT_USUARIOS,
+    SELECT_USUARIOS_AFTER,
+)
+from app.models.usuario import Usuario
+
+
+async def get_usuario(db: AsyncSession, usuario_id: int) -> Usuario | None:
+    """Obtener un usuario por ID"""
+    return await db.get(Usuario, usuario_id)
+
+
+async def get_usuario_by_email(db: AsyncSession, email: str) -> Usuario | None:
+    """Obtener un usuario por email"""
+    result = await db.scalars(SELECT_USUARIO_BY_EMAIL, {"email": email})
+    return result.first()
+
+
+async def get_usuarios(
+    db: AsyncSession, skip: int = 0, limit: int = 100, after_id: int | None = None
+) -> list[Usuario]:
+    """Obtener lista de usuarios con paginación (offset o a partir de `after_id`)"""
+    if after_id is not None:
+        result = await db.scalars(
+            SELECT_USUARIOS_AFTER, {"after_id": after_id, "limit": limit}
+        )
+    else:
+        result = await db.scalars(SELECT_USUARIOS, {"skip": skip, "limit": limit})
+    return list(result.all())
@@ -0,0 +1,18 @@
+"""
+Versión asíncrona de una colección para los ETags de los listados
+"""
+
+from datetime import datetime
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.versioning import version_statement
+from app.db.base_class import Base
+
+
+async def get_collection_version(
+    db: AsyncSession, model: type[Base]
+) -> tuple[datetime | None, int]:
+    """Última modificación y número de filas de la tabla del modelo"""
+    ultima, total = (await db.execute(version_statement(model))).one()
+    return ultima, total
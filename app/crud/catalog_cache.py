@@ -0,0 +1,155 @@
+"""
+Caché de los catálogos (productos, tarifas, habitaciones disponibles)
+
+Las pantallas de TPV y reservas leen estos listados en cada carga y cambian
+pocas veces al día. Se guardan por consulta en una `SharedCache` y las
+funciones create_/update_/delete_ del CRUD invalidan su catálogo tras el
+commit (write-through): en el worker que escribe el efecto es inmediato y en
+los demás llega en CACHE_VERSION_CHECK_INTERVAL segundos como mucho.
+
+Las cargas que llenan la caché leen siempre del primario, aunque la petición
+use la réplica: tras una invalidación, una réplica con retraso dejaría el
+catálogo anterior en caché durante todo CATALOG_CACHE_TTL.
+
+Los objetos ORM se guardan como copias desligadas de la sesión que los cargó,
+con sus columnas ya leídas: se pueden serializar desde cualquier petición, pero
+no deben modificarse ni añadirse a otra sesión.
+"""
+
+from collections.abc import Awaitable, Callable, Iterable, Sequence
+from typing import Any
+
+import anyio
+from sqlalchemy import ColumnElement, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.cache import MISSING, SharedCache, TTLCache
+from app.core.cache_backends import get_backend
+from app.core.config import get_settings
+from app.db.async_session import async_primary_session
+from app.db.base_class import Base
+from app.db.session import primary_session
+
+PRODUCTOS = "productos"
+TARIFAS = "tarifas"
+HABITACIONES = "habitaciones"
+
+# Nivel 1 en el proceso y nivel 2 compartido entre workers (CACHE_BACKEND)
+catalog_cache = SharedCache(
+    TTLCache(
+        maxsize=get_settings().CATALOG_CACHE_MAXSIZE,
+        ttl=get_settings().CATALOG_CACHE_TTL,
+    ),
+    get_backend(),
+    check_interval=get_settings().CACHE_VERSION_CHECK_INTERVAL,
+)
+
+
+def _enabled() -> bool:
+    return get_settings().CATALOG_CACHE_ENABLED
+
+
+def detached_copy(instancia: Base) -> Base:
+    """Copia desligada de una instancia con sus columnas ya cargadas"""
+    mapper = inspect(instancia).mapper
+    copia = mapper.class_manager.new_instance()
+    for atributo in mapper.column_attrs:
+        set_committed_value(copia, atributo.key, getattr(instancia, atributo.key))
+    make_transient_to_detached(copia)
+    return copia
+
+
+def _snapshot(instancias: Iterable[Base]) -> tuple[Base, ...]:
+    return tuple(detached_copy(instancia) for instancia in instancias)
+
+
+def rows_key(namespace: str, query: str, columns: Sequence[ColumnElement]) -> tuple:
+    """Clave de un listado proyectado: las columnas se identifican por etiqueta"""
+    return (namespace, query, "rows", tuple(columna.name for columna in columns))
+
+
+def cached_models(
+    db: Session, key: tuple, loader: Callable[[Session], Iterable[Base]]
+) -> list[Base]:
+    """Listado de objetos ORM desde la caché o desde `loader(sesión)`"""
+    if not _enabled():
+        return list(loader(db))
+
+    def cargar() -> tuple[Base, ...]:
+        with primary_session(db) as primaria:
+            return _snapshot(loader(primaria))
+
+    return list(catalog_cache.get_or_load(key, cargar))
+
+
+def cached_rows(
+    db: Session, key: tuple, loader: Callable[[Session], Sequence[Any]]
+) -> Sequence[Any]:
+    """Listado de filas Core (inmutables) desde la caché o desde `loader(sesión)`"""
+    if not _enabled():
+        return loader(db)
+
+    def cargar() -> tuple[Any, ...]:
+        with primary_session(db) as primaria:
+            return tuple(loader(primaria))
+
+    return catalog_cache.get_or_load(key, cargar)
+
+
+async def _get_or_load_async(key: tuple, loader: Callable[[], Awaitable[Any]]) -> Any:
+    # sqlite y redis hacen E/S bloqueante: se consultan fuera del event loop
+    en_hilo = catalog_cache.backend.name != "memory"
+    if en_hilo:
+        valor, version, generacion = await anyio.to_thread.run_sync(
+            catalog_cache.lookup, key
+        )
+    else:
+        valor, version, generacion = catalog_cache.lookup(key)
+    if valor is MISSING:
+        valor = await loader()
+        if en_hilo:
+            await anyio.to_thread.run_sync(
+                catalog_cache.store, key, valor, version, generacion
+            )
+        else:
+            catalog_cache.store(key, valor, version, generacion)
+    return valor
+
+
+async def cached_models_async(
+    db: AsyncSession,
+    key: tuple,
+    loader: Callable[[AsyncSession], Awaitable[Iterable[Base]]],
+) -> list[Base]:
+    """Variante de `cached_models` para el CRUD asíncrono"""
+    if not _enabled():
+        return list(await loader(db))
+
+    async def cargar() -> tuple[Base, ...]:
+        async with async_primary_session(db) as primaria:
+            return _snapshot(await loader(primaria))
+
+    return list(await _get_or_load_async(key, cargar))
+
+
+async def cached_rows_async(
+    db: AsyncSession,
+    key: tuple,
+    loader: Callable[[AsyncSession], Awaitable[Sequence[Any]]],
+) -> Sequence[Any]:
+    """Variante de `cached_rows` para el CRUD asíncrono"""
+    if not _enabled():
+        return await loader(db)
+
+    async def cargar() -> tuple[Any, ...]:
+        async with async_primary_session(db) as primaria:
+            return tuple(await loader(primaria))
+
+    return await _get_or_load_async(key, cargar)
+
+
+def invalidate_catalog(namespace: str) -> None:
+    """Invalidar un catálogo tras una escritura (en todos los workers)"""
+    catalog_cache.invalidate(namespace)
@@ -2,32 +2,132 @@
 Operaciones CRUD para el modelo Habitacion
 """
 
-from typing import Optional
+from collections.abc import Sequence
+from datetime import date
 
+from sqlalchemy import ColumnElement, Row, Select, bindparam, exists, select
 from sqlalchemy.orm import Session
 
+from app.crud.catalog_cache import HABITACIONES, cached_models, invalidate_catalog
+from app.crud.crud_hospedaje import overlaps
+from app.crud.projection import fetch_rows
 from app.models.habitacion import Habitacion
+from app.models.hospedaje import Hospedaje
 from app.schemas.habitacion import HabitacionCreate, HabitacionUpdate
 
+SELECT_HABITACION_BY_NUMERO = select(Habitacion).where(
+    Habitacion.numero == bindparam("numero")
+)
+SELECT_HABITACIONES = (
+    select(Habitacion)
+    .order_by(Habitacion.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+SELECT_HABITACIONES_AFTER = (
+    select(Habitacion)
+    .where(Habitacion.id > bindparam("after_id"))
+    .order_by(Habitacion.id)
+    .limit(bindparam("limit"))
+)
+SELECT_HABITACIONES_DISPONIBLES = select(Habitacion).where(
+    Habitacion.estado == "disponible"
+)
+# Sin ningún hospedaje que ocupe una noche del rango: por habitación, una
+# búsqueda en el índice de hospedajes que se corta en el primer solape
+SELECT_HABITACIONES_LIBRES = (
+    select(Habitacion)
+    .where(
+        Habitacion.estado != "mantenimiento",
+        ~exists().where(
+            Hospedaje.numero_habitacion == Habitacion.numero,
+            overlaps(bindparam("desde"), bindparam("hasta")),
+        ),
+    )
+    .order_by(Habitacion.numero)
+)
+
 
 def get_habitacion(db: Session, habitacion_id: int) -> Habitacion | None:
     """Obtener una habitacion por ID"""
-    return db.query(Habitacion).filter(Habitacion.id == habitacion_id).first()
+    return db.get(Habitacion, habitacion_id)
 
 
 def get_habitacion_by_numero(db: Session, numero: str) -> Habitacion | None:
     """Obtener una habitacion por numero"""
-    return db.query(Habitacion).filter(Habitacion.numero == numero).first()
+    return db.scalars(SELECT_HABITACION_BY_NUMERO, {"numero": numero}).first()
+
+
+def get_habitaciones(
+    db: Session, skip: int = 0, limit: int = 100, after_id: int | None = None
+) -> list[Habitacion]:
+    """Obtener lista de habitaciones con paginación (offset o a partir de `after_id`)"""
+    if after_id is not None:
+        return list(
+            db.scalars(
+                SELECT_HABITACIONES_AFTER, {"after_id": after_id, "limit": limit}
+            )
+        )
+    return list(db.scalars(SELECT_HABITACIONES, {"skip": skip, "limit": limit}))
+
+
+def get_habitaciones_rows(
+    db: Session,
+    columns: tuple[ColumnElement, ...],
+    skip: int = 0,
+    limit: int = 100,
+    after_id: int | None = None,
+) -> Sequence[Row]:
+    """Listado de habitaciones como filas Core con solo `columns`"""
+    if after_id is not None:
+        return fetch_rows(
+            db,
+            SELECT_HABITACIONES_AFTER,
+            {"after_id": after_id, "limit": limit},
+            columns,
+        )
+    return fetch_rows(db, SELECT_HABITACIONES, {"skip": skip, "limit": limit}, columns)
 
 
-def get_habitaciones(db: Session, skip: int = 0, limit: int = 100) -> list[Habitacion]:
-    """Obtener lista de habitaciones con paginación"""
-    return db.query(Habitacion).offset(skip).limit(limit).all()
+def get_habitaciones_disponibles(db: Session) -> list[Habitacion]:
+    """Obtener solo habitaciones disponibles (catálogo en caché)"""
+    return cached_models(
+        db,
+        (HABITACIONES, "disponibles"),
+        lambda s: s.scalars(SELECT_HABITACIONES_DISPONIBLES),
+    )
 
 
-def get_habitaciones_disponibles(db: Session) -> list[Habitacion]:
-    """Obtener solo habitaciones disponibles"""
-    return db.query(Habitacion).filter(Habitacion.estado == "disponible").all()
+def habitaciones_libres_statement(
+    tipo: str | None = None, capacidad: int | None = None
+) -> Select:
+    """SELECT_HABITACIONES_LIBRES con los filtros opcionales de tipo y capacidad"""
+    stmt = SELECT_HABITACIONES_LIBRES
+    if tipo is not None:
+        stmt = stmt.where(Habitacion.tipo == tipo)
+    if capacidad is not None:
+        stmt = stmt.where(Habitacion.capacidad_personas >= capacidad)
+    return stmt
+
+
+def get_habitaciones_libres(
+    db: Session,
+    desde: date,
+    hasta: date,
+    tipo: str | None = None,
+    capacidad: int | None = None,
+) -> list[Habitacion]:
+    """
+    Habitaciones sin hospedajes activos entre `desde` y `hasta` (noches de
+    [desde, hasta)), opcionalmente de un tipo y con capacidad mínima; las
+    habitaciones en mantenimiento no se ofrecen
+    """
+    return list(
+        db.scalars(
+            habitaciones_libres_statement(tipo, capacidad),
+            {"desde": desde, "hasta": hasta},
+        )
+    )
 
 
 def create_habitacion(db: Session, *, habitacion_in: HabitacionCreate) -> Habitacion:
@@ -53,6 +153,7 @@ def create_habitacion(db: Session, *, habitacion_in: HabitacionCreate) -> Habita
     )
     db.add(db_habitacion)
     db.commit()
+    invalidate_catalog(HABITACIONES)
     db.refresh(db_habitacion)
     return db_habitacion
 
@@ -68,15 +169,17 @@ def update_habitacion(
 
     db.add(db_habitacion)
     db.commit()
+    invalidate_catalog(HABITACIONES)
     db.refresh(db_habitacion)
     return db_habitacion
 
 
 def delete_habitacion(db: Session, *, habitacion_id: int) -> Habitacion:
     """Eliminar una habitacion"""
-    habitacion = db.query(Habitacion).filter(Habitacion.id == habitacion_id).first()
+    habitacion = db.get(Habitacion, habitacion_id)
     db.delete(habitacion)
     db.commit()
+    invalidate_catalog(HABITACIONES)
     return habitacion
 
 
@@ -84,10 +187,11 @@ def cambiar_estado_habitacion(
     db: Session, *, habitacion_id: int, nuevo_estado: str
 ) -> Habitacion:
     """Cambiar el estado de una habitacion"""
-    habitacion = db.query(Habitacion).filter(Habitacion.id == habitacion_id).first()
+    habitacion = db.get(Habitacion, habitacion_id)
     if habitacion:
         habitacion.estado = nuevo_estado
         db.add(habitacion)
         db.commit()
+        invalidate_catalog(HABITACIONES)
         db.refresh(habitacion)
     return habitacion
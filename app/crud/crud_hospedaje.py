@@ -2,81 +2,412 @@
 Operaciones CRUD para el modelo Hospedaje
 """
 
-from typing import Optional
+import random
+import time
+from collections.abc import Callable, Iterator, Sequence
+from datetime import date
+from typing import TypeVar
 
+from sqlalchemy import (
+    BindParameter,
+    ColumnElement,
+    Row,
+    bindparam,
+    insert,
+    select,
+    text,
+)
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.orm import Session
 
+from app.crud.projection import fetch_rows
 from app.models.hospedaje import Hospedaje
-from app.schemas.hospedaje import HospedajeCreate, HospedajeUpdate
+from app.schemas.hospedaje import (
+    HospedajeCreate,
+    HospedajeLoteResultado,
+    HospedajeUpdate,
+)
+
+T = TypeVar("T")
+
+# Estados que ocupan la habitación; cancelado y check_out la dejan libre
+ESTADOS_OCUPAN = ("pendiente", "confirmado", "check_in")
+
+# Reintentos ante bloqueo de la base (SQLite ocupada, deadlock en PostgreSQL)
+MAX_REINTENTOS = 5
+ESPERA_REINTENTO_S = 0.05
+# Primer argumento de pg_advisory_xact_lock: separa estos bloqueos de otros usos
+ESPACIO_BLOQUEO_RESERVAS = 4201
+
+
+class HabitacionOcupadaError(Exception):
+    """La habitación ya tiene un hospedaje que se solapa con las fechas"""
+
+
+def overlaps(
+    desde: date | BindParameter, hasta: date | BindParameter
+) -> ColumnElement[bool]:
+    """
+    Hospedajes que ocupan alguna noche de [desde, hasta)
+
+    La salida es exclusiva: un check-out el día `desde` no se solapa. Usa el
+    índice (numero_habitacion, fecha_check_out, fecha_check_in, estado).
+    """
+    return (
+        (Hospedaje.fecha_check_out > desde)
+        & (Hospedaje.fecha_check_in < hasta)
+        & Hospedaje.estado.in_(ESTADOS_OCUPAN)
+    )
+
+
+SELECT_HOSPEDAJES = (
+    select(Hospedaje)
+    .order_by(Hospedaje.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+SELECT_HOSPEDAJES_AFTER = (
+    select(Hospedaje)
+    .where(Hospedaje.id > bindparam("after_id"))
+    .order_by(Hospedaje.id)
+    .limit(bindparam("limit"))
+)
+SELECT_HOSPEDAJES_BY_HABITACION = select(Hospedaje).where(
+    Hospedaje.numero_habitacion == bindparam("numero_habitacion")
+)
+SELECT_HOSPEDAJES_BY_ESTADO = select(Hospedaje).where(
+    Hospedaje.estado == bindparam("estado")
+)
+SELECT_SOLAPE = (
+    select(Hospedaje.id)
+    .where(
+        Hospedaje.numero_habitacion == bindparam("numero_habitacion"),
+        overlaps(bindparam("desde"), bindparam("hasta")),
+        Hospedaje.id != bindparam("excluir_id"),
+    )
+    .limit(1)
+)
+# Hospedajes que ocupan alguna de las habitaciones de un lote en su ventana
+SELECT_OCUPADOS_LOTE = select(
+    Hospedaje.numero_habitacion, Hospedaje.fecha_check_in, Hospedaje.fecha_check_out
+).where(
+    Hospedaje.numero_habitacion.in_(bindparam("numeros", expanding=True)),
+    overlaps(bindparam("desde"), bindparam("hasta")),
+)
+INSERT_HOSPEDAJES = insert(Hospedaje).returning(
+    Hospedaje.id, sort_by_parameter_order=True
+)
+
+
+def _bloquear_habitaciones(db: Session, numeros: Sequence[str]) -> None:
+    """
+    Serializar las reservas de unas habitaciones hasta el fin de la transacción
+
+    En PostgreSQL, un advisory lock por habitación: las reservas de otras
+    habitaciones siguen en paralelo. En SQLite, que admite un solo escritor,
+    BEGIN IMMEDIATE toma el bloqueo de escritura antes de leer, así la
+    comprobación y el INSERT no se intercalan con otra transacción.
+    """
+    conexion = db.connection()
+    if conexion.dialect.name == "postgresql":
+        # Una sola consulta y en orden: dos lotes no se bloquean en cruz
+        conexion.execute(
+            text(
+                "SELECT pg_advisory_xact_lock(:espacio, hashtext(n)) "
+                "FROM unnest(CAST(:numeros AS text[])) AS n"
+            ),
+            {"espacio": ESPACIO_BLOQUEO_RESERVAS, "numeros": sorted(set(numeros))},
+        )
+    elif (
+        conexion.dialect.name == "sqlite"
+        # pysqlite abre la transacción solo antes del primer INSERT/UPDATE
+        and not conexion.connection.driver_connection.in_transaction
+    ):
+        conexion.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def _comprobar_libre(
+    db: Session,
+    numero_habitacion: str,
+    desde: date,
+    hasta: date,
+    excluir_id: int = 0,
+) -> None:
+    """Lanzar HabitacionOcupadaError si otro hospedaje ocupa esas noches"""
+    solape = db.scalar(
+        SELECT_SOLAPE,
+        {
+            "numero_habitacion": numero_habitacion,
+            "desde": desde,
+            "hasta": hasta,
+            "excluir_id": excluir_id,
+        },
+    )
+    if solape is not None:
+        raise HabitacionOcupadaError(
+            f"La habitación {numero_habitacion} ya está ocupada en esas fechas "
+            f"(hospedaje {solape})"
+        )
+
+
+def _es_bloqueo(exc: OperationalError) -> bool:
+    # SQLite: "database is locked"; PostgreSQL: deadlock o fallo de serialización
+    return "locked" in str(exc.orig) or getattr(exc.orig, "pgcode", None) in (
+        "40P01",
+        "40001",
+    )
+
+
+# Sin la sintaxis genérica de 3.12: el proyecto admite Python 3.10
+def _con_bloqueo(  # noqa: UP047
+    db: Session, numeros: Sequence[str], operacion: Callable[[], T]
+) -> T:
+    """
+    Ejecutar `operacion` (que hace commit) con las habitaciones bloqueadas
+
+    Ante un error la transacción se deshace y el bloqueo se libera; si la base
+    estaba bloqueada se reintenta con espera exponencial.
+    """
+    for intento in range(MAX_REINTENTOS):
+        try:
+            _bloquear_habitaciones(db, numeros)
+            return operacion()
+        except OperationalError as exc:
+            db.rollback()
+            if not _es_bloqueo(exc) or intento == MAX_REINTENTOS - 1:
+                raise
+            time.sleep(ESPERA_REINTENTO_S * 2**intento * random.uniform(0.5, 1.5))
+        except BaseException:
+            db.rollback()
+            raise
+    raise AssertionError("inalcanzable")
 
 
 def get_hospedaje(db: Session, hospedaje_id: int) -> Hospedaje | None:
     """Obtener un hospedaje por ID"""
-    return db.query(Hospedaje).filter(Hospedaje.id == hospedaje_id).first()
+    return db.get(Hospedaje, hospedaje_id)
+
+
+def get_hospedajes(
+    db: Session, skip: int = 0, limit: int = 100, after_id: int | None = None
+) -> list[Hospedaje]:
+    """Obtener lista de hospedajes con paginación (offset o a partir de `after_id`)"""
+    if after_id is not None:
+        return list(
+            db.scalars(SELECT_HOSPEDAJES_AFTER, {"after_id": after_id, "limit": limit})
+        )
+    return list(db.scalars(SELECT_HOSPEDAJES, {"skip": skip, "limit": limit}))
 
 
-def get_hospedajes(db: Session, skip: int = 0, limit: int = 100) -> list[Hospedaje]:
-    """Obtener lista de hospedajes con paginación"""
-    return db.query(Hospedaje).offset(skip).limit(limit).all()
+def get_hospedajes_rows(
+    db: Session,
+    columns: tuple[ColumnElement, ...],
+    skip: int = 0,
+    limit: int = 100,
+    after_id: int | None = None,
+) -> Sequence[Row]:
+    """Listado de hospedajes como filas Core con solo `columns`"""
+    if after_id is not None:
+        return fetch_rows(
+            db, SELECT_HOSPEDAJES_AFTER, {"after_id": after_id, "limit": limit}, columns
+        )
+    return fetch_rows(db, SELECT_HOSPEDAJES, {"skip": skip, "limit": limit}, columns)
 
 
 def get_hospedajes_by_habitacion(
     db: Session, numero_habitacion: str
 ) -> list[Hospedaje]:
     """Obtener hospedajes por número de habitación"""
-    return (
-        db.query(Hospedaje)
-        .filter(Hospedaje.numero_habitacion == numero_habitacion)
-        .all()
+    return list(
+        db.scalars(
+            SELECT_HOSPEDAJES_BY_HABITACION, {"numero_habitacion": numero_habitacion}
+        )
     )
 
 
 def get_hospedajes_by_estado(db: Session, estado: str) -> list[Hospedaje]:
     """Obtener hospedajes por estado"""
-    return db.query(Hospedaje).filter(Hospedaje.estado == estado).all()
+    return list(db.scalars(SELECT_HOSPEDAJES_BY_ESTADO, {"estado": estado}))
+
+
+def stream_hospedajes_by_habitacion(
+    db: Session, numero_habitacion: str, yield_per: int = 1000
+) -> Iterator[Sequence[Hospedaje]]:
+    """Hospedajes por número de habitación, en bloques de `yield_per` filas"""
+    yield from db.scalars(
+        SELECT_HOSPEDAJES_BY_HABITACION,
+        {"numero_habitacion": numero_habitacion},
+        execution_options={"yield_per": yield_per},
+    ).partitions()
+
+
+def stream_hospedajes_by_estado(
+    db: Session, estado: str, yield_per: int = 1000
+) -> Iterator[Sequence[Hospedaje]]:
+    """Hospedajes por estado, en bloques de `yield_per` filas"""
+    yield from db.scalars(
+        SELECT_HOSPEDAJES_BY_ESTADO,
+        {"estado": estado},
+        execution_options={"yield_per": yield_per},
+    ).partitions()
 
 
 def create_hospedaje(db: Session, *, hospedaje_in: HospedajeCreate) -> Hospedaje:
-    """Crear un nuevo hospedaje"""
-    db_hospedaje = Hospedaje(
-        nombre_huesped=hospedaje_in.nombre_huesped,
-        email_huesped=hospedaje_in.email_huesped,
-        telefono_huesped=hospedaje_in.telefono_huesped,
-        documento_identidad=hospedaje_in.documento_identidad,
-        numero_habitacion=hospedaje_in.numero_habitacion,
-        tipo_habitacion=hospedaje_in.tipo_habitacion,
-        fecha_check_in=hospedaje_in.fecha_check_in,
-        fecha_check_out=hospedaje_in.fecha_check_out,
-        precio_por_noche=hospedaje_in.precio_por_noche,
-        numero_noches=hospedaje_in.numero_noches,
-        total_hospedaje=hospedaje_in.total_hospedaje,
-        estado=hospedaje_in.estado,
-        observaciones=hospedaje_in.observaciones,
-    )
-    db.add(db_hospedaje)
-    db.commit()
+    """
+    Crear un nuevo hospedaje
+
+    Si ocupa la habitación, falla con HabitacionOcupadaError cuando otro
+    hospedaje se solapa; la comprobación y el INSERT van bajo el bloqueo de la
+    habitación, así dos reservas simultáneas no pueden venderla dos veces.
+    """
+
+    def reservar() -> Hospedaje:
+        if hospedaje_in.estado in ESTADOS_OCUPAN:
+            _comprobar_libre(
+                db,
+                hospedaje_in.numero_habitacion,
+                hospedaje_in.fecha_check_in,
+                hospedaje_in.fecha_check_out,
+            )
+        db_hospedaje = Hospedaje(
+            nombre_huesped=hospedaje_in.nombre_huesped,
+            email_huesped=hospedaje_in.email_huesped,
+            telefono_huesped=hospedaje_in.telefono_huesped,
+            documento_identidad=hospedaje_in.documento_identidad,
+            numero_habitacion=hospedaje_in.numero_habitacion,
+            tipo_habitacion=hospedaje_in.tipo_habitacion,
+            fecha_check_in=hospedaje_in.fecha_check_in,
+            fecha_check_out=hospedaje_in.fecha_check_out,
+            precio_por_noche=hospedaje_in.precio_por_noche,
+            numero_noches=hospedaje_in.numero_noches,
+            total_hospedaje=hospedaje_in.total_hospedaje,
+            estado=hospedaje_in.estado,
+            observaciones=hospedaje_in.observaciones,
+        )
+        db.add(db_hospedaje)
+        db.commit()
+        return db_hospedaje
+
+    db_hospedaje = _con_bloqueo(db, [hospedaje_in.numero_habitacion], reservar)
     db.refresh(db_hospedaje)
     return db_hospedaje
 
 
+def create_hospedajes_lote(
+    db: Session, *, hospedajes_in: Sequence[HospedajeCreate]
+) -> list[HospedajeLoteResultado]:
+    """
+    Crear varios hospedajes (lista de un grupo) en una sola transacción
+
+    Los solapes con hospedajes existentes se buscan con una consulta para
+    todo el lote y los solapes dentro del lote, en memoria: una fila que choca
+    con otra anterior del lote queda como conflicto. Las filas válidas se
+    insertan con INSERT ... RETURNING en modo executemany: en PostgreSQL va
+    por bloques de filas (insertmanyvalues); SQLite no garantiza el orden de
+    los id devueltos por bloque y SQLAlchemy ejecuta fila a fila, siempre en
+    la misma transacción.
+    """
+
+    def reservar() -> list[HospedajeLoteResultado]:
+        resultados: list[HospedajeLoteResultado | None] = [None] * len(hospedajes_in)
+        ocupan = []
+        for indice, hospedaje in enumerate(hospedajes_in):
+            if hospedaje.fecha_check_out <= hospedaje.fecha_check_in:
+                resultados[indice] = HospedajeLoteResultado(
+                    indice=indice,
+                    estado="invalido",
+                    detalle="La salida debe ser posterior a la entrada",
+                )
+            elif hospedaje.estado in ESTADOS_OCUPAN:
+                ocupan.append((indice, hospedaje))
+
+        ocupados: dict[str, list[tuple[date, date]]] = {}
+        if ocupan:
+            for numero, entrada, salida in db.execute(
+                SELECT_OCUPADOS_LOTE,
+                {
+                    "numeros": sorted({h.numero_habitacion for _, h in ocupan}),
+                    "desde": min(h.fecha_check_in for _, h in ocupan),
+                    "hasta": max(h.fecha_check_out for _, h in ocupan),
+                },
+            ):
+                ocupados.setdefault(numero, []).append((entrada, salida))
+        for indice, hospedaje in ocupan:
+            noches = ocupados.setdefault(hospedaje.numero_habitacion, [])
+            if any(
+                salida > hospedaje.fecha_check_in
+                and entrada < hospedaje.fecha_check_out
+                for entrada, salida in noches
+            ):
+                resultados[indice] = HospedajeLoteResultado(
+                    indice=indice,
+                    estado="conflicto",
+                    detalle=f"La habitación {hospedaje.numero_habitacion} ya está "
+                    "ocupada en esas fechas",
+                )
+            else:
+                noches.append((hospedaje.fecha_check_in, hospedaje.fecha_check_out))
+
+        validos = [i for i, resultado in enumerate(resultados) if resultado is None]
+        if validos:
+            ids = db.scalars(
+                INSERT_HOSPEDAJES,
+                [hospedajes_in[i].model_dump() for i in validos],
+            ).all()
+            for indice, hospedaje_id in zip(validos, ids, strict=True):
+                resultados[indice] = HospedajeLoteResultado(
+                    indice=indice, estado="creado", id=hospedaje_id
+                )
+        db.commit()
+        return resultados
+
+    return _con_bloqueo(db, [h.numero_habitacion for h in hospedajes_in], reservar)
+
+
 def update_hospedaje(
     db: Session, *, db_hospedaje: Hospedaje, hospedaje_in: HospedajeUpdate
 ) -> Hospedaje:
-    """Actualizar un hospedaje existente"""
+    """
+    Actualizar un hospedaje existente
+
+    Un cambio de habitación, fechas o estado se comprueba contra los demás
+    hospedajes con el mismo bloqueo que create_hospedaje.
+    """
     update_data = hospedaje_in.model_dump(exclude_unset=True)
 
-    for field, value in update_data.items():
-        setattr(db_hospedaje, field, value)
+    def aplicar() -> Hospedaje:
+        for field, value in update_data.items():
+            setattr(db_hospedaje, field, value)
+        if db_hospedaje.estado in ESTADOS_OCUPAN:
+            _comprobar_libre(
+                db,
+                db_hospedaje.numero_habitacion,
+                db_hospedaje.fecha_check_in,
+                db_hospedaje.fecha_check_out,
+                excluir_id=db_hospedaje.id,
+            )
+        db.add(db_hospedaje)
+        db.commit()
+        return db_hospedaje
 
-    db.add(db_hospedaje)
-    db.commit()
+    campos_reserva = {
+        "numero_habitacion",
+        "fecha_check_in",
+        "fecha_check_out",
+        "estado",
+    }
+    if campos_reserva.isdisjoint(update_data):
+        aplicar()
+    else:
+        numero = update_data.get("numero_habitacion", db_hospedaje.numero_habitacion)
+        _con_bloqueo(db, [numero], aplicar)
     db.refresh(db_hospedaje)
     return db_hospedaje
 
 
 def delete_hospedaje(db: Session, *, hospedaje_id: int) -> Hospedaje | None:
     """Eliminar un hospedaje"""
-    db_hospedaje = db.query(Hospedaje).filter(Hospedaje.id == hospedaje_id).first()
+    db_hospedaje = db.get(Hospedaje, hospedaje_id)
     if db_hospedaje:
         db.delete(db_hospedaje)
         db.commit()
@@ -2,32 +2,116 @@
 Operaciones CRUD para el modelo Producto
 """
 
-from typing import Optional
+from collections.abc import Iterator, Sequence
 
+from sqlalchemy import ColumnElement, Row, bindparam, select
 from sqlalchemy.orm import Session
 
+from app.crud.catalog_cache import (
+    PRODUCTOS,
+    cached_models,
+    cached_rows,
+    invalidate_catalog,
+    rows_key,
+)
+from app.crud.projection import fetch_rows
 from app.models.producto import Producto
 from app.schemas.producto import ProductoCreate, ProductoUpdate
 
+SELECT_PRODUCTOS = (
+    select(Producto)
+    .order_by(Producto.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+SELECT_PRODUCTOS_AFTER = (
+    select(Producto)
+    .where(Producto.id > bindparam("after_id"))
+    .order_by(Producto.id)
+    .limit(bindparam("limit"))
+)
+SELECT_PRODUCTOS_ACTIVOS = select(Producto).where(Producto.activo.is_(True))
+SELECT_PRODUCTOS_POR_CATEGORIA = select(Producto).where(
+    Producto.categoria == bindparam("categoria")
+)
+
 
 def get_producto(db: Session, producto_id: int) -> Producto | None:
     """Obtener un producto por ID"""
-    return db.query(Producto).filter(Producto.id == producto_id).first()
+    return db.get(Producto, producto_id)
+
+
+def get_productos(
+    db: Session, skip: int = 0, limit: int = 100, after_id: int | None = None
+) -> list[Producto]:
+    """Obtener lista de productos con paginación (offset o a partir de `after_id`)"""
+    if after_id is not None:
+        return list(
+            db.scalars(SELECT_PRODUCTOS_AFTER, {"after_id": after_id, "limit": limit})
+        )
+    return list(db.scalars(SELECT_PRODUCTOS, {"skip": skip, "limit": limit}))
+
+
+def get_productos_rows(
+    db: Session,
+    columns: tuple[ColumnElement, ...],
+    skip: int = 0,
+    limit: int = 100,
+    after_id: int | None = None,
+) -> Sequence[Row]:
+    """Listado de productos como filas Core con solo `columns`"""
+    if after_id is not None:
+        return fetch_rows(
+            db, SELECT_PRODUCTOS_AFTER, {"after_id": after_id, "limit": limit}, columns
+        )
+    return fetch_rows(db, SELECT_PRODUCTOS, {"skip": skip, "limit": limit}, columns)
 
 
-def get_productos(db: Session, skip: int = 0, limit: int = 100) -> list[Producto]:
-    """Obtener lista de productos con paginación"""
-    return db.query(Producto).offset(skip).limit(limit).all()
+def get_productos_activos(db: Session) -> list[Producto]:
+    """Obtener solo productos activos (catálogo en caché)"""
+    return cached_models(
+        db, (PRODUCTOS, "activos"), lambda s: s.scalars(SELECT_PRODUCTOS_ACTIVOS)
+    )
 
 
-def get_productos_activos(db: Session) -> list[Producto]:
-    """Obtener solo productos activos"""
-    return db.query(Producto).filter(Producto.activo).all()
+def get_productos_activos_rows(
+    db: Session, columns: tuple[ColumnElement, ...]
+) -> Sequence[Row]:
+    """Listado de productos activos como filas Core con solo `columns`"""
+    return cached_rows(
+        db,
+        rows_key(PRODUCTOS, "activos", columns),
+        lambda s: fetch_rows(s, SELECT_PRODUCTOS_ACTIVOS, {}, columns),
+    )
 
 
 def get_productos_por_categoria(db: Session, categoria: str) -> list[Producto]:
-    """Obtener productos por categoría"""
-    return db.query(Producto).filter(Producto.categoria == categoria).all()
+    """Obtener productos por categoría (catálogo en caché)"""
+    return cached_models(
+        db,
+        (PRODUCTOS, "categoria", categoria),
+        lambda s: s.scalars(SELECT_PRODUCTOS_POR_CATEGORIA, {"categoria": categoria}),
+    )
+
+
+def stream_productos_activos(
+    db: Session, yield_per: int = 1000
+) -> Iterator[Sequence[Producto]]:
+    """Productos activos, en bloques de `yield_per` filas"""
+    yield from db.scalars(
+        SELECT_PRODUCTOS_ACTIVOS, execution_options={"yield_per": yield_per}
+    ).partitions()
+
+
+def stream_productos_por_categoria(
+    db: Session, categoria: str, yield_per: int = 1000
+) -> Iterator[Sequence[Producto]]:
+    """Productos por categoría, en bloques de `yield_per` filas"""
+    yield from db.scalars(
+        SELECT_PRODUCTOS_POR_CATEGORIA,
+        {"categoria": categoria},
+        execution_options={"yield_per": yield_per},
+    ).partitions()
 
 
 def create_producto(db: Session, *, producto_in: ProductoCreate) -> Producto:
@@ -45,6 +129,7 @@ def create_producto(db: Session, *, producto_in: ProductoCreate) -> Producto:
     )
     db.add(db_producto)
     db.commit()
+    invalidate_catalog(PRODUCTOS)
     db.refresh(db_producto)
     return db_producto
 
@@ -60,13 +145,15 @@ def update_producto(
 
     db.add(db_producto)
     db.commit()
+    invalidate_catalog(PRODUCTOS)
     db.refresh(db_producto)
     return db_producto
 
 
 def delete_producto(db: Session, *, producto_id: int) -> Producto:
     """Eliminar un producto"""
-    producto = db.query(Producto).filter(Producto.id == producto_id).first()
+    producto = db.get(Producto, producto_id)
     db.delete(producto)
     db.commit()
+    invalidate_catalog(PRODUCTOS)
     return producto
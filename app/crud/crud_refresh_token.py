@@ -0,0 +1,99 @@
+"""
+Operaciones CRUD para los tokens de refresco
+"""
+
+import secrets
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import ColumnElement, bindparam, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import get_settings
+from app.core.security import (
+    create_refresh_token as generate_refresh_token,
+    hash_refresh_token,
+)
+from app.models.refresh_token import RefreshToken
+
+SELECT_REFRESH_TOKEN = select(RefreshToken).where(
+    RefreshToken.token_hash == bindparam("token_hash")
+)
+
+
+def _ahora() -> datetime:
+    # Columnas DateTime sin zona: se guarda y compara en UTC
+    return datetime.now(UTC).replace(tzinfo=None)
+
+
+def create_refresh_token(
+    db: Session, *, usuario_id: int, familia: str | None = None
+) -> str:
+    """Emitir un token de refresco (nueva familia si no se indica)"""
+    token, token_hash = generate_refresh_token()
+    db.add(
+        RefreshToken(
+            usuario_id=usuario_id,
+            token_hash=token_hash,
+            familia=familia or secrets.token_hex(16),
+            expira=_ahora() + timedelta(days=get_settings().REFRESH_TOKEN_EXPIRE_DAYS),
+        )
+    )
+    db.commit()
+    return token
+
+
+def rotate_refresh_token(db: Session, *, token: str) -> tuple[int, str] | None:
+    """
+    Canjear un token de refresco por uno nuevo de la misma familia
+
+    Returns:
+        (id del usuario, nuevo token) o None si no es válido. Un token ya
+        canjeado indica robo: se revoca toda su familia.
+    """
+    registro = db.scalars(
+        SELECT_REFRESH_TOKEN, {"token_hash": hash_refresh_token(token)}
+    ).first()
+    ahora = _ahora()
+    if registro is None or registro.expira <= ahora:
+        return None
+    # Revocación condicional: de dos canjes simultáneos solo uno gana
+    resultado = db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == registro.id, RefreshToken.revocado.is_(None))
+        .values(revocado=ahora)
+    )
+    if resultado.rowcount != 1:
+        db.rollback()
+        _revoke_where(db, RefreshToken.familia == registro.familia)
+        return None
+    db.commit()
+    nuevo = create_refresh_token(
+        db, usuario_id=registro.usuario_id, familia=registro.familia
+    )
+    return registro.usuario_id, nuevo
+
+
+def revoke_refresh_token(db: Session, *, token: str) -> bool:
+    """Revocar la familia del token (cierre de sesión en ese dispositivo)"""
+    registro = db.scalars(
+        SELECT_REFRESH_TOKEN, {"token_hash": hash_refresh_token(token)}
+    ).first()
+    if registro is None:
+        return False
+    _revoke_where(db, RefreshToken.familia == registro.familia)
+    return True
+
+
+def revoke_usuario_refresh_tokens(db: Session, *, usuario_id: int) -> int:
+    """Revocar todas las sesiones del usuario; devuelve cuántas había activas"""
+    return _revoke_where(db, RefreshToken.usuario_id == usuario_id)
+
+
+def _revoke_where(db: Session, condicion: ColumnElement[bool]) -> int:
+    resultado = db.execute(
+        update(RefreshToken)
+        .where(condicion, RefreshToken.revocado.is_(None))
+        .values(revocado=_ahora())
+    )
+    db.commit()
+    return resultado.rowcount
@@ -2,32 +2,98 @@
 Operaciones CRUD para el modelo Tarifa
 """
 
-from typing import Optional
+from collections.abc import Sequence
 
+from sqlalchemy import ColumnElement, Row, bindparam, select
 from sqlalchemy.orm import Session
 
+from app.crud.catalog_cache import (
+    TARIFAS,
+    cached_models,
+    cached_rows,
+    invalidate_catalog,
+    rows_key,
+)
+from app.crud.projection import fetch_rows
 from app.models.tarifa import Tarifa
 from app.schemas.tarifa import TarifaCreate, TarifaUpdate
 
+SELECT_TARIFAS = (
+    select(Tarifa)
+    .order_by(Tarifa.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+SELECT_TARIFAS_AFTER = (
+    select(Tarifa)
+    .where(Tarifa.id > bindparam("after_id"))
+    .order_by(Tarifa.id)
+    .limit(bindparam("limit"))
+)
+SELECT_TARIFAS_ACTIVAS = select(Tarifa).where(Tarifa.activa.is_(True))
+SELECT_TARIFAS_POR_TIPO_HABITACION = select(Tarifa).where(
+    Tarifa.tipo_habitacion == bindparam("tipo_habitacion")
+)
+
 
 def get_tarifa(db: Session, tarifa_id: int) -> Tarifa | None:
     """Obtener una tarifa por ID"""
-    return db.query(Tarifa).filter(Tarifa.id == tarifa_id).first()
+    return db.get(Tarifa, tarifa_id)
+
+
+def get_tarifas(
+    db: Session, skip: int = 0, limit: int = 100, after_id: int | None = None
+) -> list[Tarifa]:
+    """Obtener lista de tarifas con paginación (offset o a partir de `after_id`)"""
+    if after_id is not None:
+        return list(
+            db.scalars(SELECT_TARIFAS_AFTER, {"after_id": after_id, "limit": limit})
+        )
+    return list(db.scalars(SELECT_TARIFAS, {"skip": skip, "limit": limit}))
+
+
+def get_tarifas_rows(
+    db: Session,
+    columns: tuple[ColumnElement, ...],
+    skip: int = 0,
+    limit: int = 100,
+    after_id: int | None = None,
+) -> Sequence[Row]:
+    """Listado de tarifas como filas Core con solo `columns`"""
+    if after_id is not None:
+        return fetch_rows(
+            db, SELECT_TARIFAS_AFTER, {"after_id": after_id, "limit": limit}, columns
+        )
+    return fetch_rows(db, SELECT_TARIFAS, {"skip": skip, "limit": limit}, columns)
 
 
-def get_tarifas(db: Session, skip: int = 0, limit: int = 100) -> list[Tarifa]:
-    """Obtener lista de tarifas con paginación"""
-    return db.query(Tarifa).offset(skip).limit(limit).all()
+def get_tarifas_activas(db: Session) -> list[Tarifa]:
+    """Obtener solo tarifas activas (catálogo en caché)"""
+    return cached_models(
+        db, (TARIFAS, "activas"), lambda s: s.scalars(SELECT_TARIFAS_ACTIVAS)
+    )
 
 
-def get_tarifas_activas(db: Session) -> list[Tarifa]:
-    """Obtener solo tarifas activas"""
-    return db.query(Tarifa).filter(Tarifa.activa.is_(True)).all()
+def get_tarifas_activas_rows(
+    db: Session, columns: tuple[ColumnElement, ...]
+) -> Sequence[Row]:
+    """Listado de tarifas activas como filas Core con solo `columns`"""
+    return cached_rows(
+        db,
+        rows_key(TARIFAS, "activas", columns),
+        lambda s: fetch_rows(s, SELECT_TARIFAS_ACTIVAS, {}, columns),
+    )
 
 
 def get_tarifas_por_tipo_habitacion(db: Session, tipo_habitacion: str) -> list[Tarifa]:
-    """Obtener tarifas por tipo de habitación"""
-    return db.query(Tarifa).filter(Tarifa.tipo_habitacion == tipo_habitacion).all()
+    """Obtener tarifas por tipo de habitación (catálogo en caché)"""
+    return cached_models(
+        db,
+        (TARIFAS, "tipo_habitacion", tipo_habitacion),
+        lambda s: s.scalars(
+            SELECT_TARIFAS_POR_TIPO_HABITACION, {"tipo_habitacion": tipo_habitacion}
+        ),
+    )
 
 
 def create_tarifa(db: Session, *, tarifa_in: TarifaCreate) -> Tarifa:
@@ -45,6 +111,7 @@ def create_tarifa(db: Session, *, tarifa_in: TarifaCreate) -> Tarifa:
     )
     db.add(db_tarifa)
     db.commit()
+    invalidate_catalog(TARIFAS)
     db.refresh(db_tarifa)
     return db_tarifa
 
@@ -58,13 +125,15 @@ def update_tarifa(db: Session, *, db_tarifa: Tarifa, tarifa_in: TarifaUpdate) ->
 
     db.add(db_tarifa)
     db.commit()
+    invalidate_catalog(TARIFAS)
     db.refresh(db_tarifa)
     return db_tarifa
 
 
 def delete_tarifa(db: Session, *, tarifa_id: int) -> Tarifa:
     """Eliminar una tarifa"""
-    tarifa = db.query(Tarifa).filter(Tarifa.id == tarifa_id).first()
+    tarifa = db.get(Tarifa, tarifa_id)
     db.delete(tarifa)
     db.commit()
+    invalidate_catalog(TARIFAS)
     return tarifa
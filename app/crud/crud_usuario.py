@@ -2,28 +2,101 @@
 Operaciones CRUD para el modelo Usuario
 """
 
-from typing import Optional
-
+import anyio
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
 
-from app.core.security import get_password_hash, verify_password
+from app.core.cache import MISSING, SharedCache, TTLCache
+from app.core.cache_backends import CacheBackendError, get_backend
+from app.core.config import get_settings
+from app.core.logging import get_logger
+from app.core.password_pool import PasswordPoolBusyError
+from app.core.revocation import revoke_user_tokens
+from app.core.security import (
+    get_password_hash,
+    verify_and_update_password,
+    verify_and_update_password_async,
+)
+from app.crud.catalog_cache import detached_copy
+from app.crud.crud_refresh_token import revoke_usuario_refresh_tokens
 from app.models.usuario import Usuario
 from app.schemas.usuario import UsuarioCreate, UsuarioUpdate
 
+logger = get_logger(__name__)
+
+SELECT_USUARIO_BY_EMAIL = select(Usuario).where(Usuario.email == bindparam("email"))
+SELECT_USUARIOS = (
+    select(Usuario)
+    .order_by(Usuario.id)
+    .offset(bindparam("skip"))
+    .limit(bindparam("limit"))
+)
+SELECT_USUARIOS_AFTER = (
+    select(Usuario)
+    .where(Usuario.id > bindparam("after_id"))
+    .order_by(Usuario.id)
+    .limit(bindparam("limit"))
+)
+
+USUARIOS = "usuarios"
+
+# Campos del usuario que viajan como claims en el token de acceso
+TOKEN_CLAIM_FIELDS = ("is_active", "is_superuser", "puesto")
+
+# Usuarios autenticados resueltos por get_current_user, por email (el `sub`
+# del token). Los valores no salen del proceso (contienen el hash de la
+# contraseña); el almacén compartido solo difunde las invalidaciones.
+user_cache = SharedCache(
+    TTLCache(
+        maxsize=get_settings().USER_CACHE_MAXSIZE,
+        ttl=get_settings().USER_CACHE_TTL,
+    ),
+    get_backend(),
+    check_interval=get_settings().CACHE_VERSION_CHECK_INTERVAL,
+    share_values=False,
+)
+
 
 def get_usuario(db: Session, usuario_id: int) -> Usuario | None:
     """Obtener un usuario por ID"""
-    return db.query(Usuario).filter(Usuario.id == usuario_id).first()
+    return db.get(Usuario, usuario_id)
 
 
 def get_usuario_by_email(db: Session, email: str) -> Usuario | None:
     """Obtener un usuario por email"""
-    return db.query(Usuario).filter(Usuario.email == email).first()
+    return db.scalars(SELECT_USUARIO_BY_EMAIL, {"email": email}).first()
+
+
+def get_usuario_snapshot(db: Session, email: str) -> Usuario | None:
+    """
+    Usuario por email desde la caché de autenticación
+
+    Devuelve una copia desligada de la sesión: solo lectura. Los emails que no
+    existen no se cachean.
+    """
+    if not get_settings().USER_CACHE_ENABLED:
+        return get_usuario_by_email(db, email)
+    usuario, version, generacion = user_cache.lookup((USUARIOS, email))
+    if usuario is MISSING:
+        encontrado = get_usuario_by_email(db, email)
+        if encontrado is None:
+            return None
+        usuario = detached_copy(encontrado)
+        user_cache.store((USUARIOS, email), usuario, version, generacion)
+    return usuario
 
 
-def get_usuarios(db: Session, skip: int = 0, limit: int = 100) -> list[Usuario]:
-    """Obtener lista de usuarios con paginación"""
-    return db.query(Usuario).offset(skip).limit(limit).all()
+def get_usuarios(
+    db: Session, skip: int = 0, limit: int = 100, after_id: int | None = None
+) -> list[Usuario]:
+    """Obtener lista de usuarios con paginación (offset o a partir de `after_id`)"""
+    if after_id is not None:
+        return list(
+            db.scalars(SELECT_USUARIOS_AFTER, {"after_id": after_id, "limit": limit})
+        )
+    return list(db.scalars(SELECT_USUARIOS, {"skip": skip, "limit": limit}))
 
 
 def create_usuario(db: Session, *, usuario_in: UsuarioCreate) -> Usuario:
@@ -52,6 +125,13 @@ def update_usuario(
     """Actualizar un usuario existente"""
     update_data = usuario_in.model_dump(exclude_unset=True)
 
+    # Campos firmados en los tokens de acceso: si cambian, se revocan
+    cambian_claims = any(
+        campo in update_data and update_data[campo] != getattr(db_usuario, campo)
+        for campo in TOKEN_CLAIM_FIELDS
+    )
+    cierra_sesiones = "password" in update_data or update_data.get("is_active") is False
+
     # Si se actualiza la contraseña, hashearla
     if "password" in update_data:
         hashed_password = get_password_hash(update_data["password"])
@@ -63,6 +143,11 @@ def update_usuario(
 
     db.add(db_usuario)
     db.commit()
+    user_cache.invalidate(USUARIOS)
+    if cierra_sesiones:
+        revoke_usuario_refresh_tokens(db, usuario_id=db_usuario.id)
+    if cambian_claims or cierra_sesiones:
+        _revoke_access_tokens(db_usuario.id)
     db.refresh(db_usuario)
     return db_usuario
 
@@ -75,26 +160,110 @@ def authenticate_usuario(db: Session, *, email: str, password: str) -> Usuario |
             return None
         # Manejar posibles errores de encoding en la contraseña hasheada
         try:
-            if not verify_password(password, usuario.hashed_password):
-                return None
+            valida, nuevo_hash = verify_and_update_password(
+                password, usuario.hashed_password
+            )
         except (UnicodeDecodeError, UnicodeEncodeError) as e:
             print(f"Error de encoding en contraseña para usuario {email}: {e}")
             return None
+        if not valida:
+            return None
+        if nuevo_hash:
+            upgrade_password_hash(db, usuario=usuario, hashed_password=nuevo_hash)
         return usuario
     except (UnicodeDecodeError, UnicodeEncodeError) as e:
         print(f"Error de encoding al buscar usuario {email}: {e}")
         return None
+    except PasswordPoolBusyError:
+        raise
     except Exception as e:
         print(f"Error inesperado en authenticate_usuario: {e}")
         return None
 
 
+async def authenticate_usuario_async(
+    db: Session, *, email: str, password: str
+) -> Usuario | None:
+    """Autenticar usuario; bcrypt se espera en el pool, sin ocupar un hilo"""
+
+    def buscar() -> Usuario | None:
+        usuario = get_usuario_by_email(db=db, email=email)
+        # Se devuelve la conexión al pool antes de esperar a bcrypt: si no, un
+        # pico de logins agota las conexiones y el resto de endpoints espera
+        if usuario is not None:
+            db.expunge(usuario)
+        db.rollback()
+        return usuario
+
+    usuario = await anyio.to_thread.run_sync(buscar)
+    if not usuario:
+        return None
+    try:
+        valida, nuevo_hash = await verify_and_update_password_async(
+            password, usuario.hashed_password
+        )
+    except (UnicodeDecodeError, UnicodeEncodeError, ValueError) as e:
+        logger.warning(
+            "No se pudo verificar la contraseña del usuario %s: %s", usuario.id, e
+        )
+        return None
+    if not valida:
+        return None
+    if nuevo_hash:
+        await anyio.to_thread.run_sync(
+            lambda: upgrade_password_hash(
+                db, usuario=usuario, hashed_password=nuevo_hash
+            )
+        )
+    return usuario
+
+
+def upgrade_password_hash(
+    db: Session, *, usuario: Usuario, hashed_password: str
+) -> bool:
+    """
+    Guardar el hash regenerado en el login (esquema o coste actualizados)
+
+    Solo se escribe si el hash no cambió entretanto (otro login o un cambio
+    de contraseña); un fallo no impide el login, se reintenta en el siguiente.
+    """
+    try:
+        resultado = db.execute(
+            update(Usuario)
+            .where(
+                Usuario.id == usuario.id,
+                Usuario.hashed_password == usuario.hashed_password,
+            )
+            .values(hashed_password=hashed_password)
+        )
+        db.commit()
+    except SQLAlchemyError:
+        db.rollback()
+        logger.exception("No se pudo actualizar el hash del usuario %s", usuario.id)
+        return False
+    user_cache.invalidate(USUARIOS)
+    set_committed_value(usuario, "hashed_password", hashed_password)
+    return resultado.rowcount == 1
+
+
 def delete_usuario(db: Session, *, usuario_id: int) -> Usuario | None:
     """Eliminar un usuario (soft delete - marcar como inactivo)"""
-    db_usuario = db.query(Usuario).filter(Usuario.id == usuario_id).first()
+    db_usuario = db.get(Usuario, usuario_id)
     if db_usuario:
         db_usuario.is_active = False
         db.add(db_usuario)
         db.commit()
+        user_cache.invalidate(USUARIOS)
+        revoke_usuario_refresh_tokens(db, usuario_id=usuario_id)
+        _revoke_access_tokens(usuario_id)
         db.refresh(db_usuario)
     return db_usuario
+
+
+def _revoke_access_tokens(usuario_id: int) -> None:
+    # Sin almacén no hay revocación, pero get_current_claims tampoco confía
+    # en los claims mientras no responde
+    try:
+        revoke_user_tokens(usuario_id)
+    except CacheBackendError:
+        logger.exception("No se pudieron revocar los tokens del usuario %s", usuario_id)
@@ -0,0 +1,55 @@
+"""
+Lectura por bloques de tablas completas para las exportaciones
+
+Se leen filas Core (sin objetos ORM ni identity map) con `yield_per`: en
+PostgreSQL es un cursor del lado del servidor, un viaje a la base por bloque,
+y la memoria pico depende del tamaño del bloque y no del rango exportado.
+"""
+
+from collections.abc import Iterator, Sequence
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+
+from sqlalchemy import DateTime, Row, Select, bindparam, select
+from sqlalchemy.orm import Session
+
+from app.db.base_class import Base
+
+
+@lru_cache
+def export_statement(model: type[Base], date_column: str) -> Select:
+    """Todas las columnas del modelo con `date_column` en [desde, hasta)"""
+    tabla = model.__table__
+    fecha = tabla.c[date_column]
+    return (
+        select(*tabla.c)
+        .where(fecha >= bindparam("desde"), fecha < bindparam("hasta"))
+        .order_by(tabla.c.id)
+    )
+
+
+def _bounds(
+    model: type[Base], date_column: str, desde: date, hasta: date
+) -> tuple[date, date]:
+    # Rango de días inclusivo; en columnas DateTime se compara con medianoche
+    inicio, fin = desde, hasta + timedelta(days=1)
+    if isinstance(model.__table__.c[date_column].type, DateTime):
+        return datetime.combine(inicio, time.min), datetime.combine(fin, time.min)
+    return inicio, fin
+
+
+def stream_export_rows(
+    db: Session,
+    model: type[Base],
+    date_column: str,
+    desde: date,
+    hasta: date,
+    yield_per: int = 1000,
+) -> Iterator[Sequence[Row]]:
+    """Filas del modelo entre `desde` y `hasta` (inclusive), por bloques"""
+    inicio, fin = _bounds(model, date_column, desde, hasta)
+    yield from db.execute(
+        export_statement(model, date_column),
+        {"desde": inicio, "hasta": fin},
+        execution_options={"yield_per": yield_per},
+    ).partitions()
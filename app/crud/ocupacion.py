@@ -0,0 +1,197 @@
+"""
+Calendario de ocupación: matriz habitaciones × días
+
+Los hospedajes del rango se leen en una sola consulta. Con NumPy (extra
+opcional `reportes`) se rellena una matriz booleana con sumas acumuladas de
+inicios y salidas, sin recorrer los días; sin NumPy se fusionan los
+intervalos de cada habitación. Ambas rutas devuelven lo mismo, por
+habitación y en uno de dos formatos compactos:
+
+- "rle": tramos ocupados `[dia_inicio, noches]`, con días contados desde
+  `desde`.
+- "bits": una cadena base64 con un bit por día (el bit más significativo del
+  primer byte es `desde`).
+"""
+
+import base64
+from collections.abc import Iterable, Sequence
+from datetime import date
+from typing import Any, Literal
+
+from sqlalchemy import Row, String, bindparam, cast, select
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import FunctionElement
+
+from app.crud.crud_hospedaje import overlaps
+from app.models.habitacion import Habitacion
+from app.models.hospedaje import Hospedaje
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - dependencia opcional
+    np = None
+
+FormatoOcupacion = Literal["rle", "bits"]
+
+
+class FechaIso(FunctionElement):
+    """Fecha como texto ISO 8601 (YYYY-MM-DD), sin depender del dialecto"""
+
+    type = String()
+    name = "fecha_iso"
+    inherit_cache = True
+
+
+@compiles(FechaIso)
+def _fecha_iso(element: FechaIso, compiler: Any, **kw: Any) -> str:
+    # SQLite guarda las fechas como texto ISO
+    (columna,) = element.clauses
+    return compiler.process(cast(columna, String), **kw)
+
+
+@compiles(FechaIso, "postgresql")
+def _fecha_iso_postgresql(element: FechaIso, compiler: Any, **kw: Any) -> str:
+    # El CAST a texto seguiría el DateStyle de la sesión
+    (columna,) = element.clauses
+    return f"to_char({compiler.process(columna, **kw)}, 'YYYY-MM-DD')"
+
+
+SELECT_NUMEROS = select(Habitacion.numero).order_by(Habitacion.numero)
+# El filtro por estado deja fuera el histórico (check_out, cancelado)
+SELECT_ESTANCIAS = select(
+    Hospedaje.numero_habitacion,
+    # Fechas como texto ISO: se convierten por bloques, sin un objeto date por
+    # fila (miles de objetos vivos disparan recolecciones del GC)
+    FechaIso(Hospedaje.fecha_check_in),
+    FechaIso(Hospedaje.fecha_check_out),
+).where(overlaps(bindparam("desde"), bindparam("hasta")))
+
+
+def _numeros(db: Session, tipo: str | None) -> list[str]:
+    sentencia = SELECT_NUMEROS
+    if tipo is not None:
+        sentencia = sentencia.where(Habitacion.tipo == tipo)
+    return list(db.scalars(sentencia))
+
+
+def _estancias(
+    db: Session, desde: date, hasta: date, yield_per: int
+) -> Iterable[Sequence[Row]]:
+    return db.execute(
+        SELECT_ESTANCIAS,
+        {"desde": desde, "hasta": hasta},
+        execution_options={"yield_per": yield_per},
+    ).partitions()
+
+
+def occupancy_matrix(
+    numeros: list[str],
+    bloques: Iterable[Sequence[Row]],
+    desde: date,
+    dias: int,
+) -> Any:
+    """Matriz booleana (habitación × día) con NumPy"""
+    # Los hospedajes de habitaciones fuera de `numeros` van a una fila extra
+    descartar = len(numeros)
+    indice = {numero: i for i, numero in enumerate(numeros)}
+    origen = np.datetime64(desde, "D")
+    delta = np.zeros((descartar + 1, dias + 1), dtype=np.int32)
+    for bloque in bloques:
+        numeros_bloque, entradas, salidas = zip(*bloque, strict=True)
+        filas = np.fromiter(
+            (indice.get(numero, descartar) for numero in numeros_bloque),
+            dtype=np.intp,
+            count=len(bloque),
+        )
+        inicios = (np.array(entradas, dtype="datetime64[D]") - origen).astype(np.intp)
+        fines = (np.array(salidas, dtype="datetime64[D]") - origen).astype(np.intp)
+        # +1 al entrar y -1 al salir: la suma acumulada cuenta los hospedajes
+        # de cada noche
+        np.add.at(delta, (filas, np.clip(inicios, 0, dias)), 1)
+        np.add.at(delta, (filas, np.clip(fines, 0, dias)), -1)
+    return np.cumsum(delta[:descartar, :dias], axis=1) > 0
+
+
+def _runs_matrix(matriz: Any) -> list[list[list[int]]]:
+    # Los cambios 0→1 y 1→0 de cada fila, en orden de fila y de columna
+    bordes = np.diff(np.pad(matriz.astype(np.int8), ((0, 0), (1, 1))), axis=1)
+    filas, inicios = np.nonzero(bordes == 1)
+    _, fines = np.nonzero(bordes == -1)
+    runs: list[list[list[int]]] = [[] for _ in range(matriz.shape[0])]
+    for fila, inicio, largo in zip(
+        filas.tolist(), inicios.tolist(), (fines - inicios).tolist(), strict=True
+    ):
+        runs[fila].append([inicio, largo])
+    return runs
+
+
+def _runs_intervals(
+    numeros: list[str],
+    bloques: Iterable[Sequence[Row]],
+    desde: date,
+    dias: int,
+) -> list[list[list[int]]]:
+    # Sin NumPy: intervalos ordenados por habitación y entrada, fusionando
+    # los que se tocan o se solapan
+    indice = {numero: i for i, numero in enumerate(numeros)}
+    base = desde.toordinal()
+    intervalos = sorted(
+        (
+            indice[numero],
+            max(date.fromisoformat(entrada).toordinal() - base, 0),
+            min(date.fromisoformat(salida).toordinal() - base, dias),
+        )
+        for bloque in bloques
+        for numero, entrada, salida in bloque
+        if numero in indice
+    )
+    runs: list[list[list[int]]] = [[] for _ in numeros]
+    for fila, inicio, fin in intervalos:
+        tramos = runs[fila]
+        if tramos and inicio <= tramos[-1][0] + tramos[-1][1]:
+            tramos[-1][1] = max(tramos[-1][1], fin - tramos[-1][0])
+        elif fin > inicio:
+            tramos.append([inicio, fin - inicio])
+    return runs
+
+
+def _bits_runs(runs: list[list[int]], dias: int) -> str:
+    bits = 0
+    for inicio, largo in runs:
+        bits |= ((1 << largo) - 1) << (dias - inicio - largo)
+    relleno = -dias % 8
+    return base64.b64encode(
+        (bits << relleno).to_bytes((dias + relleno) // 8, "big")
+    ).decode()
+
+
+def get_ocupacion(
+    db: Session,
+    desde: date,
+    hasta: date,
+    tipo: str | None = None,
+    formato: FormatoOcupacion = "rle",
+    yield_per: int = 1000,
+) -> list[tuple[str, list[list[int]] | str]]:
+    """Ocupación de cada habitación entre `desde` y `hasta` (exclusivo)"""
+    numeros = _numeros(db, tipo)
+    estancias = _estancias(db, desde, hasta, yield_per)
+    dias = (hasta - desde).days
+    if np is not None:
+        matriz = occupancy_matrix(numeros, estancias, desde, dias)
+        if formato == "bits":
+            filas = np.packbits(matriz, axis=1)
+            return [
+                (numero, base64.b64encode(fila.tobytes()).decode())
+                for numero, fila in zip(numeros, filas, strict=True)
+            ]
+        return list(zip(numeros, _runs_matrix(matriz), strict=True))
+
+    runs = _runs_intervals(numeros, estancias, desde, dias)
+    if formato == "bits":
+        return [
+            (numero, _bits_runs(tramos, dias))
+            for numero, tramos in zip(numeros, runs, strict=True)
+        ]
+    return list(zip(numeros, runs, strict=True))
@@ -0,0 +1,41 @@
+"""
+Proyección de columnas sobre las sentencias precompiladas del CRUD
+
+Permite leer un listado como filas Core (sin instanciar objetos ORM)
+reutilizando los filtros, el orden y los límites de la sentencia original.
+"""
+
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import ColumnElement, Row, Select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+
+@lru_cache(maxsize=256)
+def project(statement: Select, columns: tuple[ColumnElement, ...]) -> Select:
+    """Misma sentencia con solo `columns`, construida una vez por combinación"""
+    return statement.with_only_columns(*columns)
+
+
+def fetch_rows(
+    db: Session,
+    statement: Select,
+    params: dict[str, Any],
+    columns: tuple[ColumnElement, ...],
+) -> Sequence[Row]:
+    """Ejecutar `statement` proyectado sobre `columns` y devolver las filas"""
+    return db.execute(project(statement, columns), params).all()
+
+
+async def fetch_rows_async(
+    db: AsyncSession,
+    statement: Select,
+    params: dict[str, Any],
+    columns: tuple[ColumnElement, ...],
+) -> Sequence[Row]:
+    """Variante de `fetch_rows` para el CRUD asíncrono"""
+    result = await db.execute(project(statement, columns), params)
+    return result.all()
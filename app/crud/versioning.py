@@ -0,0 +1,37 @@
+"""
+Versión de una colección para los ETags de los listados
+
+max(fecha_actualizacion) cambia con cada alta o modificación y count(id) con
+cada baja, así que el par identifica el estado de la tabla sin leer sus filas.
+"""
+
+from datetime import datetime
+from functools import lru_cache
+
+from sqlalchemy import Select, func, select
+from sqlalchemy.orm import Session
+
+from app.db.base_class import Base
+
+
+@lru_cache
+def version_statement(model: type[Base]) -> Select:
+    """
+    Sentencia precompilada con el agregado de versión del modelo
+
+    Dos subconsultas en vez de un solo SELECT max(), count(): así el máximo
+    se lee del índice de fecha_actualizacion y count(*) usa el recuento
+    optimizado del motor (id no admite nulos, el resultado es el mismo).
+    """
+    return select(
+        select(func.max(model.fecha_actualizacion)).scalar_subquery(),
+        select(func.count()).select_from(model).scalar_subquery(),
+    )
+
+
+def get_collection_version(
+    db: Session, model: type[Base]
+) -> tuple[datetime | None, int]:
+    """Última modificación y número de filas de la tabla del modelo"""
+    ultima, total = db.execute(version_statement(model)).one()
+    return ultima, total
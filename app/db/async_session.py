@@ -0,0 +1,140 @@
+"""
+Configuración de la sesión asíncrona de base de datos con SQLAlchemy
+"""
+
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import asynccontextmanager
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.config import get_settings
+from app.db.pool_metrics import instrument_engine
+from app.db.query_stats import instrument_queries
+from app.db.session import (
+    PRIMARY_SESSION,
+    ReadOnlySession,
+    get_pool_kwargs,
+    sqlite_pragma_listener,
+)
+from app.db.slow_queries import instrument_slow_queries
+
+settings = get_settings()
+
+# Drivers asíncronos equivalentes a los drivers síncronos
+ASYNC_DRIVERS = {
+    "postgresql": "postgresql+asyncpg",
+    "postgresql+psycopg2": "postgresql+asyncpg",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def get_async_database_url(database_url: str) -> str:
+    """Derivar la URL asíncrona a partir de la URL síncrona"""
+    scheme, separator, rest = database_url.partition("://")
+    if not separator or scheme not in ASYNC_DRIVERS:
+        return database_url
+    return f"{ASYNC_DRIVERS[scheme]}://{rest}"
+
+
+def create_app_async_engine(database_url: str, name: str = "async") -> AsyncEngine:
+    """Crear el AsyncEngine con la misma configuración que el engine síncrono"""
+    pool_kwargs = get_pool_kwargs(database_url, name, base=AsyncAdaptedQueuePool)
+    if database_url.startswith("sqlite"):
+        engine = create_async_engine(
+            database_url,
+            echo=settings.DEBUG,
+            connect_args={"timeout": 20},
+            **pool_kwargs,
+        )
+        event.listen(
+            engine.sync_engine,
+            "connect",
+            sqlite_pragma_listener(settings.SQLITE_PROFILE),
+        )
+    else:
+        # asyncpg no acepta client_encoding/options como psycopg2
+        engine = create_async_engine(
+            database_url,
+            pool_pre_ping=True,
+            echo=settings.DEBUG,
+            connect_args={"server_settings": {"timezone": "utc"}},
+            **pool_kwargs,
+        )
+    instrument_engine(engine.sync_engine, name)
+    instrument_queries(engine.sync_engine)
+    instrument_slow_queries(engine.sync_engine)
+    return engine
+
+
+async_engine: AsyncEngine | None = None
+async_read_engine: AsyncEngine | None = None
+AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = None
+AsyncReadSessionLocal: async_sessionmaker[AsyncSession] | None = None
+
+# Solo se crea el engine si la ruta asíncrona está habilitada, así el driver
+# asíncrono (asyncpg/aiosqlite) no es obligatorio en despliegues síncronos
+if settings.DATABASE_ASYNC:
+    async_engine = create_app_async_engine(
+        settings.DATABASE_ASYNC_URL or get_async_database_url(settings.DATABASE_URL)
+    )
+    async_read_engine = (
+        create_app_async_engine(
+            get_async_database_url(settings.DATABASE_READ_URL), name="async_replica"
+        )
+        if settings.DATABASE_READ_URL
+        else async_engine
+    )
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+    AsyncReadSessionLocal = async_sessionmaker(
+        bind=async_read_engine,
+        autoflush=False,
+        expire_on_commit=False,
+        sync_session_class=ReadOnlySession,
+        info={PRIMARY_SESSION: AsyncSessionLocal} if settings.DATABASE_READ_URL else {},
+    )
+
+
+@asynccontextmanager
+async def async_primary_session(db: AsyncSession) -> AsyncIterator[AsyncSession]:
+    """Variante de `primary_session` para AsyncSession"""
+    factory = db.info.get(PRIMARY_SESSION)
+    if factory is None:
+        yield db
+        return
+    async with factory() as primaria:
+        yield primaria
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Generador de dependencia para obtener una sesión asíncrona de base de datos
+    Utilizada por FastAPI para los endpoints que se ejecutan en el event loop
+    """
+    if AsyncSessionLocal is None:
+        raise RuntimeError(
+            "La ruta asíncrona está deshabilitada (DATABASE_ASYNC=false)"
+        )
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Generador de dependencia para obtener una sesión asíncrona de solo lectura
+    Apunta a la réplica (DATABASE_READ_URL) si está configurada
+    """
+    if AsyncReadSessionLocal is None:
+        raise RuntimeError(
+            "La ruta asíncrona está deshabilitada (DATABASE_ASYNC=false)"
+        )
+    async with AsyncReadSessionLocal() as db:
+        yield db
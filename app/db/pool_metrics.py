@@ -0,0 +1,174 @@
+"""
+Instrumentación del pool de conexiones de SQLAlchemy
+
+Registra, por engine, el tiempo de espera en el checkout (histograma),
+conexiones en uso, overflow, invalidaciones y timeouts del pool. Los contadores
+se alimentan de los eventos del pool; la espera se mide en una subclase del
+pool configurada como `poolclass` del engine.
+"""
+
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import Pool
+
+# Límites superiores (ms) de los buckets del histograma de espera
+WAIT_BUCKETS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class WaitHistogram:
+    """Histograma acumulado de tiempos de espera en milisegundos"""
+
+    def __init__(self) -> None:
+        self.buckets = [0] * (len(WAIT_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, wait_ms: float) -> None:
+        """Registrar una observación"""
+        for i, limite in enumerate(WAIT_BUCKETS_MS):
+            if wait_ms <= limite:
+                self.buckets[i] += 1
+                break
+        else:
+            self.buckets[-1] += 1
+        self.count += 1
+        self.total_ms += wait_ms
+        self.max_ms = max(self.max_ms, wait_ms)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Representación serializable del histograma"""
+        etiquetas = [f"le_{limite}" for limite in WAIT_BUCKETS_MS] + ["le_inf"]
+        return {
+            "buckets": dict(zip(etiquetas, self.buckets, strict=True)),
+            "count": self.count,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class PoolMetrics:
+    """Métricas acumuladas de un pool de conexiones"""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.pool: Pool | None = None
+        self.wait = WaitHistogram()
+        self.checkouts = 0
+        self.checkins = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.soft_invalidations = 0
+        self.timeouts = 0
+        self._lock = threading.Lock()
+
+    def record_wait(self, wait_ms: float) -> None:
+        """Registrar el tiempo de espera de un checkout"""
+        with self._lock:
+            self.wait.observe(wait_ms)
+
+    def increment(self, counter: str) -> None:
+        """Incrementar un contador de eventos del pool"""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Estado actual del pool y contadores acumulados"""
+        with self._lock:
+            datos: dict[str, Any] = {
+                "pool_class": type(self.pool).__name__ if self.pool else None,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "connects": self.connects,
+                "invalidations": self.invalidations,
+                "soft_invalidations": self.soft_invalidations,
+                "timeouts": self.timeouts,
+                "checkout_wait_ms": self.wait.snapshot(),
+            }
+        # Solo QueuePool expone tamaño y overflow
+        if self.pool is not None and hasattr(self.pool, "checkedout"):
+            datos.update(
+                {
+                    "size": self.pool.size(),
+                    "checked_in": self.pool.checkedin(),
+                    "in_use": self.pool.checkedout(),
+                    "overflow": max(self.pool.overflow(), 0),
+                }
+            )
+        return datos
+
+
+# Registro global de métricas por nombre de engine ("primary", "async", ...)
+_registry: dict[str, PoolMetrics] = {}
+
+
+def get_pool_metrics() -> dict[str, dict[str, Any]]:
+    """Obtener una instantánea de las métricas de todos los pools"""
+    return {name: metrics.snapshot() for name, metrics in _registry.items()}
+
+
+class _WaitTimingMixin:
+    """Mide el tiempo que tarda `connect()` en entregar una conexión del pool"""
+
+    metrics: PoolMetrics
+
+    def connect(self) -> Any:
+        inicio = time.perf_counter()
+        try:
+            conexion = super().connect()  # type: ignore[misc]
+        except exc.TimeoutError:
+            self.metrics.increment("timeouts")
+            raise
+        self.metrics.record_wait((time.perf_counter() - inicio) * 1000)
+        return conexion
+
+
+def instrumented_pool_class(base: type[Pool], name: str) -> type[Pool]:
+    """
+    Crear una subclase instrumentada del pool `base` para el engine `name`
+
+    La clase conserva las métricas aunque el engine recree el pool
+    (p. ej. tras `engine.dispose()`), porque `Pool.recreate` usa la misma clase.
+    """
+    metrics = _registry.setdefault(name, PoolMetrics(name))
+    return type(
+        f"Instrumented{base.__name__}",
+        (_WaitTimingMixin, base),
+        {"metrics": metrics},
+    )
+
+
+def instrument_engine(engine: Engine, name: str) -> PoolMetrics:
+    """Registrar los listeners de eventos del pool para el engine `name`"""
+    metrics = _registry.setdefault(name, PoolMetrics(name))
+    metrics.pool = engine.pool
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(*_args: Any) -> None:
+        metrics.increment("checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(*_args: Any) -> None:
+        metrics.increment("checkins")
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(*_args: Any) -> None:
+        metrics.increment("connects")
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(*_args: Any) -> None:
+        metrics.increment("invalidations")
+
+    @event.listens_for(engine, "soft_invalidate")
+    def _on_soft_invalidate(*_args: Any) -> None:
+        metrics.increment("soft_invalidations")
+
+    @event.listens_for(engine, "engine_disposed")
+    def _on_disposed(_engine: Engine) -> None:
+        metrics.pool = engine.pool
+
+    return metrics
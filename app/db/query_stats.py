@@ -0,0 +1,103 @@
+"""
+Contador de sentencias SQL por petición y detector de N+1
+
+Los listeners `before/after_cursor_execute` del engine acumulan el número de
+sentencias y el tiempo de base de datos en el `QueryStats` activo del contexto
+(una petición HTTP o un bloque `count_queries()` en los tests).
+"""
+
+import time
+from collections import Counter
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class QueryStats:
+    """Sentencias ejecutadas y tiempo acumulado de base de datos"""
+
+    def __init__(self, parent: "QueryStats | None" = None) -> None:
+        self.count = 0
+        self.total_ms = 0.0
+        self.statements: Counter[str] = Counter()
+        # Los bloques anidados (p. ej. test + middleware) también suman al padre
+        self.parent = parent
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        """Registrar una sentencia ejecutada"""
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.statements[statement] += 1
+        if self.parent is not None:
+            self.parent.record(statement, elapsed_ms)
+
+    def repeated(self, threshold: int) -> dict[str, int]:
+        """Sentencias idénticas ejecutadas al menos `threshold` veces (N+1)"""
+        return {
+            statement: veces
+            for statement, veces in self.statements.items()
+            if veces >= threshold
+        }
+
+
+_current_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def get_current_stats() -> QueryStats | None:
+    """Obtener las estadísticas activas en el contexto actual"""
+    return _current_stats.get()
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    """Contar las sentencias ejecutadas dentro del bloque"""
+    stats = QueryStats(parent=_current_stats.get())
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+@contextmanager
+def assert_max_queries(max_queries: int) -> Iterator[QueryStats]:
+    """
+    Fallar si el bloque ejecuta más de `max_queries` sentencias
+
+    Pensado para fijar presupuestos de consultas por endpoint en los tests,
+    de modo que una regresión N+1 rompa la CI.
+    """
+    with count_queries() as stats:
+        yield stats
+    if stats.count > max_queries:
+        detalle = "\n".join(
+            f"  {veces}x {statement}"
+            for statement, veces in stats.statements.most_common()
+        )
+        raise AssertionError(
+            f"Se ejecutaron {stats.count} consultas (presupuesto: {max_queries}):\n"
+            f"{detalle}"
+        )
+
+
+def instrument_queries(engine: Engine) -> None:
+    """Registrar los listeners que alimentan el `QueryStats` activo"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn: Any, *_args: Any) -> None:
+        if _current_stats.get() is not None:
+            conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn: Any, _cursor: Any, statement: str, *_args: Any):
+        stats = _current_stats.get()
+        if stats is None or not conn.info.get("query_start"):
+            return
+        inicio = conn.info["query_start"].pop()
+        stats.record(statement, (time.perf_counter() - inicio) * 1000)
@@ -2,49 +2,162 @@
 Configuración de la sesión de base de datos con SQLAlchemy
 """
 
-from collections.abc import Generator
+from collections.abc import Callable, Generator, Iterator
+from contextlib import contextmanager
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import Pool, QueuePool
 
 from app.core.config import get_settings
+from app.db.pool_metrics import instrument_engine, instrumented_pool_class
+from app.db.query_stats import instrument_queries
+from app.db.slow_queries import instrument_slow_queries
 
 settings = get_settings()
 
-# Configuración del engine de SQLAlchemy
-if settings.DATABASE_URL.startswith("sqlite"):
-    # Configuración específica para SQLite con UTF-8
-    engine = create_engine(
-        settings.DATABASE_URL,
-        pool_pre_ping=True,
-        echo=settings.DEBUG,
-        connect_args={
-            "check_same_thread": False,
-            # Garantizar UTF-8 en SQLite
-            "timeout": 20,
-        },
-    )
-    # Configurar SQLite para UTF-8
-    from sqlalchemy import event
-
-    @event.listens_for(engine, "connect")
+
+def is_memory_sqlite(database_url: str) -> bool:
+    """Indica si la URL apunta a una base SQLite en memoria (sin QueuePool)"""
+    _, _, database = database_url.partition(":///")
+    return database_url.startswith("sqlite") and database in ("", ":memory:")
+
+
+def get_pool_kwargs(
+    database_url: str, name: str, base: type[Pool] = QueuePool
+) -> dict[str, Any]:
+    """Parámetros del pool configurados en Settings para un engine"""
+    if is_memory_sqlite(database_url):
+        return {}
+    return {
+        "poolclass": instrumented_pool_class(base, name),
+        "pool_size": settings.DATABASE_POOL_SIZE,
+        "max_overflow": settings.DATABASE_MAX_OVERFLOW,
+        "pool_timeout": settings.DATABASE_POOL_TIMEOUT,
+        "pool_recycle": settings.DATABASE_POOL_RECYCLE,
+    }
+
+
+def get_sqlite_pragmas(profile: str) -> list[str]:
+    """PRAGMAs a ejecutar en cada conexión SQLite según el perfil"""
+    pragmas = ["PRAGMA encoding = 'UTF-8'", "PRAGMA foreign_keys=ON"]
+    if profile == "sqlite-performance":
+        pragmas += [
+            # Los lectores no bloquean al escritor ni viceversa
+            "PRAGMA journal_mode=WAL",
+            # En WAL solo se hace fsync en los checkpoints, no en cada commit
+            "PRAGMA synchronous=NORMAL",
+            f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}",
+            f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE_MB * 1024 * 1024}",
+            f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+            "PRAGMA temp_store=MEMORY",
+        ]
+    return pragmas
+
+
+def sqlite_pragma_listener(profile: str) -> Callable[..., None]:
+    """Crear el listener de `connect` que aplica los PRAGMAs del perfil"""
+    pragmas = get_sqlite_pragmas(profile)
+
     def set_sqlite_pragma(dbapi_connection, _connection_record):
+        """Configurar SQLite para UTF-8, claves foráneas y el perfil elegido"""
         cursor = dbapi_connection.cursor()
-        cursor.execute("PRAGMA encoding = 'UTF-8'")
-        cursor.execute("PRAGMA foreign_keys=ON")
+        for pragma in pragmas:
+            cursor.execute(pragma)
         cursor.close()
 
-else:
-    # Configuración para PostgreSQL con UTF-8
-    engine = create_engine(
-        settings.DATABASE_URL,
-        pool_pre_ping=True,
-        echo=settings.DEBUG,
-        connect_args={"client_encoding": "utf8", "options": "-c timezone=utc"},
-    )
+    return set_sqlite_pragma
+
+
+def create_app_engine(
+    database_url: str, name: str = "primary", sqlite_profile: str | None = None
+) -> Engine:
+    """Crear un engine con la configuración de la aplicación e instrumentarlo"""
+    if database_url.startswith("sqlite"):
+        # Configuración específica para SQLite con UTF-8
+        engine = create_engine(
+            database_url,
+            pool_pre_ping=True,
+            echo=settings.DEBUG,
+            connect_args={
+                "check_same_thread": False,
+                # Garantizar UTF-8 en SQLite
+                "timeout": 20,
+            },
+            **get_pool_kwargs(database_url, name),
+        )
+        # Configurar SQLite para UTF-8 y el perfil de rendimiento
+        event.listen(
+            engine,
+            "connect",
+            sqlite_pragma_listener(sqlite_profile or settings.SQLITE_PROFILE),
+        )
+    else:
+        # Configuración para PostgreSQL con UTF-8
+        engine = create_engine(
+            database_url,
+            pool_pre_ping=True,
+            echo=settings.DEBUG,
+            connect_args={"client_encoding": "utf8", "options": "-c timezone=utc"},
+            **get_pool_kwargs(database_url, name),
+        )
+    instrument_engine(engine, name)
+    instrument_queries(engine)
+    instrument_slow_queries(engine)
+    return engine
+
+
+# Clave de Session.info con la fábrica de sesiones del primario
+PRIMARY_SESSION = "primary_session"
+
+
+class ReadOnlySession(Session):
+    """Sesión para la réplica de lectura: rechaza cualquier flush con cambios"""
+
+
+@event.listens_for(ReadOnlySession, "before_flush")
+def block_replica_flush(session: Session, _flush_context, _instances) -> None:
+    """Impedir escrituras a través de una sesión de solo lectura"""
+    if session.new or session.dirty or session.deleted:
+        raise RuntimeError("La sesión de réplica es de solo lectura")
+
+
+# Configuración del engine de SQLAlchemy
+engine = create_app_engine(settings.DATABASE_URL)
+
+# Réplica de lectura opcional; sin DATABASE_READ_URL se lee del primario
+read_engine = (
+    create_app_engine(settings.DATABASE_READ_URL, name="replica")
+    if settings.DATABASE_READ_URL
+    else engine
+)
 
 # Configuración del session maker
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Con réplica, sus sesiones saben abrir una del primario (ver primary_session)
+ReadSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=read_engine,
+    class_=ReadOnlySession,
+    info={PRIMARY_SESSION: SessionLocal} if settings.DATABASE_READ_URL else {},
+)
+
+
+@contextmanager
+def primary_session(db: Session) -> Iterator[Session]:
+    """
+    Sesión que lee del primario: `db` si ya lo hace o, si `db` lee de la
+    réplica, una sesión nueva del primario que se cierra al salir
+    """
+    factory = db.info.get(PRIMARY_SESSION)
+    if factory is None:
+        yield db
+        return
+    with factory() as primaria:
+        yield primaria
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -57,3 +170,15 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+def get_read_db() -> Generator[Session, None, None]:
+    """
+    Generador de dependencia para obtener una sesión de solo lectura
+    Apunta a la réplica (DATABASE_READ_URL) si está configurada
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -0,0 +1,156 @@
+"""
+Registro de consultas lentas con captura automática del plan (EXPLAIN)
+
+Las sentencias que superan SLOW_QUERY_THRESHOLD_MS se escriben en el log y en
+un buffer circular en memoria (legible desde /api/v1/admin/consultas-lentas)
+con la SQL, los parámetros redactados, la ruta del endpoint y la duración.
+En DEBUG se adjunta además el plan de ejecución (EXPLAIN QUERY PLAN en SQLite).
+"""
+
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.core.config import get_settings
+from app.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+# Fragmentos de nombres de parámetro cuyo valor nunca se registra
+SENSITIVE_PARAMS = ("password", "token", "secret", "email", "telefono", "documento")
+# Solo se pide el plan de sentencias que EXPLAIN puede analizar sin efectos
+EXPLAINABLE = ("SELECT", "WITH", "UPDATE", "DELETE")
+MAX_PARAM_LENGTH = 100
+EXPLAIN_SAVEPOINT = "slow_query_plan"
+
+_request_path: ContextVar[str | None] = ContextVar("slow_query_path", default=None)
+_lock = threading.Lock()
+_entries: deque[dict[str, Any]] = deque(maxlen=get_settings().SLOW_QUERY_LOG_SIZE)
+
+
+def set_request_path(path: str | None) -> None:
+    """Asociar las consultas del contexto actual a la ruta de un endpoint"""
+    _request_path.set(path)
+
+
+def get_slow_queries(limit: int | None = None) -> list[dict[str, Any]]:
+    """Entradas del buffer, de la más reciente a la más antigua"""
+    with _lock:
+        entradas = list(reversed(_entries))
+    return entradas[:limit] if limit else entradas
+
+
+def clear_slow_queries() -> None:
+    """Vaciar el buffer de consultas lentas"""
+    with _lock:
+        _entries.clear()
+
+
+def _redact_value(name: str | None, value: Any) -> Any:
+    # Sin nombre conocido no se puede descartar que el texto sea sensible
+    if name is None and isinstance(value, str | bytes):
+        return "***"
+    if name and any(sensible in name.lower() for sensible in SENSITIVE_PARAMS):
+        return "***"
+    if isinstance(value, str | bytes) and len(value) > MAX_PARAM_LENGTH:
+        return f"{value[:MAX_PARAM_LENGTH]!r}... ({len(value)} caracteres)"
+    return value if isinstance(value, int | float | bool | None) else str(value)
+
+
+def redact_parameters(parameters: Any, context: Any, executemany: bool) -> Any:
+    """Parámetros ligados con los valores sensibles ocultos"""
+    if executemany and parameters:
+        return {
+            "primer_lote": redact_parameters(parameters[0], context, False),
+            "lotes": len(parameters),
+        }
+    if isinstance(parameters, dict):
+        return {k: _redact_value(k, v) for k, v in parameters.items()}
+    # Parámetros posicionales (qmark/format): recuperar los nombres compilados
+    nombres = getattr(getattr(context, "compiled", None), "positiontup", None) or []
+    return [
+        _redact_value(nombres[i] if i < len(nombres) else None, valor)
+        for i, valor in enumerate(parameters or ())
+    ]
+
+
+def _explain(conn: Any, statement: str, parameters: Any) -> list[str] | str:
+    """
+    Obtener el plan de ejecución por el cursor DBAPI (sin disparar eventos)
+
+    Se ejecuta en la transacción de la petición dentro de un SAVEPOINT: en
+    PostgreSQL un EXPLAIN fallido abortaría la transacción, así que si falla
+    solo se deshace el SAVEPOINT.
+    """
+    prefijo = "EXPLAIN QUERY PLAN " if conn.dialect.name == "sqlite" else "EXPLAIN "
+    try:
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            cursor.execute(f"SAVEPOINT {EXPLAIN_SAVEPOINT}")
+            try:
+                cursor.execute(prefijo + statement, parameters)
+                return [str(fila[-1]) for fila in cursor.fetchall()]
+            except Exception:
+                cursor.execute(f"ROLLBACK TO SAVEPOINT {EXPLAIN_SAVEPOINT}")
+                raise
+            finally:
+                cursor.execute(f"RELEASE SAVEPOINT {EXPLAIN_SAVEPOINT}")
+        finally:
+            cursor.close()
+    except Exception as e:  # noqa: BLE001 - el plan es informativo
+        return f"No se pudo obtener el plan: {e}"
+
+
+def instrument_slow_queries(engine: Engine) -> None:
+    """Registrar los listeners del registro de consultas lentas"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn: Any, *_args: Any) -> None:
+        conn.info.setdefault("slow_query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(
+        conn: Any,
+        _cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        inicios = conn.info.get("slow_query_start")
+        if not inicios:
+            return
+        duracion_ms = (time.perf_counter() - inicios.pop()) * 1000
+        settings = get_settings()
+        if duracion_ms < settings.SLOW_QUERY_THRESHOLD_MS:
+            return
+
+        entrada: dict[str, Any] = {
+            "timestamp": datetime.now().isoformat(),
+            "endpoint": _request_path.get(),
+            "duration_ms": round(duracion_ms, 2),
+            "statement": statement,
+            "parameters": redact_parameters(parameters, context, executemany),
+        }
+        if (
+            settings.DEBUG
+            and not executemany
+            and statement.lstrip().upper().startswith(EXPLAINABLE)
+        ):
+            entrada["plan"] = _explain(conn, statement, parameters)
+
+        with _lock:
+            _entries.append(entrada)
+        logger.warning(
+            "Consulta lenta (%.1f ms) en %s: %s | parámetros=%s",
+            duracion_ms,
+            entrada["endpoint"],
+            " ".join(statement.split()),
+            entrada["parameters"],
+        )
@@ -5,15 +5,26 @@ Versión simplificada y funcional
 
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
 
 from app.api.api import api_router
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.core.compression import (
+    CompressionMiddleware,
+    PrecompressedStaticFiles,
+    precompress_directory,
+)
 from app.core.config import get_settings
+from app.core.middleware import query_stats_middleware, request_context_middleware
+from app.core.password_pool import password_pool
+from app.crud.catalog_cache import catalog_cache
+from app.crud.crud_usuario import user_cache
+from app.db.pool_metrics import get_pool_metrics
 
 # Crear la instancia de la aplicación
 app = FastAPI(
@@ -29,12 +40,43 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag"],
 )
 
-# Configurar archivos estáticos
+# Ruta del endpoint para el registro de consultas lentas
+app.middleware("http")(request_context_middleware)
+
+# Contador de consultas por petición (cabeceras X-DB-*) en modo debug
+if get_settings().DEBUG:
+    app.middleware("http")(query_stats_middleware)
+
+# Compresión gzip/brotli de las respuestas (el middleware más externo)
+if get_settings().COMPRESSION_ENABLED:
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=get_settings().COMPRESSION_MINIMUM_SIZE,
+        content_types=get_settings().COMPRESSION_CONTENT_TYPES,
+        gzip_level=get_settings().COMPRESSION_GZIP_LEVEL,
+        brotli_quality=get_settings().COMPRESSION_BROTLI_QUALITY,
+    )
+
+# Configurar archivos estáticos (con las variantes .br/.gz generadas en el build)
 frontend_path = Path(__file__).parent.parent / "frontend"
 if frontend_path.exists():
-    app.mount("/frontend", StaticFiles(directory=str(frontend_path)), name="frontend")
+    if get_settings().PRECOMPRESS_STATIC:
+        precompress_directory(
+            frontend_path,
+            minimum_size=get_settings().COMPRESSION_MINIMUM_SIZE,
+            content_types=get_settings().COMPRESSION_CONTENT_TYPES,
+        )
+    app.mount(
+        "/frontend",
+        PrecompressedStaticFiles(directory=str(frontend_path)),
+        name="frontend",
+    )
+
+# bcrypt en su propio pool de procesos, fuera del threadpool compartido
+password_pool.enable()
 
 # Incluir router principal de la API
 app.include_router(api_router)
@@ -74,6 +116,26 @@ async def health_check() -> dict[str, str]:
     }
 
 
+@app.get("/health/pool", tags=["Health"])
+async def pool_health() -> dict[str, Any]:
+    """Métricas internas del pool de conexiones (espera, uso, overflow)"""
+    return {
+        "engines": get_pool_metrics(),
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
+@app.get("/health/cache", tags=["Health"])
+async def cache_health() -> dict[str, Any]:
+    """Estado de las cachés de catálogos y usuarios y del pool de contraseñas"""
+    return {
+        "catalog": catalog_cache.stats(),
+        "usuarios": user_cache.stats(),
+        "password_pool": password_pool.stats(),
+        "timestamp": datetime.now().isoformat(),
+    }
+
+
 @app.get("/info", tags=["Health"])
 async def system_info() -> dict[str, str]:
     """Información del sistema (solo en modo debug)"""
@@ -6,6 +6,7 @@ from app.models.habitacion import Habitacion
 from app.models.hospedaje import Hospedaje
 from app.models.pedido import LineaPedido, Pedido
 from app.models.producto import Producto
+from app.models.refresh_token import RefreshToken
 from app.models.tarifa import Tarifa
 from app.models.usuario import Usuario
 
@@ -17,4 +18,5 @@ __all__ = [
     "Pedido",
     "LineaPedido",
     "Tarifa",
+    "RefreshToken",
 ]
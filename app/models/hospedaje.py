@@ -5,7 +5,7 @@ Modelo de Hospedaje para el sistema de gestión hotelera
 from datetime import date
 from decimal import Decimal
 
-from sqlalchemy import Date, Integer, Numeric, String, Text
+from sqlalchemy import Date, Index, Integer, Numeric, String, Text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base_class import Base
@@ -18,6 +18,23 @@ class Hospedaje(Base):
     """
 
     __tablename__ = "hospedajes"
+    __table_args__ = (
+        # Búsqueda de disponibilidad: solapes por habitación a partir de una
+        # fecha de salida, resuelta solo con el índice (incluye el estado)
+        Index(
+            "ix_hospedajes_habitacion_salida",
+            "numero_habitacion",
+            "fecha_check_out",
+            "fecha_check_in",
+            "estado",
+        ),
+        # Listados por estado, opcionalmente acotados por fecha de entrada
+        Index("ix_hospedajes_estado_check_in", "estado", "fecha_check_in"),
+        # Exportaciones e informes por rango de fechas de entrada
+        Index("ix_hospedajes_check_in", "fecha_check_in"),
+        # max(fecha_actualizacion) del ETag de los listados sin recorrer la tabla
+        Index("ix_hospedajes_fecha_actualizacion", "fecha_actualizacion"),
+    )
 
     # Información del huésped
     nombre_huesped: Mapped[str] = mapped_column(String(100), nullable=False)
@@ -0,0 +1,34 @@
+"""
+Modelo de tokens de refresco (sesiones de usuario en el servidor)
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base_class import Base
+
+
+class RefreshToken(Base):
+    """
+    Token de refresco emitido en el login.
+    Solo se guarda su hash; cada uso lo revoca y emite otro de la misma
+    familia (rotación). Reutilizar uno ya revocado revoca toda la familia.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    usuario_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("usuarios.id"), nullable=False, index=True
+    )
+    token_hash: Mapped[str] = mapped_column(
+        String(64), unique=True, index=True, nullable=False
+    )
+    # Cadena de rotaciones que parte de un mismo login
+    familia: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    expira: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    revocado: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self) -> str:
+        return f"<RefreshToken(id={self.id}, usuario_id={self.usuario_id})>"
@@ -12,6 +12,26 @@ class Token(BaseModel):
 
     access_token: str
     token_type: str
+    # Token de refresco (rotado en cada uso) y vida del de acceso en segundos
+    refresh_token: str | None = None
+    expires_in: int | None = None
+
+
+class RefreshTokenRequest(BaseModel):
+    """Token de refresco a canjear o revocar"""
+
+    refresh_token: str
+
+
+class TokenClaims(BaseModel):
+    """Usuario autorizado según los claims firmados del token de acceso"""
+
+    id: int
+    email: str
+    is_superuser: bool = False
+    puesto: str | None = None
+    jti: str | None = None
+    exp: float | None = None
 
 
 class TokenData(BaseModel):
@@ -4,6 +4,7 @@ Schemas de Pydantic para el modelo Hospedaje
 
 from datetime import date
 from decimal import Decimal
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -62,3 +63,19 @@ class Hospedaje(HospedajeInDBBase):
 
 class HospedajeInDB(HospedajeInDBBase):
     """Schema para hospedaje completo en base de datos"""
+
+
+class HospedajeLoteResultado(BaseModel):
+    """Resultado de una fila de un alta en lote, en el orden recibido"""
+
+    indice: int
+    estado: Literal["creado", "conflicto", "invalido"]
+    id: int | None = None
+    detalle: str | None = None
+
+
+class HospedajeLoteRespuesta(BaseModel):
+    """Respuesta de un alta en lote"""
+
+    creados: int
+    resultados: list[HospedajeLoteResultado]
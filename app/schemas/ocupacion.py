@@ -0,0 +1,24 @@
+"""
+Schemas de Pydantic para el calendario de ocupación
+"""
+
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class OcupacionHabitacion(BaseModel):
+    """Días ocupados de una habitación: tramos [día, noches] o bits en base64"""
+
+    numero: str
+    ocupacion: list[tuple[int, int]] | str
+
+
+class CalendarioOcupacion(BaseModel):
+    """Matriz habitaciones × días a partir de `desde`"""
+
+    desde: date
+    hasta: date
+    dias: int
+    formato: str
+    habitaciones: list[OcupacionHabitacion]
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Benchmark de throughput: lecturas síncronas (threadpool) vs asíncronas (event loop)
+
+Lanza GET /api/v1/habitaciones/ con 50/200/500 clientes concurrentes contra la
+aplicación en proceso (httpx + ASGITransport), una vez con DATABASE_ASYNC=false
+y otra con DATABASE_ASYNC=true. Cada ronda se ejecuta en un subproceso porque la
+selección de routers ocurre al importar la aplicación.
+
+Uso:
+    python benchmarks/bench_async_vs_sync.py
+    python benchmarks/bench_async_vs_sync.py --database-url postgresql://...
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+CONCURRENCIAS = (50, 200, 500)
+PETICIONES_POR_CLIENTE = 10
+NUM_HABITACIONES = 200
+# Tiempo máximo por ronda: el modo síncrono puede quedar bloqueado esperando
+# conexiones del pool mientras el threadpool está saturado
+LIMITE_RONDA_S = 60
+
+
+def preparar_datos() -> None:
+    """Crear las tablas y sembrar habitaciones si la base está vacía"""
+    from app.db.base_class import Base
+    from app.db.session import SessionLocal, engine
+    from app.models import Habitacion
+
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        if db.query(Habitacion).count() == 0:
+            db.add_all(
+                Habitacion(
+                    numero=f"B{i:04d}",
+                    tipo="doble",
+                    precio_noche=80,
+                    estado="disponible",
+                    descripcion="Habitación de benchmark",
+                )
+                for i in range(NUM_HABITACIONES)
+            )
+            db.commit()
+    finally:
+        db.close()
+
+
+async def medir(concurrencia: int) -> dict[str, float]:
+    """Ejecutar una ronda con `concurrencia` clientes simultáneos"""
+    import httpx
+
+    from app.main import app
+
+    latencias: list[float] = []
+    errores = 0
+
+    async def cliente(http: httpx.AsyncClient) -> None:
+        nonlocal errores
+        for _ in range(PETICIONES_POR_CLIENTE):
+            inicio = time.perf_counter()
+            try:
+                respuesta = await http.get("/api/v1/habitaciones/?limit=50")
+                respuesta.raise_for_status()
+            except Exception:  # noqa: BLE001 - p. ej. TimeoutError del pool
+                errores += 1
+                continue
+            latencias.append(time.perf_counter() - inicio)
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as http:
+        # Calentamiento: conexiones del pool y caché de compilación
+        await http.get("/api/v1/habitaciones/?limit=50")
+        inicio = time.perf_counter()
+        tareas = [asyncio.create_task(cliente(http)) for _ in range(concurrencia)]
+        _, pendientes = await asyncio.wait(tareas, timeout=LIMITE_RONDA_S)
+        total = time.perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        "concurrencia": concurrencia,
+        "req_s": len(latencias) / total,
+        "p50_ms": statistics.median(latencias) * 1000 if latencias else 0.0,
+        "p99_ms": latencias[int(len(latencias) * 0.99) - 1] * 1000
+        if latencias
+        else 0.0,
+        "errores": errores,
+        # Clientes que no terminaron dentro del límite (pool agotado)
+        "bloqueados": len(pendientes),
+    }
+
+
+def ejecutar_ronda(concurrencia: int) -> None:
+    """Punto de entrada del subproceso: imprime el resultado como JSON"""
+    preparar_datos()
+    resultado = asyncio.run(medir(concurrencia))
+    print(json.dumps(resultado), flush=True)
+    # Los hilos del threadpool pueden seguir esperando una conexión del pool
+    os._exit(0)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--database-url", help="URL síncrona de la base de datos")
+    parser.add_argument("--ronda", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.ronda:
+        ejecutar_ronda(args.ronda)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{tmp}/bench_async.db"
+        print(f"📊 Base de datos: {database_url}")
+        print(
+            f"{'modo':<6} {'clientes':>8} {'req/s':>10} {'p50 ms':>10} "
+            f"{'p99 ms':>10} {'errores':>8} {'bloqueados':>10}"
+        )
+        for modo in ("sync", "async"):
+            env = {
+                **os.environ,
+                "DATABASE_URL": database_url,
+                "DATABASE_ASYNC": "true" if modo == "async" else "false",
+                "DEBUG": "false",
+            }
+            for concurrencia in CONCURRENCIAS:
+                salida = subprocess.run(
+                    [sys.executable, __file__, "--ronda", str(concurrencia)],
+                    env=env,
+                    cwd=project_root,
+                    capture_output=True,
+                    text=True,
+                    check=True,
+                )
+                r = json.loads(salida.stdout.strip().splitlines()[-1])
+                print(
+                    f"{modo:<6} {r['concurrencia']:>8} {r['req_s']:>10.1f} "
+                    f"{r['p50_ms']:>10.1f} {r['p99_ms']:>10.1f} "
+                    f"{r['errores']:>8} {r['bloqueados']:>10}"
+                )
+
+
+if __name__ == "__main__":
+    main()
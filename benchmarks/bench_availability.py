@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la búsqueda de habitaciones libres por rango de fechas
+
+Carga --habitaciones habitaciones con --anios años de hospedajes consecutivos
+(estancias de 1 a 7 noches; las pasadas en check_out, las futuras
+confirmadas, pendientes o canceladas) en una base SQLite temporal y mide
+get_habitaciones_libres para varios rangos, con y sin el índice
+ix_hospedajes_habitacion_salida. Como referencia mide lo que hace hoy
+recepción: leer todos los hospedajes del tipo y filtrar en Python.
+Muestra el plan de consulta de SQLite.
+
+Uso:
+    python benchmarks/bench_availability.py [--habitaciones 500] [--anios 5]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Sin eco de SQL: la configuración se lee al importar la aplicación
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy import create_engine, insert, select, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.crud.crud_habitacion import (  # noqa: E402
+    SELECT_HABITACIONES_LIBRES,
+    get_habitaciones_libres,
+)
+from app.crud.crud_hospedaje import ESTADOS_OCUPAN  # noqa: E402
+from app.db.base_class import Base  # noqa: E402
+from app.models import Habitacion, Hospedaje  # noqa: E402
+
+TIPOS = ("individual", "doble", "suite", "familiar")
+INDICE = "ix_hospedajes_habitacion_salida"
+
+
+def cargar(database_url: str, habitaciones: int, anios: int, hoy: date) -> int:
+    """Crear el esquema y los hospedajes; devuelve cuántos se insertaron"""
+    aleatorio = random.Random(42)
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    ahora = datetime(2025, 1, 1)
+    inicio, fin = hoy - timedelta(days=365 * (anios - 1)), hoy + timedelta(days=365)
+    total = 0
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Habitacion),
+            [
+                {
+                    "numero": f"{n:04d}",
+                    "tipo": TIPOS[n % len(TIPOS)],
+                    "capacidad_personas": 1 + n % 4,
+                    "precio_noche": Decimal("80.00"),
+                    "estado": "disponible",
+                    "fecha_creacion": ahora,
+                    "fecha_actualizacion": ahora,
+                }
+                for n in range(habitaciones)
+            ],
+        )
+        for n in range(habitaciones):
+            filas, entrada = [], inicio
+            while entrada < fin:
+                entrada += timedelta(days=aleatorio.randint(0, 4))
+                noches = aleatorio.randint(1, 7)
+                salida = entrada + timedelta(days=noches)
+                filas.append(
+                    {
+                        "nombre_huesped": "Huésped",
+                        "numero_habitacion": f"{n:04d}",
+                        "tipo_habitacion": TIPOS[n % len(TIPOS)],
+                        "fecha_check_in": entrada,
+                        "fecha_check_out": salida,
+                        "precio_por_noche": Decimal("80.00"),
+                        "numero_noches": noches,
+                        "total_hospedaje": Decimal(80 * noches),
+                        "estado": "check_out"
+                        if salida < hoy
+                        else aleatorio.choice(
+                            ["confirmado", "confirmado", "pendiente", "cancelado"]
+                        ),
+                        "fecha_creacion": ahora,
+                        "fecha_actualizacion": ahora,
+                    }
+                )
+                entrada = salida
+            conn.execute(insert(Hospedaje), filas)
+            total += len(filas)
+    engine.dispose()
+    return total
+
+
+def filtrar_en_cliente(db: Session, desde: date, hasta: date) -> list[str]:
+    """Lo que hace hoy recepción: todos los hospedajes del tipo y filtrar"""
+    ocupadas = {
+        h.numero_habitacion
+        for h in db.scalars(
+            select(Hospedaje).where(Hospedaje.tipo_habitacion == "doble")
+        )
+        if h.estado in ESTADOS_OCUPAN
+        and h.fecha_check_in < hasta
+        and h.fecha_check_out > desde
+    }
+    return [
+        h.numero
+        for h in db.scalars(select(Habitacion).where(Habitacion.tipo == "doble"))
+        if h.numero not in ocupadas
+    ]
+
+
+def cronometrar(funcion: Callable[[], object], repeticiones: int) -> float:
+    """Mediana en ms de `repeticiones` llamadas (tras una de calentamiento)"""
+    funcion()
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--habitaciones", type=int, default=500)
+    parser.add_argument("--anios", type=int, default=5)
+    parser.add_argument("--repeticiones", type=int, default=50)
+    args = parser.parse_args()
+
+    hoy = date(2025, 6, 1)
+    rangos = {
+        "próximo finde": (hoy + timedelta(days=5), hoy + timedelta(days=7)),
+        "dentro de 6 meses": (hoy + timedelta(days=180), hoy + timedelta(days=187)),
+        "hace 3 años": (hoy - timedelta(days=3 * 365), hoy - timedelta(days=1090)),
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{tmp}/bench.db"
+        print("⏳ Cargando datos...")
+        total = cargar(database_url, args.habitaciones, args.anios, hoy)
+        print(
+            f"📊 {args.habitaciones} habitaciones, {total:,} hospedajes "
+            f"({args.anios} años), tipo=doble"
+        )
+        engine = create_engine(database_url)
+        with Session(engine) as db:
+            desde, hasta = rangos["próximo finde"]
+            compilado = SELECT_HABITACIONES_LIBRES.params(
+                desde=desde, hasta=hasta
+            ).compile(engine, compile_kwargs={"render_postcompile": True})
+            plan = (
+                db.connection()
+                .exec_driver_sql(
+                    "EXPLAIN QUERY PLAN " + str(compilado),
+                    tuple(str(compilado.params[k]) for k in compilado.positiontup),
+                )
+                .all()
+            )
+            print("Plan:", " | ".join(fila[-1] for fila in plan))
+
+            print(
+                f"{'rango':<20} {'libres':>7} {'índice ms':>10} {'sin índice ms':>14}"
+            )
+            resultados = {}
+            for nombre, (desde, hasta) in rangos.items():
+                resultados[nombre] = (
+                    len(get_habitaciones_libres(db, desde, hasta, tipo="doble")),
+                    cronometrar(
+                        lambda d=desde, h=hasta: get_habitaciones_libres(
+                            db, d, h, tipo="doble"
+                        ),
+                        args.repeticiones,
+                    ),
+                )
+            db.execute(text(f"DROP INDEX {INDICE}"))
+            for nombre, (desde, hasta) in rangos.items():
+                libres, con_indice = resultados[nombre]
+                sin_indice = cronometrar(
+                    lambda d=desde, h=hasta: get_habitaciones_libres(
+                        db, d, h, tipo="doble"
+                    ),
+                    max(1, args.repeticiones // 25),
+                )
+                print(
+                    f"{nombre:<20} {libres:>7} {con_indice:>10.2f} {sin_indice:>14.1f}"
+                )
+
+            desde, hasta = rangos["próximo finde"]
+            cliente = cronometrar(lambda: filtrar_en_cliente(db, desde, hasta), 1)
+            print(f"Filtrado en el cliente (todos los hospedajes): {cliente:.0f} ms")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
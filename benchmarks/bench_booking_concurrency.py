@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+Benchmark de reservas simultáneas con prevención de solapes
+
+Lanza --intentos reservas con --clientes hilos sobre --habitaciones
+habitaciones y fechas aleatorias de un mismo mes, primero con
+create_hospedaje (comprobación e INSERT bajo el bloqueo de la habitación) y
+luego con la comprobación sin bloqueo, y cuenta reservas por segundo,
+rechazos y noches vendidas dos veces.
+
+Por defecto usa bases SQLite temporales con los dos perfiles; con
+--database-url se mide contra PostgreSQL (la tabla hospedajes se vacía).
+
+Uso:
+    python benchmarks/bench_booking_concurrency.py [--intentos 100] [--clientes 16]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from itertools import combinations
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Sin eco de SQL: la configuración se lee al importar la aplicación
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy import delete, select  # noqa: E402
+from sqlalchemy.engine import Engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.crud.crud_hospedaje import (  # noqa: E402
+    ESTADOS_OCUPAN,
+    HabitacionOcupadaError,
+    _comprobar_libre,
+    create_hospedaje,
+)
+from app.db.base_class import Base  # noqa: E402
+from app.db.session import create_app_engine  # noqa: E402
+from app.models import Hospedaje  # noqa: E402
+from app.schemas.hospedaje import HospedajeCreate  # noqa: E402
+
+
+def intentos_aleatorios(n: int, habitaciones: int) -> list[HospedajeCreate]:
+    """Reservas de 1 a 5 noches en junio, repartidas entre las habitaciones"""
+    aleatorio = random.Random(42)
+    reservas = []
+    for _ in range(n):
+        entrada = date(2025, 6, 1) + timedelta(aleatorio.randint(0, 25))
+        noches = aleatorio.randint(1, 5)
+        reservas.append(
+            HospedajeCreate(
+                nombre_huesped="Huésped",
+                numero_habitacion=f"{aleatorio.randint(1, habitaciones):03d}",
+                tipo_habitacion="doble",
+                fecha_check_in=entrada,
+                fecha_check_out=entrada + timedelta(noches),
+                precio_por_noche=80,
+                numero_noches=noches,
+                total_hospedaje=80 * noches,
+                estado="confirmado",
+            )
+        )
+    return reservas
+
+
+def sin_bloqueo(db: Session, *, hospedaje_in: HospedajeCreate) -> None:
+    """Comprobar y luego insertar, sin bloquear la habitación"""
+    _comprobar_libre(
+        db,
+        hospedaje_in.numero_habitacion,
+        hospedaje_in.fecha_check_in,
+        hospedaje_in.fecha_check_out,
+    )
+    db.add(Hospedaje(**hospedaje_in.model_dump()))
+    db.commit()
+
+
+def dobles_ventas(engine: Engine) -> int:
+    """Pares de hospedajes de la misma habitación con noches en común"""
+    with Session(engine) as db:
+        ocupan = db.scalars(
+            select(Hospedaje).where(Hospedaje.estado.in_(ESTADOS_OCUPAN))
+        ).all()
+    return sum(
+        1
+        for a, b in combinations(ocupan, 2)
+        if a.numero_habitacion == b.numero_habitacion
+        and a.fecha_check_in < b.fecha_check_out
+        and b.fecha_check_in < a.fecha_check_out
+    )
+
+
+def medir(
+    engine: Engine,
+    reservar: Callable[..., object],
+    reservas: list[HospedajeCreate],
+    clientes: int,
+) -> dict[str, float]:
+    """Lanzar las reservas en paralelo sobre una tabla vacía"""
+    with Session(engine) as db:
+        db.execute(delete(Hospedaje))
+        db.commit()
+
+    def una(hospedaje_in: HospedajeCreate) -> str:
+        with Session(engine) as db:
+            try:
+                reservar(db, hospedaje_in=hospedaje_in)
+            except HabitacionOcupadaError:
+                return "rechazada"
+            except Exception:
+                return "error"
+            return "creada"
+
+    inicio = time.perf_counter()
+    with ThreadPoolExecutor(clientes) as pool:
+        resultados = list(pool.map(una, reservas))
+    total = time.perf_counter() - inicio
+    return {
+        "rps": len(reservas) / total,
+        "creadas": resultados.count("creada"),
+        "rechazadas": resultados.count("rechazada"),
+        "errores": resultados.count("error"),
+        "dobles": dobles_ventas(engine),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--intentos", type=int, default=100)
+    parser.add_argument("--clientes", type=int, default=16)
+    parser.add_argument("--habitaciones", type=int, default=5)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    reservas = intentos_aleatorios(args.intentos, args.habitaciones)
+    print(
+        f"📊 {args.intentos} reservas, {args.clientes} clientes, "
+        f"{args.habitaciones} habitaciones"
+    )
+    print(
+        f"{'base':<20} {'modo':<12} {'res/s':>7} {'creadas':>8} "
+        f"{'rechazos':>9} {'errores':>8} {'dobles':>7}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.database_url:
+            bases = {"postgresql": create_app_engine(args.database_url)}
+        else:
+            bases = {
+                perfil: create_app_engine(
+                    f"sqlite:///{tmp}/{perfil}.db", sqlite_profile=perfil
+                )
+                for perfil in ("default", "sqlite-performance")
+            }
+        for nombre, engine in bases.items():
+            Base.metadata.create_all(bind=engine)
+            for modo, reservar in (
+                ("con bloqueo", create_hospedaje),
+                ("sin bloqueo", sin_bloqueo),
+            ):
+                r = medir(engine, reservar, reservas, args.clientes)
+                print(
+                    f"{nombre:<20} {modo:<12} {r['rps']:>7.0f} {r['creadas']:>8} "
+                    f"{r['rechazadas']:>9} {r['errores']:>8} {r['dobles']:>7}"
+                )
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
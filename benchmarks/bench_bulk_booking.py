@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark del alta en lote de hospedajes (POST /api/v1/hospedajes/lote)
+
+Arranca un servidor uvicorn sobre una base SQLite temporal (o --database-url)
+y crea listas de grupo de --tamanos huéspedes de dos formas: un POST
+/api/v1/hospedajes/ por huésped, como hoy, y un único POST .../lote. Muestra
+el tiempo total de cada lista y las filas por segundo.
+
+Uso:
+    python benchmarks/bench_bulk_booking.py [--tamanos 50 200] [--repeticiones 3]
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+import httpx
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Sin eco de SQL: la configuración se lee al importar la aplicación
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy import create_engine  # noqa: E402
+
+import app.models  # noqa: E402, F401 - registra las tablas en Base.metadata
+from app.db.base_class import Base  # noqa: E402
+
+
+def puerto_libre() -> int:
+    """Puerto TCP libre en localhost"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def lista_grupo(prefijo: str, tamano: int) -> list[dict]:
+    """Un huésped por habitación, todos del 10 al 13 de junio"""
+    entrada = date(2025, 6, 10)
+    return [
+        {
+            "nombre_huesped": f"Huésped {i}",
+            "numero_habitacion": f"{prefijo}{i:03d}",
+            "tipo_habitacion": "doble",
+            "fecha_check_in": entrada.isoformat(),
+            "fecha_check_out": (entrada + timedelta(days=3)).isoformat(),
+            "precio_por_noche": "80.00",
+            "numero_noches": 3,
+            "total_hospedaje": "240.00",
+            "estado": "confirmado",
+        }
+        for i in range(tamano)
+    ]
+
+
+def uno_a_uno(client: httpx.Client, lista: list[dict]) -> float:
+    """Segundos para crear la lista con un POST por huésped"""
+    inicio = time.perf_counter()
+    for hospedaje in lista:
+        client.post("/api/v1/hospedajes/", json=hospedaje).raise_for_status()
+    return time.perf_counter() - inicio
+
+
+def en_lote(client: httpx.Client, lista: list[dict]) -> float:
+    """Segundos para crear la lista con un único POST en lote"""
+    inicio = time.perf_counter()
+    response = client.post("/api/v1/hospedajes/lote", json=lista)
+    response.raise_for_status()
+    assert response.json()["creados"] == len(lista)
+    return time.perf_counter() - inicio
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{tmp}/bench.db"
+        engine = create_engine(database_url)
+        Base.metadata.create_all(bind=engine)
+        engine.dispose()
+
+        puerto = puerto_libre()
+        servidor = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(puerto)],
+            cwd=project_root,
+            env={**os.environ, "DATABASE_URL": database_url, "DEBUG": "false"},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        base = f"http://127.0.0.1:{puerto}"
+        try:
+            for _ in range(100):
+                try:
+                    httpx.get(f"{base}/health")
+                    break
+                except httpx.TransportError:
+                    time.sleep(0.1)
+            print(f"📊 Listas de grupo ({database_url.split(':', 1)[0]})")
+            print(f"{'huéspedes':>9} {'modo':<12} {'total ms':>9} {'filas/s':>8}")
+            with httpx.Client(base_url=base, timeout=60) as client:
+                uno_a_uno(client, lista_grupo("C", 5))  # calentamiento
+                for tamano in args.tamanos:
+                    for modo, crear in (("uno a uno", uno_a_uno), ("lote", en_lote)):
+                        tiempos = [
+                            crear(
+                                client, lista_grupo(f"{modo[0]}{tamano}-{r}-", tamano)
+                            )
+                            for r in range(args.repeticiones)
+                        ]
+                        total = statistics.median(tiempos)
+                        print(
+                            f"{tamano:>9} {modo:<12} {total * 1000:>9.0f} "
+                            f"{tamano / total:>8.0f}"
+                        )
+        finally:
+            servidor.terminate()
+            servidor.wait()
+
+
+if __name__ == "__main__":
+    main()
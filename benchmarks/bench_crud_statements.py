@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark del coste Python por consulta: Query legacy vs select() precompilado
+
+Para get_habitacion_by_numero, get_usuario_by_email y get_hospedaje compara:
+
+- construcción: crear la sentencia y generar su clave de caché (lo que
+  SQLAlchemy hace en cada llamada antes de buscar la SQL compilada)
+- llamada completa: ejecutar la función CRUD contra SQLite en memoria
+
+La variante "legacy" reproduce el código anterior (`db.query(...).filter(...)`);
+la variante "2.0" es la implementación actual de app.crud.
+
+Uso:
+    python benchmarks/bench_crud_statements.py [--iteraciones 20000]
+"""
+
+import argparse
+import os
+import sys
+import timeit
+from collections.abc import Callable
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Sin eco de SQL: la configuración se lee al importar la aplicación
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.crud import crud_habitacion, crud_hospedaje, crud_usuario  # noqa: E402
+from app.db.base_class import Base  # noqa: E402
+from app.models import Habitacion, Hospedaje, Usuario  # noqa: E402
+
+
+def legacy_habitacion_by_numero(db: Session, numero: str):
+    return db.query(Habitacion).filter(Habitacion.numero == numero).first()
+
+
+def legacy_usuario_by_email(db: Session, email: str):
+    return db.query(Usuario).filter(Usuario.email == email).first()
+
+
+def legacy_hospedaje(db: Session, hospedaje_id: int):
+    return db.query(Hospedaje).filter(Hospedaje.id == hospedaje_id).first()
+
+
+def preparar_sesion() -> Session:
+    """Base en memoria con una fila de cada entidad"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    db = Session(engine)
+    db.add_all(
+        [
+            Habitacion(numero="101", tipo="doble", precio_noche=80),
+            Usuario(
+                email="recepcion@hotel.com",
+                hashed_password="x",
+                nombre_completo="Recepción Hotel",
+            ),
+            Hospedaje(
+                nombre_huesped="Huésped",
+                numero_habitacion="101",
+                tipo_habitacion="doble",
+                fecha_check_in=date(2025, 1, 1),
+                fecha_check_out=date(2025, 1, 3),
+                precio_por_noche=Decimal("80.00"),
+                numero_noches=2,
+                total_hospedaje=Decimal("160.00"),
+            ),
+        ]
+    )
+    db.commit()
+    return db
+
+
+def por_llamada_us(funcion: Callable[[], object], iteraciones: int) -> float:
+    """Mejor de 3 repeticiones, en microsegundos por llamada"""
+    mejor = min(timeit.repeat(funcion, number=iteraciones, repeat=3))
+    return mejor / iteraciones * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iteraciones", type=int, default=20000)
+    args = parser.parse_args()
+    n = args.iteraciones
+
+    db = preparar_sesion()
+    hospedaje_id = db.query(Hospedaje.id).scalar()
+
+    casos = [
+        (
+            "get_habitacion_by_numero",
+            lambda: db.query(Habitacion)
+            .filter(Habitacion.numero == "101")
+            .statement._generate_cache_key(),
+            lambda: crud_habitacion.SELECT_HABITACION_BY_NUMERO._generate_cache_key(),
+            lambda: legacy_habitacion_by_numero(db, "101"),
+            lambda: crud_habitacion.get_habitacion_by_numero(db, "101"),
+        ),
+        (
+            "get_usuario_by_email",
+            lambda: db.query(Usuario)
+            .filter(Usuario.email == "recepcion@hotel.com")
+            .statement._generate_cache_key(),
+            lambda: crud_usuario.SELECT_USUARIO_BY_EMAIL._generate_cache_key(),
+            lambda: legacy_usuario_by_email(db, "recepcion@hotel.com"),
+            lambda: crud_usuario.get_usuario_by_email(db, "recepcion@hotel.com"),
+        ),
+        (
+            # db.get() no construye sentencia: usa el cargador por PK del mapper
+            # (y el identity map si la instancia sigue viva en la sesión)
+            "get_hospedaje",
+            lambda: db.query(Hospedaje)
+            .filter(Hospedaje.id == hospedaje_id)
+            .statement._generate_cache_key(),
+            None,
+            lambda: legacy_hospedaje(db, hospedaje_id),
+            lambda: crud_hospedaje.get_hospedaje(db, hospedaje_id),
+        ),
+    ]
+
+    print(f"📊 {n} iteraciones por medida, µs por llamada (mejor de 3)")
+    print(
+        f"{'función':<26} {'constr. legacy':>15} {'constr. 2.0':>12} "
+        f"{'llamada legacy':>15} {'llamada 2.0':>12} {'mejora':>8}"
+    )
+    for nombre, construir_legacy, construir_nuevo, legacy, nuevo in casos:
+        c_legacy = por_llamada_us(construir_legacy, n)
+        c_nuevo = (
+            f"{por_llamada_us(construir_nuevo, n):.1f}" if construir_nuevo else "-"
+        )
+        l_legacy = por_llamada_us(legacy, n)
+        l_nuevo = por_llamada_us(nuevo, n)
+        print(
+            f"{nombre:<26} {c_legacy:>15.1f} {c_nuevo:>12} "
+            f"{l_legacy:>15.1f} {l_nuevo:>12.1f} {l_legacy / l_nuevo:>7.1f}x"
+        )
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
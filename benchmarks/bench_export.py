@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Benchmark de exportación: un año de hospedajes paginando vs /exportaciones
+
+Carga N hospedajes (por defecto 300k) repartidos en 2025 en una base SQLite
+temporal y arranca un servidor uvicorn por modo. Compara descargar el año
+paginando GET /api/v1/hospedajes/ de 100 en 100 (como hace contabilidad hoy)
+con una sola descarga de GET /api/v1/exportaciones/hospedajes en NDJSON y CSV.
+Mide tiempo total, peticiones HTTP, tamaño del cuerpo y el pico de memoria
+residente del servidor (VmHWM en /proc, solo Linux).
+
+Uso:
+    python benchmarks/bench_export.py [--filas 300000] [--yield-per 1000]
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import httpx
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Sin eco de SQL: la configuración se lee al importar la aplicación
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+
+from app.db.base_class import Base  # noqa: E402
+from app.models import Hospedaje  # noqa: E402
+
+LOTE = 50_000
+RANGO = {"desde": "2025-01-01", "hasta": "2025-12-31"}
+
+
+def cargar(database_url: str, filas: int) -> None:
+    """Crear el esquema e insertar `filas` hospedajes con check-in en 2025"""
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    ahora = datetime(2025, 1, 1)
+    with engine.begin() as conn:
+        for inicio in range(0, filas, LOTE):
+            conn.execute(
+                insert(Hospedaje),
+                [
+                    {
+                        "nombre_huesped": f"Huésped {i}",
+                        "email_huesped": f"huesped{i}@correo.com",
+                        "numero_habitacion": f"{100 + i % 50}",
+                        "tipo_habitacion": "doble",
+                        "fecha_check_in": date(2025, 1, 1) + timedelta(days=i % 365),
+                        "fecha_check_out": date(2025, 1, 3) + timedelta(days=i % 365),
+                        "precio_por_noche": Decimal("80.00"),
+                        "numero_noches": 2,
+                        "total_hospedaje": Decimal("160.00"),
+                        "estado": "check_out",
+                        "fecha_creacion": ahora,
+                        "fecha_actualizacion": ahora,
+                    }
+                    for i in range(inicio, min(inicio + LOTE, filas))
+                ],
+            )
+    engine.dispose()
+
+
+def memoria_mb(pid: int, campo: str) -> float:
+    """Leer VmRSS o VmHWM (pico) de /proc/<pid>/status en MB"""
+    for linea in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if linea.startswith(campo + ":"):
+            return int(linea.split()[1]) / 1024
+    raise RuntimeError(f"{campo} no disponible")
+
+
+def puerto_libre() -> int:
+    """Puerto TCP libre en localhost"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def paginar(client: httpx.Client) -> tuple[int, int]:
+    """Recorrer el listado con el cursor keyset; devuelve (peticiones, bytes)"""
+    peticiones, recibidos, cursor = 0, 0, None
+    while True:
+        params = {"limit": 100, **({"cursor": cursor} if cursor else {})}
+        response = client.get("/api/v1/hospedajes/", params=params)
+        peticiones += 1
+        recibidos += len(response.content)
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return peticiones, recibidos
+
+
+def exportar(client: httpx.Client, formato: str) -> tuple[int, int]:
+    """Descargar el año completo en una sola petición"""
+    recibidos = 0
+    with client.stream(
+        "GET",
+        "/api/v1/exportaciones/hospedajes",
+        params={**RANGO, "formato": formato},
+    ) as response:
+        for fragmento in response.iter_raw():
+            recibidos += len(fragmento)
+    return 1, recibidos
+
+
+def medir(database_url: str, modo: str, yield_per: int) -> dict[str, float]:
+    """Arrancar un servidor, descargar el año y medir su memoria"""
+    puerto = puerto_libre()
+    entorno = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "DEBUG": "false",
+        "COMPRESSION_ENABLED": "false",
+        "STREAM_YIELD_PER": str(yield_per),
+    }
+    servidor = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(puerto)],
+        cwd=project_root,
+        env=entorno,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{puerto}", timeout=600) as c:
+            for _ in range(100):
+                try:
+                    c.get("/health")
+                    break
+                except httpx.TransportError:
+                    time.sleep(0.1)
+            reposo = memoria_mb(servidor.pid, "VmRSS")
+            inicio = time.perf_counter()
+            if modo == "paginado":
+                peticiones, recibidos = paginar(c)
+            else:
+                peticiones, recibidos = exportar(c, modo)
+            total = time.perf_counter() - inicio
+        return {
+            "delta_mb": memoria_mb(servidor.pid, "VmHWM") - reposo,
+            "total_s": total,
+            "peticiones": peticiones,
+            "cuerpo_mb": recibidos / 1024 / 1024,
+        }
+    finally:
+        servidor.terminate()
+        servidor.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filas", type=int, default=300_000)
+    parser.add_argument("--yield-per", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{tmp}/bench.db"
+        print(f"⏳ Cargando {args.filas:,} hospedajes...")
+        cargar(database_url, args.filas)
+
+        bloques = -(-args.filas // args.yield_per)
+        print(f"📊 Exportación de {args.filas:,} filas ({bloques:,} bloques)")
+        print(
+            f"{'modo':<10} {'peticiones':>11} {'total s':>8} "
+            f"{'Δ pico MB':>10} {'cuerpo MB':>10}"
+        )
+        for modo in ("paginado", "ndjson", "csv"):
+            r = medir(database_url, modo, args.yield_per)
+            print(
+                f"{modo:<10} {r['peticiones']:>11,} {r['total_s']:>8.2f} "
+                f"{r['delta_mb']:>10.1f} {r['cuerpo_mb']:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
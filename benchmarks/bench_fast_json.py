@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Benchmark de serialización de listados: Pydantic vs ruta rápida orjson
+
+Carga habitaciones (18 campos por fila) en una base SQLite temporal y mide
+GET /api/v1/habitaciones/?limit=N con FAST_JSON_RESPONSES desactivado
+(objetos ORM validados por HabitacionRead) y activado (filas Core + orjson).
+
+Uso:
+    python benchmarks/bench_fast_json.py [--filas 1000 10000] [--repeticiones 20]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Generator
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Sin eco de SQL: la configuración se lee al importar la aplicación
+os.environ.setdefault("DEBUG", "false")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app.api import deps  # noqa: E402
+from app.core.config import settings  # noqa: E402
+from app.db.base_class import Base  # noqa: E402
+from app.db.session import create_app_engine  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Habitacion  # noqa: E402
+
+
+def medir_ms(client: TestClient, filas: int, repeticiones: int) -> float:
+    """Mediana de la latencia de la petición en milisegundos"""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        response = client.get("/api/v1/habitaciones/", params={"limit": filas})
+        tiempos.append(time.perf_counter() - inicio)
+        assert response.status_code == 200
+    return statistics.median(tiempos) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filas", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeticiones", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_app_engine(f"sqlite:///{tmp}/bench.db", name="bench")
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as db:
+            db.execute(
+                insert(Habitacion),
+                [
+                    {
+                        "numero": f"{i:05d}",
+                        "tipo": "doble",
+                        "precio_noche": 80.5,
+                        "descripcion": "Habitación doble con vista al jardín " * 4,
+                        "observaciones": "Revisar minibar al check-out",
+                    }
+                    for i in range(max(args.filas))
+                ],
+            )
+            db.commit()
+
+        session_local = sessionmaker(autoflush=False, bind=engine)
+
+        def get_db() -> Generator[Session, None, None]:
+            with session_local() as db:
+                yield db
+
+        app.dependency_overrides[deps.get_read_db] = get_db
+        client = TestClient(app)
+
+        print(f"📊 mediana de {args.repeticiones} peticiones por medida")
+        print(f"{'filas':>7} {'pydantic ms':>12} {'orjson ms':>10} {'mejora':>8}")
+        for filas in args.filas:
+            settings.FAST_JSON_RESPONSES = False
+            medir_ms(client, filas, 2)  # calentar cachés
+            actual = medir_ms(client, filas, args.repeticiones)
+            settings.FAST_JSON_RESPONSES = True
+            medir_ms(client, filas, 2)
+            rapido = medir_ms(client, filas, args.repeticiones)
+            print(
+                f"{filas:>7} {actual:>12.1f} {rapido:>10.1f} {actual / rapido:>7.1f}x"
+            )
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
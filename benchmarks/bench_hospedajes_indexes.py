@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Benchmark de los índices de consulta de hospedajes
+
+Carga ~1M de hospedajes (--habitaciones habitaciones con --anios años de
+estancias consecutivas) en una base SQLite temporal y mide las consultas de
+la aplicación sobre hospedajes sin los índices de la revisión e3b97c4d5a21 y
+con ellos: listado por habitación y por estado, pendientes por fecha de
+entrada, exportación de una semana y versión de la colección (ETag). Muestra
+el plan de consulta de SQLite de cada una, antes y después.
+
+Uso:
+    python benchmarks/bench_hospedajes_indexes.py [--habitaciones 3300] [--anios 5]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Sin eco de SQL: la configuración se lee al importar la aplicación
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy import Executable, create_engine, insert, select, text  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.crud.crud_hospedaje import (  # noqa: E402
+    SELECT_HOSPEDAJES_BY_ESTADO,
+    SELECT_HOSPEDAJES_BY_HABITACION,
+)
+from app.crud.export import _bounds, export_statement  # noqa: E402
+from app.crud.versioning import version_statement  # noqa: E402
+from app.db.base_class import Base  # noqa: E402
+from app.models import Hospedaje  # noqa: E402
+
+HOY = date(2025, 6, 1)
+NUEVOS = {
+    "ix_hospedajes_estado_check_in": "estado, fecha_check_in",
+    "ix_hospedajes_check_in": "fecha_check_in",
+    "ix_hospedajes_fecha_actualizacion": "fecha_actualizacion",
+}
+
+
+def cargar(database_url: str, habitaciones: int, anios: int) -> int:
+    """Crear el esquema y los hospedajes; devuelve cuántos se insertaron"""
+    aleatorio = random.Random(42)
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    inicio, fin = HOY - timedelta(days=365 * (anios - 1)), HOY + timedelta(days=365)
+    total = 0
+    with engine.begin() as conn:
+        for n in range(habitaciones):
+            filas, entrada = [], inicio
+            while entrada < fin:
+                entrada += timedelta(days=aleatorio.randint(0, 4))
+                noches = aleatorio.randint(1, 7)
+                salida = entrada + timedelta(days=noches)
+                if salida <= HOY:
+                    estado = "check_out"
+                elif entrada <= HOY:
+                    estado = "check_in"
+                else:
+                    estado = aleatorio.choice(["confirmado", "pendiente", "cancelado"])
+                creado = datetime.combine(entrada, datetime.min.time()) - timedelta(
+                    days=aleatorio.randint(1, 60)
+                )
+                filas.append(
+                    {
+                        "nombre_huesped": "Huésped",
+                        "numero_habitacion": f"{n:04d}",
+                        "tipo_habitacion": "doble",
+                        "fecha_check_in": entrada,
+                        "fecha_check_out": salida,
+                        "precio_por_noche": Decimal("80.00"),
+                        "numero_noches": noches,
+                        "total_hospedaje": Decimal(80 * noches),
+                        "estado": estado,
+                        "fecha_creacion": creado,
+                        "fecha_actualizacion": creado,
+                    }
+                )
+                entrada = salida
+            conn.execute(insert(Hospedaje), filas)
+            total += len(filas)
+        for nombre in NUEVOS:
+            conn.execute(text(f"DROP INDEX {nombre}"))
+        conn.execute(text("ANALYZE"))
+    engine.dispose()
+    return total
+
+
+def consultas() -> dict[str, tuple[Executable, dict]]:
+    """Consultas de la aplicación sobre hospedajes con sus parámetros"""
+    desde, hasta = _bounds(Hospedaje, "fecha_check_in", HOY, HOY + timedelta(6))
+    return {
+        "por habitación": (
+            SELECT_HOSPEDAJES_BY_HABITACION,
+            {"numero_habitacion": "0123"},
+        ),
+        "por estado": (SELECT_HOSPEDAJES_BY_ESTADO, {"estado": "check_in"}),
+        "pendientes 7 días": (
+            select(Hospedaje).where(
+                Hospedaje.estado == "pendiente",
+                Hospedaje.fecha_check_in >= HOY,
+                Hospedaje.fecha_check_in < HOY + timedelta(7),
+            ),
+            {},
+        ),
+        "exportar 1 semana": (
+            export_statement(Hospedaje, "fecha_check_in"),
+            {"desde": desde, "hasta": hasta},
+        ),
+        "versión (ETag)": (version_statement(Hospedaje), {}),
+    }
+
+
+def plan(db: Session, sentencia: Executable, parametros: dict) -> str:
+    """EXPLAIN QUERY PLAN de SQLite, en una línea"""
+    compilada = sentencia.params(**parametros).compile(
+        db.get_bind(), compile_kwargs={"render_postcompile": True}
+    )
+    filas = (
+        db.connection()
+        .exec_driver_sql(
+            "EXPLAIN QUERY PLAN " + str(compilada),
+            tuple(str(compilada.params[k]) for k in compilada.positiontup),
+        )
+        .all()
+    )
+    return " | ".join(fila[-1] for fila in filas)
+
+
+def cronometrar(funcion: Callable[[], object], repeticiones: int) -> float:
+    """Mediana en ms de `repeticiones` llamadas (tras una de calentamiento)"""
+    funcion()
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    return statistics.median(tiempos)
+
+
+def medir(db: Session, repeticiones: int) -> dict[str, tuple[int, float, str]]:
+    """Filas, mediana en ms y plan de cada consulta"""
+    resultados = {}
+    for nombre, (sentencia, parametros) in consultas().items():
+        filas = len(db.execute(sentencia, parametros).all())
+        ms = cronometrar(
+            lambda s=sentencia, p=parametros: db.execute(s, p).all(), repeticiones
+        )
+        resultados[nombre] = (filas, ms, plan(db, sentencia, parametros))
+    return resultados
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--habitaciones", type=int, default=3300)
+    parser.add_argument("--anios", type=int, default=5)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{tmp}/bench.db"
+        print("⏳ Cargando datos...")
+        total = cargar(database_url, args.habitaciones, args.anios)
+        print(f"📊 {total:,} hospedajes, {args.habitaciones} habitaciones")
+
+        engine = create_engine(database_url)
+        with Session(engine) as db:
+            antes = medir(db, args.repeticiones)
+            inicio = time.perf_counter()
+            for nombre, columnas in NUEVOS.items():
+                db.execute(text(f"CREATE INDEX {nombre} ON hospedajes ({columnas})"))
+            db.execute(text("ANALYZE"))
+            db.commit()
+            print(f"Índices creados en {time.perf_counter() - inicio:.1f} s")
+            despues = medir(db, args.repeticiones)
+        engine.dispose()
+
+    print(f"\n{'consulta':<18} {'filas':>7} {'antes ms':>9} {'después ms':>11}")
+    for nombre, (filas, ms_antes, _) in antes.items():
+        print(f"{nombre:<18} {filas:>7} {ms_antes:>9.1f} {despues[nombre][1]:>11.2f}")
+    print("\nPlanes:")
+    for nombre in antes:
+        print(f"  {nombre}\n    antes:   {antes[nombre][2]}")
+        print(f"    después: {despues[nombre][2]}")
+
+
+if __name__ == "__main__":
+    main()
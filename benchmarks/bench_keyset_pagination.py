@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark de paginación: OFFSET vs cursor (keyset) sobre hospedajes
+
+Carga N hospedajes (por defecto 1M) en una base SQLite temporal y mide la
+latencia de get_hospedajes para la página 1, la página 1000 y la última,
+con `skip` (OFFSET) y con `after_id` (WHERE id > :after_id).
+
+Uso:
+    python benchmarks/bench_keyset_pagination.py [--filas 1000000] [--limite 100]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Sin eco de SQL: la configuración se lee al importar la aplicación
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy import insert  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.crud.crud_hospedaje import get_hospedajes  # noqa: E402
+from app.db.base_class import Base  # noqa: E402
+from app.db.session import create_app_engine  # noqa: E402
+from app.models import Hospedaje  # noqa: E402
+
+LOTE = 50_000
+
+
+def cargar(db: Session, filas: int) -> None:
+    """Insertar `filas` hospedajes con executemany por lotes"""
+    ahora = datetime(2025, 1, 1)
+    for inicio in range(0, filas, LOTE):
+        db.execute(
+            insert(Hospedaje),
+            [
+                {
+                    "nombre_huesped": f"Huésped {i}",
+                    "numero_habitacion": f"{100 + i % 50}",
+                    "tipo_habitacion": "doble",
+                    "fecha_check_in": date(2020, 1, 1) + timedelta(days=i % 1800),
+                    "fecha_check_out": date(2020, 1, 3) + timedelta(days=i % 1800),
+                    "precio_por_noche": Decimal("80.00"),
+                    "numero_noches": 2,
+                    "total_hospedaje": Decimal("160.00"),
+                    "estado": "check_out",
+                    "fecha_creacion": ahora,
+                    "fecha_actualizacion": ahora,
+                }
+                for i in range(inicio, min(inicio + LOTE, filas))
+            ],
+        )
+    db.commit()
+
+
+def medir_ms(consulta: Callable[[], list], repeticiones: int) -> float:
+    """Mediana de la latencia en milisegundos"""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        consulta()
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filas", type=int, default=1_000_000)
+    parser.add_argument("--limite", type=int, default=100)
+    parser.add_argument("--repeticiones", type=int, default=20)
+    args = parser.parse_args()
+    limite = args.limite
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_app_engine(f"sqlite:///{tmp}/bench.db", name="bench")
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as db:
+            print(f"⏳ Cargando {args.filas:,} hospedajes...")
+            inicio = time.perf_counter()
+            cargar(db, args.filas)
+            print(f"   listo en {time.perf_counter() - inicio:.1f} s")
+
+            ultima = (args.filas - 1) // limite + 1
+            print(f"📊 limit={limite}, mediana de {args.repeticiones} lecturas")
+            print(f"{'página':>8} {'OFFSET ms':>10} {'cursor ms':>10} {'mejora':>8}")
+            for pagina in sorted({1, min(1000, ultima), ultima}):
+                saltar = (pagina - 1) * limite
+                # Los ids son consecutivos: el cursor de la página N es el
+                # último id de la página N-1
+                con_offset = medir_ms(
+                    lambda s=saltar: get_hospedajes(db, skip=s, limit=limite),
+                    args.repeticiones,
+                )
+                con_cursor = medir_ms(
+                    lambda s=saltar: get_hospedajes(db, limit=limite, after_id=s),
+                    args.repeticiones,
+                )
+                db.expunge_all()
+                print(
+                    f"{pagina:>8} {con_offset:>10.2f} {con_cursor:>10.2f} "
+                    f"{con_offset / con_cursor:>7.1f}x"
+                )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Benchmark de latencia del resto de endpoints durante un pico de inicios de sesión
+
+Arranca un servidor uvicorn con bcrypt en el threadpool compartido
+(PASSWORD_POOL_WORKERS=0, cola ilimitada: el comportamiento anterior) y otro
+con el pool de procesos acotado, y en cada uno lanza una tormenta de
+--logins clientes haciendo POST /api/v1/auth/login en bucle mientras otros
+--clientes miden GET /api/v1/usuarios/{id} (endpoint síncrono, autenticado).
+Muestra p50/p99 de ese endpoint, logins completados y logins rechazados (503).
+
+Uso:
+    python benchmarks/bench_login_storm.py [--segundos 10] [--logins 60]
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Sin eco de SQL: la configuración se lee al importar la aplicación
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.core.security import create_access_token, pwd_context  # noqa: E402
+from app.db.base_class import Base  # noqa: E402
+from app.models import Usuario  # noqa: E402
+
+EMAIL = "bench@hotel.com"
+PASSWORD = "bench-password"
+
+
+def preparar(database_url: str) -> int:
+    """Crear el esquema y el usuario de prueba; devuelve su id"""
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        usuario = db.scalars(select(Usuario).where(Usuario.email == EMAIL)).first()
+        if usuario is None:
+            usuario = Usuario(
+                nombre_completo="Usuario Benchmark",
+                email=EMAIL,
+                hashed_password=pwd_context.hash(PASSWORD),
+                is_active=True,
+            )
+            db.add(usuario)
+            db.commit()
+        usuario_id = usuario.id
+    engine.dispose()
+    return usuario_id
+
+
+def puerto_libre() -> int:
+    """Puerto TCP libre en localhost"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def percentil(valores: list[float], p: float) -> float:
+    """Percentil `p` (0-100) de una lista ordenada"""
+    return valores[min(len(valores) - 1, int(len(valores) * p / 100))]
+
+
+def tormenta(base: str, fin: float, resultados: dict[str, int]) -> None:
+    """Un cliente que inicia sesión en bucle hasta `fin`"""
+    datos = {"username": EMAIL, "password": PASSWORD}
+    with httpx.Client(base_url=base, timeout=60) as client:
+        while time.perf_counter() < fin:
+            codigo = client.post("/api/v1/auth/login", data=datos).status_code
+            resultados[str(codigo)] = resultados.get(str(codigo), 0) + 1
+            if codigo == 503:
+                time.sleep(0.05)
+
+
+def medir(
+    database_url: str, pool: bool, usuario_id: int, args: argparse.Namespace
+) -> dict[str, float]:
+    """Arrancar un servidor y medir el endpoint durante la tormenta"""
+    puerto = puerto_libre()
+    entorno = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "DEBUG": "false",
+        "PASSWORD_POOL_WORKERS": str(args.workers if pool else 0),
+        "PASSWORD_POOL_QUEUE": str(args.cola if pool else 1_000_000),
+    }
+    servidor = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(puerto)],
+        cwd=project_root,
+        env=entorno,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base = f"http://127.0.0.1:{puerto}"
+    cabeceras = {"Authorization": f"Bearer {create_access_token(subject=EMAIL)}"}
+    ruta = f"/api/v1/usuarios/{usuario_id}"
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(f"{base}/health")
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        # Calentamiento: arranca los procesos del pool y llena la caché
+        httpx.post(
+            f"{base}/api/v1/auth/login",
+            data={"username": EMAIL, "password": PASSWORD},
+            timeout=60,
+        )
+        fin = time.perf_counter() + args.segundos
+        logins: dict[str, int] = {}
+        hilos = [
+            threading.Thread(target=tormenta, args=(base, fin, logins))
+            for _ in range(args.logins)
+        ]
+        for hilo in hilos:
+            hilo.start()
+        time.sleep(0.5)  # que la tormenta esté en marcha
+
+        with httpx.Client(base_url=base, headers=cabeceras, timeout=60) as client:
+
+            def una(_: int) -> list[float]:
+                latencias = []
+                while time.perf_counter() < fin:
+                    inicio = time.perf_counter()
+                    client.get(ruta).raise_for_status()
+                    latencias.append((time.perf_counter() - inicio) * 1000)
+                    time.sleep(0.01)
+                return latencias
+
+            with ThreadPoolExecutor(args.clientes) as ejecutor:
+                latencias = sorted(
+                    x
+                    for lista in ejecutor.map(una, range(args.clientes))
+                    for x in lista
+                )
+        for hilo in hilos:
+            hilo.join()
+        return {
+            "peticiones": len(latencias),
+            "p50": statistics.median(latencias),
+            "p99": percentil(latencias, 99),
+            "login_ok": logins.get("200", 0),
+            "login_503": logins.get("503", 0),
+        }
+    finally:
+        servidor.terminate()
+        servidor.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--segundos", type=float, default=10)
+    parser.add_argument("--logins", type=int, default=60)
+    parser.add_argument("--clientes", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=2)
+    parser.add_argument("--cola", type=int, default=32)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{tmp}/bench.db"
+        usuario_id = preparar(database_url)
+
+        print(
+            f"📊 {args.logins} clientes de login durante {args.segundos:.0f} s, "
+            f"{args.clientes} clientes en GET /api/v1/usuarios/{{id}}"
+        )
+        print(
+            f"{'bcrypt':<22} {'peticiones':>10} {'p50 ms':>8} {'p99 ms':>9} "
+            f"{'logins':>7} {'503':>6}"
+        )
+        for pool in (False, True):
+            etiqueta = f"pool {args.workers}+{args.cola}" if pool else "threadpool"
+            print(f"⏳ {etiqueta}...", end="\r")
+            r = medir(database_url, pool, usuario_id, args)
+            print(
+                f"{etiqueta:<22} {r['peticiones']:>10} {r['p50']:>8.1f} "
+                f"{r['p99']:>9.1f} {r['login_ok']:>7} {r['login_503']:>6}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Benchmark del calendario de ocupación (/reportes/ocupacion)
+
+Carga --habitaciones habitaciones con un año de hospedajes consecutivos en
+una base SQLite temporal y mide GET /api/v1/reportes/ocupacion para un año
+con NumPy y con la fusión de intervalos, en formato rle y bits (latencia
+p50/p99 y tamaño de la respuesta). Como referencia mide lo que hace hoy el
+frontend: una petición a /hospedajes/habitacion/{numero} por habitación.
+
+Uso:
+    python benchmarks/bench_occupancy.py [--habitaciones 300] [--dias 365]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Generator
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Sin eco de SQL: la configuración se lee al importar la aplicación
+os.environ.setdefault("DEBUG", "false")
+
+import httpx  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
+
+from app.api import deps  # noqa: E402
+from app.crud import ocupacion  # noqa: E402
+from app.db.base_class import Base  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Habitacion, Hospedaje  # noqa: E402
+
+DESDE = date(2025, 1, 1)
+
+
+def cargar(database_url: str, habitaciones: int, dias: int) -> int:
+    """Crear el esquema y los hospedajes; devuelve cuántos se insertaron"""
+    aleatorio = random.Random(42)
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    ahora = datetime(2025, 1, 1)
+    fin = DESDE + timedelta(days=dias)
+    total = 0
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Habitacion),
+            [
+                {
+                    "numero": f"{n:03d}",
+                    "tipo": "doble",
+                    "capacidad_personas": 2,
+                    "precio_noche": Decimal("80.00"),
+                    "estado": "disponible",
+                    "fecha_creacion": ahora,
+                    "fecha_actualizacion": ahora,
+                }
+                for n in range(habitaciones)
+            ],
+        )
+        for n in range(habitaciones):
+            filas, entrada = [], DESDE - timedelta(days=3)
+            while entrada < fin:
+                entrada += timedelta(days=aleatorio.randint(0, 4))
+                noches = aleatorio.randint(1, 7)
+                filas.append(
+                    {
+                        "nombre_huesped": "Huésped",
+                        "numero_habitacion": f"{n:03d}",
+                        "tipo_habitacion": "doble",
+                        "fecha_check_in": entrada,
+                        "fecha_check_out": entrada + timedelta(days=noches),
+                        "precio_por_noche": Decimal("80.00"),
+                        "numero_noches": noches,
+                        "total_hospedaje": Decimal(80 * noches),
+                        "estado": aleatorio.choice(
+                            ["confirmado", "confirmado", "pendiente", "cancelado"]
+                        ),
+                        "fecha_creacion": ahora,
+                        "fecha_actualizacion": ahora,
+                    }
+                )
+                entrada += timedelta(days=noches)
+            conn.execute(insert(Hospedaje), filas)
+            total += len(filas)
+    engine.dispose()
+    return total
+
+
+def percentil(valores: list[float], p: float) -> float:
+    """Percentil `p` (0-100) de una lista ordenada"""
+    return valores[min(len(valores) - 1, int(len(valores) * p / 100))]
+
+
+def medir(funcion: Callable[[], int], repeticiones: int) -> dict[str, float]:
+    """Latencias p50/p99 en ms y bytes devueltos (tras un calentamiento)"""
+    funcion()
+    tiempos, tamano = [], 0
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        tamano = funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+    tiempos.sort()
+    return {
+        "p50": statistics.median(tiempos),
+        "p99": percentil(tiempos, 99),
+        "kb": tamano / 1024,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--habitaciones", type=int, default=300)
+    parser.add_argument("--dias", type=int, default=365)
+    parser.add_argument("--repeticiones", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{tmp}/bench.db"
+        total = cargar(database_url, args.habitaciones, args.dias)
+        engine = create_engine(database_url)
+        session_local = sessionmaker(autoflush=False, bind=engine)
+
+        def get_db() -> Generator[Session, None, None]:
+            with session_local() as db:
+                yield db
+
+        app.dependency_overrides[deps.get_db] = get_db
+        app.dependency_overrides[deps.get_read_db] = get_db
+        client = TestClient(app)
+        params = {
+            "desde": DESDE.isoformat(),
+            "hasta": (DESDE + timedelta(days=args.dias)).isoformat(),
+        }
+
+        def calendario(formato: str) -> Callable[[], int]:
+            def peticion() -> int:
+                response = client.get(
+                    "/api/v1/reportes/ocupacion", params={**params, "formato": formato}
+                )
+                response.raise_for_status()
+                return len(response.content)
+
+            return peticion
+
+        def por_habitacion() -> int:
+            tamano = 0
+            for n in range(args.habitaciones):
+                response: httpx.Response = client.get(
+                    f"/api/v1/hospedajes/habitacion/{n:03d}"
+                )
+                tamano += len(response.content)
+            return tamano
+
+        print(
+            f"📊 {args.habitaciones} habitaciones × {args.dias} días, "
+            f"{total:,} hospedajes"
+        )
+        print(f"{'ruta':<28} {'p50 ms':>8} {'p99 ms':>8} {'KB':>8}")
+        numpy = ocupacion.np
+        for ruta, modulo_np in (("numpy", numpy), ("intervalos", None)):
+            if ruta == "numpy" and numpy is None:
+                print("numpy no instalado: pip install -e '.[reportes]'")
+                continue
+            ocupacion.np = modulo_np
+            for formato in ("rle", "bits"):
+                r = medir(calendario(formato), args.repeticiones)
+                print(
+                    f"{ruta + ' ' + formato:<28} {r['p50']:>8.1f} "
+                    f"{r['p99']:>8.1f} {r['kb']:>8.1f}"
+                )
+        ocupacion.np = numpy
+        r = medir(por_habitacion, 3)
+        print(
+            f"{'una petición por habitación':<28} {r['p50']:>8.0f} "
+            f"{r['p99']:>8.0f} {r['kb']:>8.0f}"
+        )
+        app.dependency_overrides.clear()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark de latencia de hash y verificación de contraseñas por esquema
+
+Mide la mediana y el p95 de hash y verify con bcrypt para varias rondas y,
+si argon2-cffi está instalado, con argon2 para varias memorias (time_cost y
+parallelism según la configuración). Sirve para elegir BCRYPT_ROUNDS o
+ARGON2_MEMORY_COST junto con ``python -m app.core.password_calibration``.
+
+Uso:
+    python benchmarks/bench_password_hash.py [--muestras 5]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Sin eco de SQL: la configuración se lee al importar la aplicación
+os.environ.setdefault("DEBUG", "false")
+
+from passlib.hash import argon2, bcrypt  # noqa: E402
+
+from app.core.config import get_settings  # noqa: E402
+from app.core.security import argon2_available  # noqa: E402
+
+PASSWORD = "Contraseña-de-prueba-2024"
+
+
+def percentil(valores: list[float], p: float) -> float:
+    """Percentil `p` (0-100) de una lista ordenada"""
+    return valores[min(len(valores) - 1, int(len(valores) * p / 100))]
+
+
+def medir(handler: type, muestras: int) -> dict[str, float]:
+    """Tiempos en ms de hash y verify con el `handler` de passlib"""
+    tiempos_hash, tiempos_verify = [], []
+    for _ in range(muestras):
+        inicio = time.perf_counter()
+        hashed = handler.hash(PASSWORD)
+        tiempos_hash.append((time.perf_counter() - inicio) * 1000)
+        inicio = time.perf_counter()
+        handler.verify(PASSWORD, hashed)
+        tiempos_verify.append((time.perf_counter() - inicio) * 1000)
+    tiempos_hash.sort()
+    tiempos_verify.sort()
+    return {
+        "hash_p50": statistics.median(tiempos_hash),
+        "hash_p95": percentil(tiempos_hash, 95),
+        "verify_p50": statistics.median(tiempos_verify),
+        "verify_p95": percentil(tiempos_verify, 95),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--muestras", type=int, default=5)
+    parser.add_argument("--rondas", type=int, nargs="+", default=[10, 11, 12, 13])
+    parser.add_argument(
+        "--memoria", type=int, nargs="+", default=[19456, 65536, 131072]
+    )
+    args = parser.parse_args()
+    settings = get_settings()
+
+    casos = [(f"bcrypt rounds={r}", bcrypt.using(rounds=r)) for r in args.rondas]
+    if argon2_available():
+        casos += [
+            (
+                f"argon2id m={m // 1024}MiB t={settings.ARGON2_TIME_COST}",
+                argon2.using(
+                    memory_cost=m,
+                    time_cost=settings.ARGON2_TIME_COST,
+                    parallelism=settings.ARGON2_PARALLELISM,
+                ),
+            )
+            for m in args.memoria
+        ]
+    else:
+        print("⚠️  argon2-cffi no instalado: solo bcrypt")
+
+    print(f"📊 {args.muestras} muestras por esquema")
+    print(
+        f"{'esquema':<26} {'hash p50':>9} {'hash p95':>9} "
+        f"{'verify p50':>11} {'verify p95':>11}"
+    )
+    for nombre, handler in casos:
+        r = medir(handler, args.muestras)
+        print(
+            f"{nombre:<26} {r['hash_p50']:>9.1f} {r['hash_p95']:>9.1f} "
+            f"{r['verify_p50']:>11.1f} {r['verify_p95']:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
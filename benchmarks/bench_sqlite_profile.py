@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark del perfil SQLite: "default" vs "sqlite-performance"
+
+Ejecuta check-ins concurrentes (create_hospedaje, un commit por check-in) en
+varios hilos mientras otros hilos leen el dashboard ejecutivo en bucle, y
+compara el throughput de escrituras y lecturas y la latencia del dashboard
+para cada perfil de PRAGMAs.
+
+Uso:
+    python benchmarks/bench_sqlite_profile.py [--escritores 8] [--lectores 4]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Sin eco de SQL: la configuración se lee al importar la aplicación
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.api.endpoints.reportes import get_dashboard_ejecutivo  # noqa: E402
+from app.crud.crud_hospedaje import create_hospedaje  # noqa: E402
+from app.db.base_class import Base  # noqa: E402
+from app.db.session import create_app_engine  # noqa: E402
+from app.models import Habitacion  # noqa: E402
+from app.schemas.hospedaje import HospedajeCreate  # noqa: E402
+
+PERFILES = ("default", "sqlite-performance")
+
+
+def check_in(indice: int) -> HospedajeCreate:
+    """Datos de un check-in de prueba"""
+    entrada = date(2025, 1, 1) + timedelta(days=indice % 365)
+    return HospedajeCreate(
+        nombre_huesped=f"Huésped {indice}",
+        numero_habitacion=f"{100 + indice % 50}",
+        tipo_habitacion="doble",
+        fecha_check_in=entrada,
+        fecha_check_out=entrada + timedelta(days=2),
+        precio_por_noche=Decimal("80.00"),
+        numero_noches=2,
+        total_hospedaje=Decimal("160.00"),
+        estado="check_in",
+    )
+
+
+def ejecutar(perfil: str, directorio: str, escritores: int, lectores: int, n: int):
+    """Ejecutar la carga mixta con el perfil indicado"""
+    engine = create_app_engine(
+        f"sqlite:///{directorio}/{perfil}.db", name=perfil, sqlite_profile=perfil
+    )
+    Base.metadata.create_all(bind=engine)
+    session_local = sessionmaker(autoflush=False, bind=engine)
+    with session_local() as db:
+        db.add_all(
+            Habitacion(numero=f"{100 + i}", tipo="doble", precio_noche=80)
+            for i in range(50)
+        )
+        db.commit()
+
+    fin_escrituras = threading.Event()
+    latencias_lectura: list[float] = []
+    errores: list[str] = []
+
+    def escritor(desplazamiento: int) -> None:
+        with session_local() as db:
+            for i in range(n):
+                try:
+                    create_hospedaje(db, hospedaje_in=check_in(desplazamiento + i))
+                except Exception as e:  # noqa: BLE001 - p. ej. "database is locked"
+                    db.rollback()
+                    errores.append(type(e).__name__)
+
+    def lector() -> None:
+        with session_local() as db:
+            while not fin_escrituras.is_set():
+                inicio = time.perf_counter()
+                get_dashboard_ejecutivo(db)
+                db.rollback()  # cerrar la transacción de lectura
+                latencias_lectura.append(time.perf_counter() - inicio)
+
+    hilos_lectura = [threading.Thread(target=lector) for _ in range(lectores)]
+    hilos_escritura = [
+        threading.Thread(target=escritor, args=(w * n,)) for w in range(escritores)
+    ]
+    inicio = time.perf_counter()
+    for hilo in hilos_lectura + hilos_escritura:
+        hilo.start()
+    for hilo in hilos_escritura:
+        hilo.join()
+    total = time.perf_counter() - inicio
+    fin_escrituras.set()
+    for hilo in hilos_lectura:
+        hilo.join()
+    engine.dispose()
+
+    latencias_lectura.sort()
+    return {
+        "escrituras_s": (escritores * n - len(errores)) / total,
+        "lecturas_s": len(latencias_lectura) / total,
+        "lectura_p50_ms": statistics.median(latencias_lectura) * 1000,
+        "lectura_p99_ms": latencias_lectura[int(len(latencias_lectura) * 0.99) - 1]
+        * 1000,
+        "errores": len(errores),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--escritores", type=int, default=8)
+    parser.add_argument("--lectores", type=int, default=4)
+    parser.add_argument("--checkins", type=int, default=100, help="por escritor")
+    args = parser.parse_args()
+
+    print(
+        f"📊 {args.escritores} escritores × {args.checkins} check-ins, "
+        f"{args.lectores} lectores del dashboard"
+    )
+    print(
+        f"{'perfil':<20} {'check-ins/s':>12} {'dashboards/s':>13} "
+        f"{'p50 ms':>8} {'p99 ms':>8} {'errores':>8}"
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for perfil in PERFILES:
+            r = ejecutar(perfil, tmp, args.escritores, args.lectores, args.checkins)
+            print(
+                f"{perfil:<20} {r['escrituras_s']:>12.1f} {r['lecturas_s']:>13.1f} "
+                f"{r['lectura_p50_ms']:>8.1f} {r['lectura_p99_ms']:>8.1f} "
+                f"{r['errores']:>8}"
+            )
+
+
+if __name__ == "__main__":
+    main()
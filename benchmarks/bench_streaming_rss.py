@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memoria: listado completo vs streaming (yield_per)
+
+Carga N hospedajes (por defecto 500k) con el mismo estado en una base SQLite
+temporal y, para cada modo, arranca un servidor uvicorn nuevo, descarga
+GET /api/v1/hospedajes/estado/{estado} descartando el cuerpo y lee el pico de
+memoria residente del servidor (VmHWM en /proc, solo Linux).
+
+Uso:
+    python benchmarks/bench_streaming_rss.py [--filas 500000]
+"""
+
+import argparse
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+
+import httpx
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Sin eco de SQL: la configuración se lee al importar la aplicación
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+
+from app.db.base_class import Base  # noqa: E402
+from app.models import Hospedaje  # noqa: E402
+
+LOTE = 50_000
+MODOS = {
+    "lista": ({}, {}),
+    "stream json": ({"stream": "true"}, {}),
+    "stream ndjson": ({"stream": "true"}, {"Accept": "application/x-ndjson"}),
+}
+
+
+def cargar(database_url: str, filas: int) -> None:
+    """Crear el esquema e insertar `filas` hospedajes en check_out"""
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    ahora = datetime(2025, 1, 1)
+    with engine.begin() as conn:
+        for inicio in range(0, filas, LOTE):
+            conn.execute(
+                insert(Hospedaje),
+                [
+                    {
+                        "nombre_huesped": f"Huésped {i}",
+                        "email_huesped": f"huesped{i}@correo.com",
+                        "numero_habitacion": f"{100 + i % 50}",
+                        "tipo_habitacion": "doble",
+                        "fecha_check_in": date(2020, 1, 1) + timedelta(days=i % 1800),
+                        "fecha_check_out": date(2020, 1, 3) + timedelta(days=i % 1800),
+                        "precio_por_noche": Decimal("80.00"),
+                        "numero_noches": 2,
+                        "total_hospedaje": Decimal("160.00"),
+                        "estado": "check_out",
+                        "fecha_creacion": ahora,
+                        "fecha_actualizacion": ahora,
+                    }
+                    for i in range(inicio, min(inicio + LOTE, filas))
+                ],
+            )
+    engine.dispose()
+
+
+def memoria_mb(pid: int, campo: str) -> float:
+    """Leer VmRSS o VmHWM (pico) de /proc/<pid>/status en MB"""
+    for linea in Path(f"/proc/{pid}/status").read_text().splitlines():
+        if linea.startswith(campo + ":"):
+            return int(linea.split()[1]) / 1024
+    raise RuntimeError(f"{campo} no disponible")
+
+
+def puerto_libre() -> int:
+    """Puerto TCP libre en localhost"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def medir(database_url: str, params: dict, headers: dict) -> dict[str, float]:
+    """Arrancar un servidor, descargar el listado y medir su memoria"""
+    puerto = puerto_libre()
+    entorno = {**os.environ, "DATABASE_URL": database_url, "DEBUG": "false"}
+    servidor = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(puerto)],
+        cwd=project_root,
+        env=entorno,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base = f"http://127.0.0.1:{puerto}"
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(f"{base}/health")
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        reposo = memoria_mb(servidor.pid, "VmRSS")
+
+        inicio = time.perf_counter()
+        recibidos = 0
+        with httpx.stream(
+            "GET",
+            f"{base}/api/v1/hospedajes/estado/check_out",
+            params=params,
+            headers=headers,
+            timeout=600,
+        ) as response:
+            primer_byte = None
+            for fragmento in response.iter_raw():
+                if primer_byte is None:
+                    primer_byte = time.perf_counter() - inicio
+                recibidos += len(fragmento)
+        return {
+            "reposo_mb": reposo,
+            "pico_mb": memoria_mb(servidor.pid, "VmHWM"),
+            "primer_byte_s": primer_byte or 0.0,
+            "total_s": time.perf_counter() - inicio,
+            "cuerpo_mb": recibidos / 1024 / 1024,
+        }
+    finally:
+        servidor.terminate()
+        servidor.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--filas", type=int, default=500_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = f"sqlite:///{tmp}/bench.db"
+        print(f"⏳ Cargando {args.filas:,} hospedajes...")
+        cargar(database_url, args.filas)
+
+        print(
+            f"{'modo':<15} {'reposo MB':>10} {'pico MB':>9} {'Δ MB':>8} "
+            f"{'1er byte s':>11} {'total s':>8} {'cuerpo MB':>10}"
+        )
+        for modo, (params, headers) in MODOS.items():
+            r = medir(database_url, params, headers)
+            print(
+                f"{modo:<15} {r['reposo_mb']:>10.1f} {r['pico_mb']:>9.1f} "
+                f"{r['pico_mb'] - r['reposo_mb']:>8.1f} {r['primer_byte_s']:>11.2f} "
+                f"{r['total_s']:>8.2f} {r['cuerpo_mb']:>10.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Benchmark de la caché de usuarios autenticados (get_current_user)
+
+Arranca un servidor uvicorn con USER_CACHE_ENABLED=false y otro con true sobre
+la misma base y lanza N peticiones autenticadas con C clientes concurrentes
+contra POST /api/v1/auth/test-token (solo resuelve el usuario) y
+GET /api/v1/usuarios/{id}. Muestra peticiones por segundo y latencias p50/p99.
+
+Por defecto usa una base SQLite temporal, donde el viaje a la base es barato;
+con --database-url se puede medir contra PostgreSQL (se crean las tablas y el
+usuario de prueba si no existen).
+
+Uso:
+    python benchmarks/bench_user_cache.py [--peticiones 5000] [--clientes 16]
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+
+project_root = str(Path(__file__).parent.parent)
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+# Sin eco de SQL: la configuración se lee al importar la aplicación
+os.environ.setdefault("DEBUG", "false")
+
+from sqlalchemy import create_engine, select  # noqa: E402
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.core.security import create_access_token  # noqa: E402
+from app.db.base_class import Base  # noqa: E402
+from app.models import Usuario  # noqa: E402
+
+EMAIL = "bench@hotel.com"
+
+
+def preparar(database_url: str) -> int:
+    """Crear el esquema y el usuario de prueba; devuelve su id"""
+    engine = create_engine(database_url)
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        usuario = db.scalars(select(Usuario).where(Usuario.email == EMAIL)).first()
+        if usuario is None:
+            usuario = Usuario(
+                nombre_completo="Usuario Benchmark",
+                email=EMAIL,
+                hashed_password="x",
+                is_active=True,
+            )
+            db.add(usuario)
+            db.commit()
+        usuario_id = usuario.id
+    engine.dispose()
+    return usuario_id
+
+
+def puerto_libre() -> int:
+    """Puerto TCP libre en localhost"""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def percentil(valores: list[float], p: float) -> float:
+    """Percentil `p` (0-100) de una lista ordenada"""
+    return valores[min(len(valores) - 1, int(len(valores) * p / 100))]
+
+
+def cargar(
+    base: str, metodo: str, ruta: str, token: str, peticiones: int, clientes: int
+) -> dict[str, float]:
+    """Lanzar las peticiones en paralelo y medir latencias"""
+    cabeceras = {"Authorization": f"Bearer {token}"}
+    with httpx.Client(base_url=base, headers=cabeceras, timeout=30) as client:
+
+        def una(_: int) -> float:
+            inicio = time.perf_counter()
+            response = client.request(metodo, ruta)
+            response.raise_for_status()
+            return (time.perf_counter() - inicio) * 1000
+
+        for _ in range(min(200, peticiones)):  # calentamiento
+            una(0)
+        inicio = time.perf_counter()
+        with ThreadPoolExecutor(clientes) as pool:
+            latencias = sorted(pool.map(una, range(peticiones)))
+        total = time.perf_counter() - inicio
+    return {
+        "rps": peticiones / total,
+        "p50": statistics.median(latencias),
+        "p99": percentil(latencias, 99),
+    }
+
+
+def medir(
+    database_url: str, cache: bool, usuario_id: int, args: argparse.Namespace
+) -> dict[str, dict[str, float]]:
+    """Arrancar un servidor con o sin caché y medir ambas rutas"""
+    puerto = puerto_libre()
+    entorno = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "DEBUG": "false",
+        "USER_CACHE_ENABLED": str(cache).lower(),
+    }
+    servidor = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(puerto)],
+        cwd=project_root,
+        env=entorno,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    base = f"http://127.0.0.1:{puerto}"
+    token = create_access_token(subject=EMAIL)
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(f"{base}/health")
+                break
+            except httpx.TransportError:
+                time.sleep(0.1)
+        return {
+            ruta: cargar(base, metodo, ruta, token, args.peticiones, args.clientes)
+            for metodo, ruta in (
+                ("POST", "/api/v1/auth/test-token"),
+                ("GET", f"/api/v1/usuarios/{usuario_id}"),
+            )
+        }
+    finally:
+        servidor.terminate()
+        servidor.wait()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--peticiones", type=int, default=5000)
+    parser.add_argument("--clientes", type=int, default=16)
+    parser.add_argument("--database-url", default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        database_url = args.database_url or f"sqlite:///{tmp}/bench.db"
+        usuario_id = preparar(database_url)
+
+        print(
+            f"📊 {args.peticiones:,} peticiones, {args.clientes} clientes "
+            f"({database_url.split(':', 1)[0]})"
+        )
+        print(f"{'ruta':<26} {'caché':<6} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+        for cache in (False, True):
+            for ruta, r in medir(database_url, cache, usuario_id, args).items():
+                print(
+                    f"{ruta:<26} {'sí' if cache else 'no':<6} {r['rps']:>8.0f} "
+                    f"{r['p50']:>8.2f} {r['p99']:>8.2f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
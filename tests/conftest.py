@@ -0,0 +1,115 @@
+"""
+Fixtures compartidas para los tests
+"""
+
+from collections.abc import AsyncGenerator, Callable, Generator
+from contextlib import AbstractContextManager
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool
+
+from app import database
+from app.api import deps
+from app.api.api import build_api_router
+from app.crud.catalog_cache import catalog_cache
+from app.crud.crud_usuario import user_cache
+from app.db.base_class import Base
+from app.db.query_stats import QueryStats, assert_max_queries, instrument_queries
+from app.db.session import create_app_engine
+from app.main import app
+
+
+@pytest.fixture(autouse=True)
+def _vaciar_caches() -> Generator[None, None, None]:
+    """Cada test parte de cachés vacías (son globales al proceso)"""
+    catalog_cache.clear()
+    user_cache.clear()
+    yield
+    catalog_cache.clear()
+    user_cache.clear()
+
+
+@pytest.fixture
+def db_engine(tmp_path: Path) -> Generator[Engine, None, None]:
+    """Engine SQLite temporario con todas las tablas creadas"""
+    engine = create_app_engine(f"sqlite:///{tmp_path}/test.db", name="test")
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db_session(db_engine: Engine) -> Generator[Session, None, None]:
+    """Sesión sobre la base temporaria"""
+    with Session(db_engine) as db:
+        yield db
+
+
+@pytest.fixture
+def db_client(db_engine: Engine) -> Generator[TestClient, None, None]:
+    """Cliente de pruebas cuyas sesiones (primario y réplica) usan la base temporaria"""
+    session_local = sessionmaker(autoflush=False, bind=db_engine)
+
+    def get_db() -> Generator[Session, None, None]:
+        with session_local() as db:
+            yield db
+
+    app.dependency_overrides[deps.get_db] = get_db
+    app.dependency_overrides[deps.get_read_db] = get_db
+    # auth y usuarios dependen de app.database.get_db
+    app.dependency_overrides[database.get_db] = get_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def async_db_client(db_engine: Engine) -> Generator[TestClient, None, None]:
+    """
+    Cliente de pruebas de una aplicación con DATABASE_ASYNC habilitado: las
+    lecturas asíncronas (aiosqlite) y las síncronas usan la base temporaria
+    """
+    session_local = sessionmaker(autoflush=False, bind=db_engine)
+    # Sin pool: cada petición de TestClient corre en su propio event loop
+    async_engine = create_async_engine(
+        db_engine.url.set(drivername="sqlite+aiosqlite"), poolclass=NullPool
+    )
+    instrument_queries(async_engine.sync_engine)
+    async_session_local = async_sessionmaker(async_engine, expire_on_commit=False)
+
+    def get_db() -> Generator[Session, None, None]:
+        with session_local() as db:
+            yield db
+
+    async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with async_session_local() as db:
+            yield db
+
+    aplicacion = FastAPI()
+    aplicacion.include_router(build_api_router(async_reads=True))
+    aplicacion.dependency_overrides.update(
+        {
+            deps.get_db: get_db,
+            deps.get_read_db: get_db,
+            database.get_db: get_db,
+            deps.get_async_db: get_async_db,
+            deps.get_async_read_db: get_async_db,
+        }
+    )
+    yield TestClient(aplicacion)
+
+
+@pytest.fixture
+def query_budget() -> Callable[[int], AbstractContextManager[QueryStats]]:
+    """
+    Presupuesto de consultas por bloque:
+
+        with query_budget(1):
+            db_client.get("/api/v1/habitaciones/")
+    """
+    return assert_max_queries
@@ -0,0 +1,56 @@
+"""
+Tests de los endpoints de lectura asíncronos (DATABASE_ASYNC=true)
+"""
+
+from fastapi.testclient import TestClient
+from starlette.routing import Match
+
+HABITACIONES = "/api/v1/habitaciones/"
+
+
+def crear_habitaciones(client: TestClient) -> None:
+    """Tres habitaciones, una de ellas en mantenimiento"""
+    for numero, tipo, estado in (
+        ("101", "doble", "disponible"),
+        ("102", "suite", "disponible"),
+        ("103", "doble", "mantenimiento"),
+    ):
+        response = client.post(
+            HABITACIONES,
+            json={
+                "numero": numero,
+                "tipo": tipo,
+                "precio_noche": "80.00",
+                "estado": estado,
+            },
+        )
+        assert response.status_code == 200, response.text
+
+
+def test_disponibilidad_no_la_captura_numero(async_db_client: TestClient) -> None:
+    """Test que verifica /habitaciones/disponibilidad con la ruta asíncrona"""
+    crear_habitaciones(async_db_client)
+    response = async_db_client.get(
+        f"{HABITACIONES}disponibilidad",
+        params={"desde": "2025-06-10", "hasta": "2025-06-12", "tipo": "doble"},
+    )
+    assert response.status_code == 200, response.text
+    assert [h["numero"] for h in response.json()] == ["101"]
+
+    response = async_db_client.get(
+        f"{HABITACIONES}disponibilidad",
+        params={"desde": "2025-06-12", "hasta": "2025-06-10"},
+    )
+    assert response.status_code == 400
+    assert async_db_client.get(f"{HABITACIONES}102").json()["tipo"] == "suite"
+
+
+def test_rutas_estaticas_sin_sombra(async_db_client: TestClient) -> None:
+    """Test que verifica que ninguna ruta GET estática queda tapada por un patrón"""
+    rutas = async_db_client.app.router.routes
+    for ruta in rutas:
+        if "GET" not in getattr(ruta, "methods", ()) or "{" in ruta.path:
+            continue
+        scope = {"type": "http", "method": "GET", "path": ruta.path}
+        primera = next(r for r in rutas if r.matches(scope)[0] == Match.FULL)
+        assert primera.path == ruta.path, f"{ruta.path} lo atiende {primera.path}"
@@ -0,0 +1,50 @@
+"""
+Tests de la ruta asíncrona de base de datos
+"""
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.crud.aio import crud_habitacion
+from app.db.async_session import get_async_database_url
+from app.db.base_class import Base
+from app.models import Habitacion
+
+
+def test_get_async_database_url() -> None:
+    """Test que verifica la derivación del driver asíncrono"""
+    assert (
+        get_async_database_url("postgresql://u:p@localhost:5432/db")
+        == "postgresql+asyncpg://u:p@localhost:5432/db"
+    )
+    assert get_async_database_url("sqlite:///./hotel.db") == (
+        "sqlite+aiosqlite:///./hotel.db"
+    )
+    assert get_async_database_url("sqlite+aiosqlite:///x.db") == (
+        "sqlite+aiosqlite:///x.db"
+    )
+
+
+@pytest.mark.asyncio
+async def test_crud_habitacion_async() -> None:
+    """Test que verifica las lecturas asíncronas de habitaciones"""
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    async with AsyncSession(engine) as db:
+        db.add_all(
+            [
+                Habitacion(numero="101", tipo="doble", precio_noche=80),
+                Habitacion(numero="102", tipo="suite", precio_noche=150),
+            ]
+        )
+        await db.commit()
+
+        habitaciones = await crud_habitacion.get_habitaciones(db, skip=1, limit=10)
+        assert [h.numero for h in habitaciones] == ["102"]
+        habitacion = await crud_habitacion.get_habitacion_by_numero(db, numero="101")
+        assert habitacion is not None
+        assert habitacion.tipo == "doble"
+
+    await engine.dispose()
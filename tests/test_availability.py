@@ -0,0 +1,92 @@
+"""
+Tests de la búsqueda de habitaciones libres por rango de fechas
+"""
+
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.db.query_stats import QueryStats
+from app.models import Habitacion, Hospedaje
+
+DISPONIBILIDAD = "/api/v1/habitaciones/disponibilidad"
+
+
+@pytest.fixture
+def hotel(db_session: Session) -> None:
+    """Cuatro dobles, una suite y hospedajes alrededor del 10 al 12 de junio"""
+    for numero, tipo, capacidad, estado in [
+        ("101", "doble", 2, "disponible"),
+        ("102", "doble", 2, "ocupada"),
+        ("103", "doble", 2, "disponible"),
+        ("104", "doble", 2, "mantenimiento"),
+        ("201", "suite", 4, "disponible"),
+    ]:
+        db_session.add(
+            Habitacion(
+                numero=numero,
+                tipo=tipo,
+                capacidad_personas=capacidad,
+                precio_noche=80,
+                estado=estado,
+            )
+        )
+    for numero, entrada, salida, estado in [
+        ("101", date(2025, 6, 11), date(2025, 6, 14), "confirmado"),
+        ("102", date(2025, 6, 9), date(2025, 6, 12), "cancelado"),
+        # Sale el mismo día que entra el siguiente: no se solapa
+        ("103", date(2025, 6, 7), date(2025, 6, 10), "check_in"),
+        ("103", date(2025, 6, 12), date(2025, 6, 15), "pendiente"),
+    ]:
+        db_session.add(
+            Hospedaje(
+                nombre_huesped="Huésped",
+                numero_habitacion=numero,
+                tipo_habitacion="doble",
+                fecha_check_in=entrada,
+                fecha_check_out=salida,
+                precio_por_noche=80,
+                numero_noches=(salida - entrada).days,
+                total_hospedaje=80 * (salida - entrada).days,
+                estado=estado,
+            )
+        )
+    db_session.commit()
+
+
+@pytest.mark.usefixtures("hotel")
+def test_habitaciones_libres(
+    db_client: TestClient,
+    query_budget: Callable[[int], AbstractContextManager[QueryStats]],
+) -> None:
+    """Test que verifica solapes, estados que liberan y filtros en una consulta"""
+    with query_budget(1):
+        response = db_client.get(
+            DISPONIBILIDAD, params={"desde": "2025-06-10", "hasta": "2025-06-12"}
+        )
+    assert response.status_code == 200
+    assert [h["numero"] for h in response.json()] == ["102", "103", "201"]
+
+    libres = db_client.get(
+        DISPONIBILIDAD,
+        params={"desde": "2025-06-10", "hasta": "2025-06-13", "tipo": "doble"},
+    ).json()
+    assert [h["numero"] for h in libres] == ["102"]
+
+    libres = db_client.get(
+        DISPONIBILIDAD,
+        params={"desde": "2025-06-10", "hasta": "2025-06-11", "capacidad": 3},
+    ).json()
+    assert [h["numero"] for h in libres] == ["201"]
+
+
+def test_rango_invalido(db_client: TestClient) -> None:
+    """Test que verifica que la salida debe ser posterior a la entrada"""
+    response = db_client.get(
+        DISPONIBILIDAD, params={"desde": "2025-06-10", "hasta": "2025-06-10"}
+    )
+    assert response.status_code == 400
@@ -0,0 +1,146 @@
+"""
+Tests de la prevención de solapes al reservar: reservas simultáneas y en lote
+"""
+
+import random
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+from datetime import date, timedelta
+from itertools import combinations
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.crud.crud_hospedaje import (
+    ESTADOS_OCUPAN,
+    HabitacionOcupadaError,
+    create_hospedaje,
+)
+from app.db.query_stats import QueryStats
+from app.models import Hospedaje
+from app.schemas.hospedaje import HospedajeCreate
+
+HOSPEDAJES = "/api/v1/hospedajes/"
+
+
+def reserva(numero: str, entrada: date, noches: int, estado: str = "confirmado"):
+    """Datos de un hospedaje de `noches` noches a 80 la noche"""
+    return {
+        "nombre_huesped": "Huésped",
+        "numero_habitacion": numero,
+        "tipo_habitacion": "doble",
+        "fecha_check_in": entrada.isoformat(),
+        "fecha_check_out": (entrada + timedelta(days=noches)).isoformat(),
+        "precio_por_noche": "80.00",
+        "numero_noches": noches,
+        "total_hospedaje": f"{80 * noches}.00",
+        "estado": estado,
+    }
+
+
+def test_solape_rechazado_con_409(db_client: TestClient) -> None:
+    """Test que verifica los solapes al crear y al modificar un hospedaje"""
+    junio = date(2025, 6, 10)
+    assert db_client.post(HOSPEDAJES, json=reserva("101", junio, 3)).status_code == 201
+
+    response = db_client.post(HOSPEDAJES, json=reserva("101", junio + timedelta(2), 2))
+    assert response.status_code == 409
+    # Entra el día que sale el anterior, otra habitación o cancelado: se admite
+    for datos in (
+        reserva("101", junio + timedelta(3), 2),
+        reserva("102", junio, 3),
+        reserva("101", junio, 3, estado="cancelado"),
+    ):
+        assert db_client.post(HOSPEDAJES, json=datos).status_code == 201
+
+    # Reactivar el cancelado volvería a ocupar la habitación
+    response = db_client.put(f"{HOSPEDAJES}4", json={"estado": "confirmado"})
+    assert response.status_code == 409
+    response = db_client.put(f"{HOSPEDAJES}4", json={"numero_habitacion": "103"})
+    assert response.status_code == 200
+    assert (
+        db_client.put(f"{HOSPEDAJES}4", json={"estado": "confirmado"}).status_code
+        == 200
+    )
+
+
+def test_reservas_simultaneas_sin_dobles_ventas(db_engine: Engine) -> None:
+    """Test que verifica que 100 reservas en paralelo no venden una noche dos veces"""
+    aleatorio = random.Random(7)
+    intentos = [
+        HospedajeCreate.model_validate(
+            reserva(
+                f"10{aleatorio.randint(1, 4)}",
+                date(2025, 6, 1) + timedelta(aleatorio.randint(0, 20)),
+                aleatorio.randint(1, 5),
+            )
+        )
+        for _ in range(100)
+    ]
+
+    def reservar(hospedaje_in: HospedajeCreate) -> bool:
+        with Session(db_engine) as db:
+            try:
+                create_hospedaje(db, hospedaje_in=hospedaje_in)
+            except HabitacionOcupadaError:
+                return False
+            return True
+
+    with ThreadPoolExecutor(16) as pool:
+        resultados = list(pool.map(reservar, intentos))
+
+    with Session(db_engine) as db:
+        ocupan = db.scalars(
+            select(Hospedaje).where(Hospedaje.estado.in_(ESTADOS_OCUPAN))
+        ).all()
+    assert len(ocupan) == sum(resultados) > 4
+    for a, b in combinations(ocupan, 2):
+        if a.numero_habitacion == b.numero_habitacion:
+            assert (
+                a.fecha_check_out <= b.fecha_check_in
+                or b.fecha_check_out <= a.fecha_check_in
+            ), f"doble venta: {a!r} y {b!r}"
+
+
+def test_alta_en_lote(
+    db_client: TestClient,
+    query_budget: Callable[[int], AbstractContextManager[QueryStats]],
+) -> None:
+    """Test que verifica los resultados por fila de un alta en lote"""
+    junio = date(2025, 6, 10)
+    assert db_client.post(HOSPEDAJES, json=reserva("101", junio, 3)).status_code == 201
+
+    lote = [
+        reserva("102", junio, 3),
+        reserva("101", junio + timedelta(1), 1),  # ocupada de antes
+        reserva("102", junio + timedelta(2), 2),  # choca con la fila 0
+        reserva("103", junio, 2, estado="cancelado"),
+        {**reserva("104", junio, 1), "fecha_check_out": junio.isoformat()},
+        reserva("101", junio + timedelta(3), 2),
+    ]
+    # BEGIN IMMEDIATE, solapes del lote y, en SQLite, un INSERT por fila creada
+    with query_budget(2 + 3):
+        response = db_client.post(f"{HOSPEDAJES}lote", json=lote)
+    assert response.status_code == 200
+    datos = response.json()
+    assert datos["creados"] == 3
+    assert [r["estado"] for r in datos["resultados"]] == [
+        "creado",
+        "conflicto",
+        "conflicto",
+        "creado",
+        "invalido",
+        "creado",
+    ]
+    creados = [r for r in datos["resultados"] if r["estado"] == "creado"]
+    for resultado in creados:
+        hospedaje = db_client.get(f"{HOSPEDAJES}{resultado['id']}").json()
+        assert (
+            hospedaje["numero_habitacion"]
+            == lote[resultado["indice"]]["numero_habitacion"]
+        )
+
+    assert db_client.post(f"{HOSPEDAJES}lote", json=[]).status_code == 422
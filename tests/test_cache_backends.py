@@ -0,0 +1,208 @@
+"""
+Tests de los almacenes compartidos y de la invalidación entre workers
+"""
+
+import fnmatch
+import socketserver
+import threading
+import time
+from collections.abc import Callable, Generator
+from pathlib import Path
+
+import pytest
+
+from app.core.cache import SharedCache, TTLCache
+from app.core.cache_backends import (
+    REVOCATION_PREFIX,
+    CacheBackend,
+    CacheBackendError,
+    MemoryBackend,
+    RedisBackend,
+    SQLiteBackend,
+)
+
+
+class _RedisHandler(socketserver.StreamRequestHandler):
+    """Sustituto local de Redis: los comandos RESP que usa RedisBackend"""
+
+    def _leer(self) -> list[bytes]:
+        cabecera = self.rfile.readline()
+        if not cabecera:
+            raise EOFError
+        argumentos = []
+        for _ in range(int(cabecera[1:])):
+            tamano = int(self.rfile.readline()[1:])
+            argumentos.append(self.rfile.read(tamano + 2)[:-2])
+        return argumentos
+
+    def _bulk(self, valor: bytes | None) -> bytes:
+        return b"$-1\r\n" if valor is None else b"$%d\r\n%s\r\n" % (len(valor), valor)
+
+    def handle(self) -> None:
+        datos: dict[bytes, tuple[float, bytes]] = self.server.datos  # type: ignore[attr-defined]
+        while True:
+            try:
+                comando, *args = self._leer()
+            except EOFError:
+                return
+            comando = comando.upper()
+            if comando == b"GET":
+                caduca, valor = datos.get(args[0], (0.0, None))
+                vigente = valor is not None and (caduca == 0 or caduca > time.time())
+                respuesta = self._bulk(valor if vigente else None)
+            elif comando == b"SET":
+                caduca = time.time() + int(args[3]) / 1000 if len(args) > 2 else 0
+                datos[args[0]] = (caduca, args[1])
+                respuesta = b"+OK\r\n"
+            elif comando == b"INCR":
+                valor = int(datos.get(args[0], (0, b"0"))[1]) + 1
+                datos[args[0]] = (0, str(valor).encode())
+                respuesta = b":%d\r\n" % valor
+            elif comando == b"DEL":
+                respuesta = b":%d\r\n" % sum(
+                    datos.pop(k, None) is not None for k in args
+                )
+            elif comando == b"SCAN":
+                claves = [k for k in datos if fnmatch.fnmatchcase(k, args[2])]
+                respuesta = b"*2\r\n$1\r\n0\r\n*%d\r\n" % len(claves) + b"".join(
+                    self._bulk(k) for k in claves
+                )
+            else:
+                respuesta = b"+OK\r\n"
+            self.wfile.write(respuesta)
+
+
+@pytest.fixture
+def redis_url() -> Generator[str, None, None]:
+    """URL de un servidor RESP local en un puerto libre"""
+    servidor = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _RedisHandler)
+    servidor.daemon_threads = True
+    servidor.datos = {}  # type: ignore[attr-defined]
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    yield f"redis://127.0.0.1:{servidor.server_address[1]}/0"
+    servidor.shutdown()
+    servidor.server_close()
+
+
+@pytest.fixture(params=["memory", "sqlite", "redis"])
+def backend_factory(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> Callable[[], CacheBackend]:
+    """Fábrica de conexiones al mismo almacén (una por worker simulado)"""
+    if request.param == "memory":
+        compartido = MemoryBackend()
+        return lambda: compartido
+    if request.param == "sqlite":
+        return lambda: SQLiteBackend(str(tmp_path / "cache.sqlite3"))
+    url = request.getfixturevalue("redis_url")
+    return lambda: RedisBackend(url)
+
+
+def test_contrato_del_almacen(backend_factory: Callable[[], CacheBackend]) -> None:
+    """Test que verifica valores con TTL, versiones y clear en cada almacén"""
+    backend = backend_factory()
+    backend.set("productos:0:activos", b"\x00datos", ttl=60)
+    backend.set("caduca", b"x", ttl=0.01)
+    time.sleep(0.02)
+
+    otro = backend_factory()
+    assert otro.get("productos:0:activos") == b"\x00datos"
+    assert otro.get("caduca") is None
+    assert otro.get("no-existe") is None
+    assert backend.get_version("productos") == 0
+    assert backend.incr_version("productos") == 1
+    assert otro.incr_version("productos") == 2
+
+    # La lista de revocación sobrevive a vaciar la caché
+    backend.set(REVOCATION_PREFIX + "jti:abc", b"1", ttl=60)
+    backend.clear()
+    assert otro.get("productos:0:activos") is None
+    assert otro.get_version("productos") == 0
+    assert otro.get(REVOCATION_PREFIX + "jti:abc") == b"1"
+
+
+def test_invalidacion_entre_workers(
+    backend_factory: Callable[[], CacheBackend],
+) -> None:
+    """Test que verifica que una escritura llega al otro worker a tiempo"""
+    ahora = [0.0]
+
+    def worker() -> SharedCache:
+        return SharedCache(
+            TTLCache(maxsize=10, ttl=60),
+            backend_factory(),
+            check_interval=1.0,
+            clock=lambda: ahora[0],
+        )
+
+    a, b = worker(), worker()
+    cargas: list[str] = []
+
+    def cargar(valor: str) -> Callable[[], str]:
+        return lambda: cargas.append(valor) or valor
+
+    key = ("productos", "activos")
+    assert a.get_or_load(key, cargar("v1")) == "v1"
+    # El segundo worker lo toma del almacén compartido sin ir a la base
+    assert b.get_or_load(key, cargar("v1")) == "v1"
+    assert cargas == ["v1"]
+    assert b.stats()["shared_hits"] == 1
+
+    a.invalidate("productos")
+    assert a.get_or_load(key, cargar("v2")) == "v2"
+    # Dentro del intervalo el otro worker aún puede servir el valor anterior
+    ahora[0] = 0.5
+    assert b.get_or_load(key, cargar("v2")) == "v1"
+    # Pasado el intervalo ve la nueva versión
+    ahora[0] = 1.0
+    assert b.get_or_load(key, cargar("v2")) == "v2"
+    assert cargas == ["v1", "v2"]
+
+
+def test_memoria_acotada_tras_invalidaciones() -> None:
+    """Test que verifica que las versiones antiguas no se acumulan en memoria"""
+    backend = MemoryBackend(maxsize=50)
+    cache = SharedCache(TTLCache(maxsize=4, ttl=60), backend, check_interval=0)
+    for i in range(1000):
+        if i % 10 == 0:
+            cache.invalidate("productos")
+        cache.get_or_load(("productos", i % 7), lambda i=i: i)
+    assert len(backend._values) <= 50
+
+    # Al llenarse se descartan antes las caducadas que las vigentes
+    backend = MemoryBackend(maxsize=2)
+    backend.set("vigente", b"1", ttl=60)
+    backend.set("caduca", b"2", ttl=0.01)
+    time.sleep(0.02)
+    backend.set("nueva", b"3", ttl=60)
+    assert backend.get("vigente") == b"1"
+    assert backend.get("nueva") == b"3"
+
+
+def test_almacen_caido_lee_de_la_base() -> None:
+    """Test que verifica que sin almacén la caché se omite"""
+    cache = SharedCache(
+        TTLCache(maxsize=10, ttl=60), RedisBackend("redis://127.0.0.1:1/0")
+    )
+    assert cache.get_or_load(("tarifas", "activas"), lambda: [1]) == [1]
+    assert cache.get_or_load(("tarifas", "activas"), lambda: [2]) == [2]
+    cache.invalidate("tarifas")
+    assert cache.stats()["backend_errors"] == 3
+
+
+def test_sqlite_purga_ocasional(tmp_path: Path) -> None:
+    """Test que verifica la purga periódica y el error con una ruta inválida"""
+    with pytest.raises(CacheBackendError):
+        SQLiteBackend(str(tmp_path / "no-existe" / "cache.sqlite3"))
+
+    backend = SQLiteBackend(str(tmp_path / "cache.sqlite3"))
+    backend.set("caduca", b"x", ttl=0.01)
+    time.sleep(0.02)
+    contar = "SELECT COUNT(*) FROM cache_entries"
+    for i in range(backend.PURGE_EVERY - 2):
+        backend.set(f"clave:{i}", b"1", ttl=60)
+    assert backend._execute(contar).fetchone()[0] == backend.PURGE_EVERY - 1
+    backend.set("ultima", b"1", ttl=60)
+    assert backend._execute(contar).fetchone()[0] == backend.PURGE_EVERY - 1
+    assert backend.get("caduca") is None
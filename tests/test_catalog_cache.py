@@ -0,0 +1,88 @@
+"""
+Tests de la caché de catálogos
+"""
+
+from fastapi.testclient import TestClient
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.crud import crud_producto
+from app.crud.catalog_cache import catalog_cache
+from app.db.query_stats import count_queries
+from app.schemas.producto import ProductoCreate, ProductoUpdate
+
+
+class Reloj:
+    """Reloj manual para controlar la caducidad"""
+
+    def __init__(self) -> None:
+        self.ahora = 0.0
+
+    def __call__(self) -> float:
+        return self.ahora
+
+
+def test_ttl_y_lru() -> None:
+    """Test que verifica la caducidad y el desalojo del menos reciente"""
+    reloj = Reloj()
+    cache = TTLCache(maxsize=2, ttl=10, clock=reloj)
+    cache.set(("a", 1), "uno")
+    cache.set(("a", 2), "dos")
+    assert cache.get(("a", 1)) == "uno"  # ("a", 2) pasa a ser el más antiguo
+    cache.set(("a", 3), "tres")
+    assert cache.get(("a", 2)) is None
+    assert cache.evictions == 1
+
+    reloj.ahora = 10
+    assert cache.get(("a", 1)) is None
+    assert cache.stats()["hits"] == 1
+
+
+def test_carga_anterior_a_invalidacion_se_descarta() -> None:
+    """Test que verifica que una carga en curso no reintroduce datos viejos"""
+    cache = TTLCache(maxsize=10, ttl=60)
+
+    def cargar() -> str:
+        cache.invalidate("productos")  # escritura concurrente durante la carga
+        return "viejo"
+
+    assert cache.get_or_load(("productos", "activos"), cargar) == "viejo"
+    assert cache.get(("productos", "activos")) is None
+
+
+def test_write_through_en_crud(db_engine: Engine) -> None:
+    """Test que verifica aciertos e invalidación con create_/update_"""
+    with Session(db_engine) as db:
+        crud_producto.create_producto(
+            db,
+            producto_in=ProductoCreate(nombre="Café", categoria="bebidas", precio=2),
+        )
+    with Session(db_engine) as db:
+        assert len(crud_producto.get_productos_activos(db)) == 1
+
+    with Session(db_engine) as db, count_queries() as stats:
+        (cafe,) = crud_producto.get_productos_activos(db)
+    assert stats.count == 0
+    assert cafe.nombre == "Café"  # copia desligada, legible sin sesión
+
+    with Session(db_engine) as db:
+        te = crud_producto.create_producto(
+            db, producto_in=ProductoCreate(nombre="Té", categoria="bebidas", precio=2)
+        )
+        assert len(crud_producto.get_productos_activos(db)) == 2
+        crud_producto.update_producto(
+            db, db_producto=te, producto_in=ProductoUpdate(activo=False)
+        )
+        assert [p.nombre for p in crud_producto.get_productos_activos(db)] == ["Café"]
+
+
+def test_contadores_expuestos(db_client: TestClient) -> None:
+    """Test que verifica /health/cache"""
+    db_client.get("/api/v1/productos/", params={"activos_solo": True})
+    db_client.get("/api/v1/productos/", params={"activos_solo": True})
+
+    stats = db_client.get("/health/cache").json()["catalog"]
+    assert stats["misses"] == 1
+    assert stats["hits"] == 1
+    assert stats["size"] == 1
@@ -0,0 +1,113 @@
+"""
+Tests de la compresión de respuestas y de los estáticos precomprimidos
+"""
+
+import gzip
+import os
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from app.core.compression import (
+    PrecompressedStaticFiles,
+    encoded_etag,
+    negotiate_encoding,
+    precompress_directory,
+    strip_etag_encoding,
+)
+from app.models import Producto
+
+
+def test_negociacion_respeta_q0() -> None:
+    """Test que verifica la elección de codificación según Accept-Encoding"""
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("gzip;q=0, deflate") is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("") is None
+
+
+def test_listado_comprimido_solo_sobre_umbral(
+    db_client: TestClient, db_session: Session
+) -> None:
+    """Test que verifica que solo se comprimen las respuestas grandes"""
+    db_session.add(Producto(nombre="Café", categoria="bebidas", precio=2))
+    db_session.commit()
+    pequena = db_client.get("/api/v1/productos/")
+    assert "content-encoding" not in pequena.headers
+
+    db_session.add_all(
+        Producto(nombre=f"Producto {i}", categoria="bebidas", precio=2)
+        for i in range(50)
+    )
+    db_session.commit()
+    grande = db_client.get("/api/v1/productos/")
+    assert grande.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in grande.headers["vary"]
+    assert len(grande.json()) == 51
+
+    identidad = db_client.get(
+        "/api/v1/productos/", headers={"Accept-Encoding": "identity"}
+    )
+    assert "content-encoding" not in identidad.headers
+
+
+def test_estaticos_precomprimidos(tmp_path: Path) -> None:
+    """Test que verifica que se sirve la variante .gz vigente"""
+    script = tmp_path / "app.js"
+    script.write_text("console.log('hola');\n" * 200)
+    (tmp_path / "logo.png").write_bytes(b"\x89PNG" * 1000)
+
+    assert precompress_directory(tmp_path) == 1
+    assert precompress_directory(tmp_path) == 0  # ya generada
+    assert not (tmp_path / "logo.png.gz").exists()
+
+    client = TestClient(
+        Starlette(
+            routes=[Mount("/static", PrecompressedStaticFiles(directory=tmp_path))]
+        )
+    )
+    response = client.get("/static/app.js")
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["content-type"].startswith("text/javascript")
+    assert response.text == script.read_text()
+    assert int(response.headers["content-length"]) == (
+        (tmp_path / "app.js.gz").stat().st_size
+    )
+
+    # Con la variante desactualizada se sirve el original
+    variante = tmp_path / "app.js.gz"
+    os.utime(variante, (0, 0))
+    response = client.get("/static/app.js")
+    assert "content-encoding" not in response.headers
+    assert gzip.decompress(variante.read_bytes()) == script.read_bytes()
+
+
+def test_etag_de_respuesta_comprimida(
+    db_client: TestClient, db_session: Session
+) -> None:
+    """Test que verifica que la variante comprimida lleva su propio ETag"""
+    assert encoded_etag('"abc"', "gzip") == '"abc-gzip"'
+    assert encoded_etag('W/"abc"', "br") == 'W/"abc-br"'
+    assert strip_etag_encoding('W/"abc-br"') == 'W/"abc"'
+
+    db_session.add_all(
+        Producto(nombre=f"Producto {i}", categoria="bebidas", precio=2)
+        for i in range(50)
+    )
+    db_session.commit()
+    grande = db_client.get("/api/v1/productos/")
+    assert grande.headers["content-encoding"] == "gzip"
+    etag = grande.headers["etag"]
+    assert etag.endswith('-gzip"')
+
+    revalidada = db_client.get("/api/v1/productos/", headers={"If-None-Match": etag})
+    assert revalidada.status_code == 304
+    assert revalidada.headers["etag"] == etag
+
+    identidad = db_client.get(
+        "/api/v1/productos/", headers={"Accept-Encoding": "identity"}
+    )
+    assert identidad.headers["etag"] == strip_etag_encoding(etag)
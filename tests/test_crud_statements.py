@@ -0,0 +1,53 @@
+"""
+Tests de las sentencias select() precompiladas del CRUD
+"""
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.crud import crud_habitacion, crud_usuario
+from app.models import Habitacion, Usuario
+
+
+def test_sentencias_reutilizan_cache(db_engine: Engine, db_session: Session) -> None:
+    """Test que verifica que la SQL compilada se reutiliza entre llamadas"""
+    db_session.add_all(
+        [
+            Habitacion(numero="101", tipo="doble", precio_noche=80),
+            Habitacion(numero="102", tipo="suite", precio_noche=150),
+        ]
+    )
+    db_session.commit()
+
+    aciertos: list[bool] = []
+
+    def registrar(_conn, _cursor, _statement, _params, context, _many) -> None:
+        aciertos.append(context.cache_hit == context.dialect.CACHE_HIT)
+
+    event.listen(db_engine, "after_cursor_execute", registrar)
+    try:
+        crud_habitacion.get_habitacion_by_numero(db_session, "101")
+        segunda = crud_habitacion.get_habitacion_by_numero(db_session, "102")
+    finally:
+        event.remove(db_engine, "after_cursor_execute", registrar)
+    assert aciertos == [False, True]
+    assert segunda.tipo == "suite"
+
+
+def test_funciones_crud(db_session: Session) -> None:
+    """Test que verifica búsquedas por clave y paginación ordenada"""
+    db_session.add_all(
+        [
+            Habitacion(numero=f"{100 + i}", tipo="doble", precio_noche=80)
+            for i in range(5)
+        ]
+        + [Usuario(email="ana@hotel.com", hashed_password="x", nombre_completo="Ana")]
+    )
+    db_session.commit()
+
+    assert crud_habitacion.get_habitacion_by_numero(db_session, "103").numero == "103"
+    assert crud_habitacion.get_habitacion_by_numero(db_session, "999") is None
+    assert crud_usuario.get_usuario_by_email(db_session, "ana@hotel.com") is not None
+    pagina = crud_habitacion.get_habitaciones(db_session, skip=1, limit=2)
+    assert [h.numero for h in pagina] == ["101", "102"]
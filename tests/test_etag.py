@@ -0,0 +1,63 @@
+"""
+Tests de ETags y peticiones condicionales
+"""
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.db.query_stats import count_queries
+from app.models import Producto
+
+
+def test_entidad_304_y_cambio_tras_put(
+    db_client: TestClient, db_session: Session
+) -> None:
+    """Test que verifica If-None-Match en una entidad y su invalidación"""
+    db_session.add(Producto(nombre="Café", categoria="bebidas", precio=2))
+    db_session.commit()
+    url = "/api/v1/productos/1"
+
+    etag = db_client.get(url).headers["ETag"]
+    no_modificado = db_client.get(url, headers={"If-None-Match": etag})
+    assert no_modificado.status_code == 304
+    assert no_modificado.content == b""
+    assert no_modificado.headers["ETag"] == etag
+
+    actualizado = db_client.put(url, json={"precio": 3})
+    assert actualizado.headers["ETag"] != etag
+    assert db_client.get(url, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_coleccion_304_sin_leer_filas(
+    db_client: TestClient, db_session: Session
+) -> None:
+    """Test que verifica que un 304 de listado solo ejecuta el agregado"""
+    db_session.add(Producto(nombre="Café", categoria="bebidas", precio=2))
+    db_session.commit()
+    url = "/api/v1/productos/"
+
+    etag = db_client.get(url).headers["ETag"]
+    assert etag.startswith('W/"')
+    with count_queries() as stats:
+        response = db_client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert stats.count == 1
+
+    db_client.post(url, json={"nombre": "Té", "categoria": "bebidas", "precio": 2})
+    assert db_client.get(url, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_if_match_en_put(db_client: TestClient, db_session: Session) -> None:
+    """Test que verifica la actualización optimista con If-Match"""
+    db_session.add(Producto(nombre="Café", categoria="bebidas", precio=2))
+    db_session.commit()
+    url = "/api/v1/productos/1"
+    etag = db_client.get(url).headers["ETag"]
+
+    primera = db_client.put(url, json={"precio": 3}, headers={"If-Match": etag})
+    assert primera.status_code == 200
+
+    # Un segundo cliente con el ETag antiguo no pisa el cambio
+    segunda = db_client.put(url, json={"precio": 4}, headers={"If-Match": etag})
+    assert segunda.status_code == 412
+    assert db_client.get(url).json()["precio"] == 3
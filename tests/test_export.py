@@ -0,0 +1,100 @@
+"""
+Tests de los endpoints de exportación
+"""
+
+import csv
+import io
+import json
+from datetime import date, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.models import Hospedaje, Pedido
+
+
+@pytest.fixture
+def hospedajes(db_session: Session) -> None:
+    """Un hospedaje por mes de 2025 y uno de 2024"""
+    fechas = [date(2025, mes, 10) for mes in range(1, 13)] + [date(2024, 12, 31)]
+    db_session.add_all(
+        Hospedaje(
+            nombre_huesped=f"Huésped, {fecha.month}",
+            numero_habitacion="101",
+            tipo_habitacion="doble",
+            fecha_check_in=fecha,
+            fecha_check_out=fecha,
+            precio_por_noche="80.50",
+            numero_noches=1,
+            total_hospedaje="80.50",
+            estado="check_out",
+        )
+        for fecha in fechas
+    )
+    db_session.commit()
+
+
+@pytest.mark.usefixtures("hospedajes")
+def test_exportar_hospedajes_ndjson(db_client: TestClient) -> None:
+    """Test que verifica el rango inclusivo y la descarga NDJSON"""
+    response = db_client.get(
+        "/api/v1/exportaciones/hospedajes",
+        params={"desde": "2025-01-10", "hasta": "2025-12-10"},
+    )
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == (
+        'attachment; filename="hospedajes_2025-01-10_2025-12-10.ndjson"'
+    )
+    filas = [json.loads(linea) for linea in response.text.splitlines()]
+    assert len(filas) == 12
+    assert filas[0]["fecha_check_in"] == "2025-01-10"
+    assert filas[0]["precio_por_noche"] == "80.50"
+
+
+@pytest.mark.usefixtures("hospedajes")
+def test_exportar_hospedajes_csv(db_client: TestClient) -> None:
+    """Test que verifica la cabecera y el escapado del CSV"""
+    response = db_client.get(
+        "/api/v1/exportaciones/hospedajes",
+        params={"desde": "2025-06-01", "hasta": "2025-06-30", "formato": "csv"},
+    )
+    assert response.headers["content-type"].startswith("text/csv")
+    filas = list(csv.DictReader(io.StringIO(response.text)))
+    assert len(filas) == 1
+    assert filas[0]["nombre_huesped"] == "Huésped, 6"
+    assert filas[0]["fecha_check_in"] == "2025-06-10"
+
+
+@pytest.mark.usefixtures("hospedajes")
+def test_exportar_pedidos_por_fecha_creacion(
+    db_client: TestClient, db_session: Session
+) -> None:
+    """Test que verifica el filtro sobre columnas DateTime y el CSV vacío"""
+    db_session.add_all(
+        Pedido(hospedaje_id=1, numero_habitacion="101", fecha_creacion=momento)
+        for momento in (datetime(2025, 3, 1, 23, 59), datetime(2025, 3, 2, 0, 0))
+    )
+    db_session.commit()
+
+    response = db_client.get(
+        "/api/v1/exportaciones/pedidos",
+        params={"desde": "2025-03-01", "hasta": "2025-03-01"},
+    )
+    assert [json.loads(linea)["id"] for linea in response.text.splitlines()] == [1]
+
+    vacio = db_client.get(
+        "/api/v1/exportaciones/productos",
+        params={"desde": "2025-03-01", "hasta": "2025-03-01", "formato": "csv"},
+    )
+    assert "id" in vacio.text.splitlines()[0].split(",")
+    assert len(vacio.text.splitlines()) == 1
+
+
+def test_exportar_rango_invalido(db_client: TestClient) -> None:
+    """Test que verifica 400 si desde > hasta"""
+    response = db_client.get(
+        "/api/v1/exportaciones/hospedajes",
+        params={"desde": "2025-02-01", "hasta": "2025-01-01"},
+    )
+    assert response.status_code == 400
@@ -0,0 +1,101 @@
+"""
+Tests de la ruta rápida de serialización (FAST_JSON_RESPONSES)
+"""
+
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api import fast_json
+from app.api.endpoints import (
+    habitaciones,
+    hospedaje,
+    lecturas_async,
+    productos,
+    tarifas,
+)
+from app.api.pagination import NEXT_CURSOR_HEADER
+from app.main import app
+from app.models import Habitacion, Hospedaje, Producto, Tarifa
+
+
+@pytest.fixture
+def catalogo(db_session: Session) -> None:
+    """Dos filas de cada listado, con nulos, decimales, fechas y booleanos"""
+    for i in range(2):
+        db_session.add_all(
+            [
+                Habitacion(
+                    numero=f"{101 + i}",
+                    tipo="doble",
+                    precio_noche=Decimal("80.50"),
+                    descripcion=None if i else "Vista al patio",
+                    tiene_balcon=bool(i),
+                ),
+                Hospedaje(
+                    nombre_huesped=f"Huésped {i}",
+                    numero_habitacion="101",
+                    tipo_habitacion="doble",
+                    fecha_check_in=date(2025, 1, 1),
+                    fecha_check_out=date(2025, 1, 3),
+                    precio_por_noche=Decimal("80.50"),
+                    numero_noches=2,
+                    total_hospedaje=Decimal("161.00"),
+                ),
+                Producto(nombre=f"Café {i}", categoria="bebidas", precio=2.5, stock=i),
+                Tarifa(
+                    nombre=f"Temporada {i}",
+                    tipo_habitacion="doble",
+                    precio=95,
+                    fecha_inicio=date(2025, 6, 1) if i else None,
+                ),
+            ]
+        )
+    db_session.commit()
+
+
+@pytest.mark.usefixtures("catalogo")
+@pytest.mark.parametrize("cliente", ["db_client", "async_db_client"])
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/v1/habitaciones/",
+        "/api/v1/hospedajes/",
+        "/api/v1/productos/",
+        "/api/v1/tarifas/",
+    ],
+)
+def test_misma_salida_que_pydantic(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+    cliente: str,
+    url: str,
+) -> None:
+    """Test que verifica que la ruta rápida produce el mismo JSON y cursor"""
+    client: TestClient = request.getfixturevalue(cliente)
+    esperado = client.get(url, params={"limit": 2})
+    monkeypatch.setattr("app.core.config.settings.FAST_JSON_RESPONSES", True)
+    rapidas = []
+
+    def espia(*args, **kwargs):
+        rapidas.append(url)
+        return fast_json.rows_response(*args, **kwargs)
+
+    for modulo in (habitaciones, hospedaje, productos, tarifas, lecturas_async):
+        monkeypatch.setattr(modulo, "rows_response", espia)
+    rapido = client.get(url, params={"limit": 2})
+
+    assert rapidas == [url]
+    assert rapido.status_code == 200
+    assert rapido.json() == esperado.json()
+    assert rapido.headers[NEXT_CURSOR_HEADER] == esperado.headers[NEXT_CURSOR_HEADER]
+
+
+def test_docs_conservan_el_esquema() -> None:
+    """Test que verifica que /docs sigue describiendo el schema de lectura"""
+    respuesta = app.openapi()["paths"]["/api/v1/habitaciones/"]["get"]["responses"]
+    esquema = respuesta["200"]["content"]["application/json"]["schema"]
+    assert esquema["items"]["$ref"].endswith("/HabitacionRead")
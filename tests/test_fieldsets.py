@@ -0,0 +1,61 @@
+"""
+Tests de los sparse fieldsets (?fields=) en los listados
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.db.query_stats import count_queries
+from app.models import Habitacion, Producto
+
+
+@pytest.fixture(params=["db_client", "async_db_client"])
+def client(request: pytest.FixtureRequest) -> TestClient:
+    """Cliente con los listados síncronos y con DATABASE_ASYNC habilitado"""
+    return request.getfixturevalue(request.param)
+
+
+def test_fields_limita_sql_y_respuesta(client: TestClient, db_session: Session) -> None:
+    """Test que verifica que solo se leen y devuelven los campos pedidos"""
+    db_session.add(
+        Habitacion(numero="101", tipo="doble", precio_noche=80, descripcion="x" * 1500)
+    )
+    db_session.commit()
+
+    with count_queries() as stats:
+        response = client.get(
+            "/api/v1/habitaciones/", params={"fields": "numero, tipo,estado,tipo"}
+        )
+
+    assert response.json() == [
+        {"id": 1, "numero": "101", "tipo": "doble", "estado": "disponible"}
+    ]
+    # La otra sentencia es el agregado del ETag de colección
+    (sentencia,) = [s for s in stats.statements if "LIMIT" in s]
+    assert "descripcion" not in sentencia
+    assert "observaciones" not in sentencia
+
+
+def test_fields_en_activos(client: TestClient, db_session: Session) -> None:
+    """Test que verifica fields junto con activos_solo"""
+    db_session.add(Producto(nombre="Café", categoria="bebidas", precio=2.5))
+    db_session.commit()
+
+    response = client.get(
+        "/api/v1/productos/", params={"activos_solo": True, "fields": "precio"}
+    )
+    assert response.json() == [{"id": 1, "precio": 2.5}]
+
+
+def test_fields_invalidos(client: TestClient) -> None:
+    """Test que verifica 400 ante campos desconocidos o combinados con stream"""
+    response = client.get("/api/v1/tarifas/", params={"fields": "nombre,clave"})
+    assert response.status_code == 400
+    assert "clave" in response.json()["detail"]
+
+    response = client.get(
+        "/api/v1/productos/",
+        params={"activos_solo": True, "stream": True, "fields": "nombre"},
+    )
+    assert response.status_code == 400
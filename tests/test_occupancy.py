@@ -0,0 +1,109 @@
+"""
+Tests del calendario de ocupación (/reportes/ocupacion)
+"""
+
+import base64
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from app.crud import ocupacion
+from app.db.query_stats import QueryStats
+from app.models import Habitacion, Hospedaje
+
+OCUPACION = "/api/v1/reportes/ocupacion"
+RANGO = {"desde": "2025-06-01", "hasta": "2025-06-11"}
+
+
+@pytest.fixture
+def hotel(db_session: Session) -> None:
+    """Tres habitaciones con hospedajes alrededor de los diez primeros días de junio"""
+    for numero, tipo in [("101", "doble"), ("102", "doble"), ("201", "suite")]:
+        db_session.add(
+            Habitacion(numero=numero, tipo=tipo, capacidad_personas=2, precio_noche=80)
+        )
+    for numero, entrada, salida, estado in [
+        # Empieza antes del rango: se recorta al día 0
+        ("101", date(2025, 5, 28), date(2025, 6, 3), "check_in"),
+        # Entra el día que sale el anterior y se solapa con otro: un solo tramo
+        ("101", date(2025, 6, 3), date(2025, 6, 5), "confirmado"),
+        ("101", date(2025, 6, 4), date(2025, 6, 6), "pendiente"),
+        ("101", date(2025, 6, 8), date(2025, 6, 20), "confirmado"),
+        ("102", date(2025, 6, 2), date(2025, 6, 4), "cancelado"),
+        ("201", date(2025, 6, 10), date(2025, 6, 11), "confirmado"),
+    ]:
+        db_session.add(
+            Hospedaje(
+                nombre_huesped="Huésped",
+                numero_habitacion=numero,
+                tipo_habitacion="doble",
+                fecha_check_in=entrada,
+                fecha_check_out=salida,
+                precio_por_noche=80,
+                numero_noches=(salida - entrada).days,
+                total_hospedaje=80 * (salida - entrada).days,
+                estado=estado,
+            )
+        )
+    db_session.commit()
+
+
+@pytest.fixture(params=["numpy", "intervalos"])
+def ruta(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Con NumPy (si está instalado) y con la fusión de intervalos"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(ocupacion, "np", None)
+
+
+@pytest.mark.usefixtures("hotel", "ruta")
+def test_ocupacion_rle_y_bits(
+    db_client: TestClient,
+    query_budget: Callable[[int], AbstractContextManager[QueryStats]],
+) -> None:
+    """Test que verifica los tramos y los bits de cada habitación"""
+    with query_budget(2):
+        response = db_client.get(OCUPACION, params=RANGO)
+    assert response.status_code == 200
+    datos = response.json()
+    assert datos["dias"] == 10
+    assert datos["habitaciones"] == [
+        {"numero": "101", "ocupacion": [[0, 5], [7, 3]]},
+        {"numero": "102", "ocupacion": []},
+        # La noche del 10 es la última del rango
+        {"numero": "201", "ocupacion": [[9, 1]]},
+    ]
+
+    response = db_client.get(OCUPACION, params={**RANGO, "formato": "bits"})
+    bits = {
+        h["numero"]: base64.b64decode(h["ocupacion"])
+        for h in response.json()["habitaciones"]
+    }
+    # 1111100111 y 6 bits de relleno
+    assert bits["101"] == bytes([0b11111001, 0b11000000])
+    assert bits["102"] == bytes(2)
+
+    response = db_client.get(OCUPACION, params={**RANGO, "tipo": "suite"})
+    assert [h["numero"] for h in response.json()["habitaciones"]] == ["201"]
+
+
+def test_rango_invalido(db_client: TestClient) -> None:
+    """Test que verifica el rechazo de rangos vacíos o demasiado largos"""
+    for hasta in ("2025-06-01", "2030-01-01"):
+        response = db_client.get(
+            OCUPACION, params={"desde": "2025-06-01", "hasta": hasta}
+        )
+        assert response.status_code == 400
+
+
+def test_fechas_iso_en_postgresql() -> None:
+    """Test que verifica que las fechas no dependen del DateStyle de PostgreSQL"""
+    sql = str(ocupacion.SELECT_ESTANCIAS.compile(dialect=postgresql.dialect()))
+    assert "to_char(hospedajes.fecha_check_in, 'YYYY-MM-DD')" in sql
+    assert "CAST" not in sql
@@ -0,0 +1,52 @@
+"""
+Tests de la paginación por cursor (keyset)
+"""
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from app.models import Habitacion
+
+
+def test_cursor_recorre_todas_las_paginas(
+    db_client: TestClient, db_session: Session
+) -> None:
+    """Test que verifica que seguir X-Next-Cursor entrega cada fila una vez"""
+    db_session.add_all(
+        Habitacion(numero=f"{100 + i}", tipo="doble", precio_noche=80) for i in range(7)
+    )
+    db_session.commit()
+
+    numeros: list[str] = []
+    params: dict[str, str | int] = {"limit": 3}
+    while True:
+        response = db_client.get("/api/v1/habitaciones/", params=params)
+        assert response.status_code == 200
+        numeros += [h["numero"] for h in response.json()]
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            break
+        params = {"limit": 3, "cursor": cursor}
+
+    assert numeros == [f"{100 + i}" for i in range(7)]
+
+
+def test_offset_sigue_disponible(db_client: TestClient, db_session: Session) -> None:
+    """Test que verifica la compatibilidad con skip/limit"""
+    db_session.add_all(
+        Habitacion(numero=f"{100 + i}", tipo="doble", precio_noche=80) for i in range(4)
+    )
+    db_session.commit()
+
+    response = db_client.get("/api/v1/habitaciones/", params={"skip": 2, "limit": 5})
+    assert [h["numero"] for h in response.json()] == ["102", "103"]
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+def test_cursor_invalido(db_client: TestClient) -> None:
+    """Test que verifica que un cursor manipulado responde 400"""
+    assert decode_cursor(encode_cursor(42)) == 42
+    for cursor in ("no-es-un-cursor", encode_cursor(42)[:-2], "eyJpZCI6IngifQ"):
+        response = db_client.get("/api/v1/hospedajes/", params={"cursor": cursor})
+        assert response.status_code == 400
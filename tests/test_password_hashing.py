@@ -0,0 +1,100 @@
+"""
+Tests de la calibración de costes y del rehash transparente en el login
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+from passlib.hash import bcrypt
+from sqlalchemy.orm import Session
+
+from app.core import security
+from app.core.password_calibration import calibrate_argon2, calibrate_bcrypt
+from app.core.password_pool import password_pool
+from app.crud import crud_usuario
+from app.models import Usuario
+
+
+@pytest.fixture
+def contexto(monkeypatch: pytest.MonkeyPatch) -> None:
+    """bcrypt con 5 rondas, verificado en línea (sin procesos del pool)"""
+    monkeypatch.setattr(password_pool, "workers", 0)
+    monkeypatch.setattr(
+        security, "pwd_context", security.build_password_context(bcrypt_rounds=5)
+    )
+
+
+def _usuario(db: Session, hashed_password: str) -> Usuario:
+    usuario = Usuario(
+        nombre_completo="Ana Recepción",
+        email="ana@hotel.com",
+        hashed_password=hashed_password,
+        is_active=True,
+    )
+    db.add(usuario)
+    db.commit()
+    return usuario
+
+
+def test_login_regenera_hash_antiguo(db_session: Session, contexto: None) -> None:
+    """Test que verifica que un hash con menos rondas se actualiza al entrar"""
+    usuario = _usuario(db_session, bcrypt.using(rounds=4).hash("secreto"))
+
+    assert crud_usuario.authenticate_usuario(
+        db_session, email="ana@hotel.com", password="secreto"
+    )
+    db_session.refresh(usuario)
+    assert usuario.hashed_password.startswith("$2b$05$")
+    assert security.verify_password("secreto", usuario.hashed_password)
+
+    # Con el hash al día no se vuelve a escribir
+    actual = usuario.hashed_password
+    crud_usuario.authenticate_usuario(
+        db_session, email="ana@hotel.com", password="secreto"
+    )
+    db_session.refresh(usuario)
+    assert usuario.hashed_password == actual
+    # Una contraseña incorrecta no toca el hash
+    assert not crud_usuario.authenticate_usuario(
+        db_session, email="ana@hotel.com", password="otra"
+    )
+
+
+def test_login_async_migra_a_argon2(
+    db_client: TestClient,
+    db_session: Session,
+    contexto: None,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test que verifica la migración de bcrypt a argon2 desde el endpoint"""
+    pytest.importorskip("argon2")
+    monkeypatch.setattr(
+        security,
+        "pwd_context",
+        security.build_password_context("argon2", argon2_memory_cost=1024),
+    )
+    usuario = _usuario(db_session, bcrypt.using(rounds=4).hash("secreto"))
+
+    response = db_client.post(
+        "/api/v1/auth/login", data={"username": "ana@hotel.com", "password": "secreto"}
+    )
+    assert response.status_code == 200
+    db_session.refresh(usuario)
+    assert usuario.hashed_password.startswith("$argon2id$")
+    assert "m=1024" in usuario.hashed_password
+
+
+def test_calibracion_elige_el_mayor_coste_bajo_el_objetivo() -> None:
+    """Test que verifica la elección de rondas y memoria con tiempos simulados"""
+    medidas: list[int] = []
+
+    def bcrypt_ms(rondas: int) -> float:
+        medidas.append(rondas)
+        return 60 * 2 ** (rondas - 10)
+
+    assert calibrate_bcrypt(250, measure=bcrypt_ms) == (12, 240)
+    assert medidas == [10, 11, 12]
+    # Nunca por debajo del mínimo aunque la máquina sea lenta
+    assert calibrate_bcrypt(10, measure=bcrypt_ms)[0] == 10
+
+    memoria, tiempo = calibrate_argon2(250, measure=lambda kib: kib / 1024 * 3)
+    assert (memoria, tiempo) == (77824, 228)
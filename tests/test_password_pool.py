@@ -0,0 +1,92 @@
+"""
+Tests del pool de contraseñas y de la admisión de inicios de sesión
+"""
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.password_pool import HashingPool, PasswordPoolBusyError, password_pool
+from app.core.security import (
+    _verify,
+    get_password_hash,
+    pwd_context,
+    verify_password,
+)
+from app.models import Usuario
+
+
+def test_cola_llena_rechaza_al_instante() -> None:
+    """Test que verifica que pasado workers + cola se lanza PasswordPoolBusyError"""
+    pool = HashingPool(
+        workers=1, queue_limit=1, executor_factory=lambda n: ThreadPoolExecutor(n)
+    )
+    pool.enable()
+    liberar = threading.Event()
+    futures = [pool._submit(liberar.wait) for _ in range(2)]
+
+    with pytest.raises(PasswordPoolBusyError):
+        pool.call(liberar.wait)
+    liberar.set()
+    assert all(f.result() for f in futures)
+    assert pool.call(lambda: "ok") == "ok"
+    assert pool.stats()["rejected"] == 1
+    assert pool.stats()["pending"] == 0
+    pool.shutdown()
+
+
+def test_verificacion_en_procesos() -> None:
+    """Test que verifica bcrypt en un proceso del pool"""
+    pool = HashingPool(workers=1, queue_limit=0)
+    pool.enable()
+    hashed = pwd_context.hash("secreto")
+    try:
+        assert pool.call(_verify, "secreto", hashed) is True
+        assert pool.call(_verify, "otra", hashed) is False
+    finally:
+        pool.shutdown()
+
+
+@pytest.fixture
+def usuario(db_session: Session) -> Usuario:
+    """Usuario activo con contraseña real"""
+    usuario = Usuario(
+        nombre_completo="Ana Recepción",
+        email="ana@hotel.com",
+        hashed_password=pwd_context.hash("secreto"),
+        is_active=True,
+    )
+    db_session.add(usuario)
+    db_session.commit()
+    return usuario
+
+
+def test_login_saturado_responde_503(
+    db_client: TestClient, usuario: Usuario, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test que verifica el login normal y el 503 con la cola llena"""
+    monkeypatch.setattr(password_pool, "workers", 0)
+    datos = {"username": "ana@hotel.com", "password": "secreto"}
+    response = db_client.post("/api/v1/auth/login", data=datos)
+    assert response.status_code == 200
+    assert response.json()["token_type"] == "bearer"
+    assert (
+        db_client.post(
+            "/api/v1/auth/login", data={**datos, "password": "mal"}
+        ).status_code
+        == 401
+    )
+
+    monkeypatch.setattr(password_pool, "queue_limit", -1)
+    response = db_client.post("/api/v1/auth/login", data=datos)
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_hash_y_verificacion() -> None:
+    """Test que verifica que el hash generado se verifica con el mismo contexto"""
+    hashed = get_password_hash("secreto")
+    assert verify_password("secreto", hashed)
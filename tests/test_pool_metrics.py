@@ -0,0 +1,39 @@
+"""
+Tests de la instrumentación del pool de conexiones
+"""
+
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import text
+
+from app.db.pool_metrics import get_pool_metrics
+from app.db.session import create_app_engine
+from app.main import app
+
+
+def test_pool_metrics_checkout(tmp_path: Path) -> None:
+    """Test que verifica los contadores y la espera de checkout"""
+    engine = create_app_engine(f"sqlite:///{tmp_path}/pool.db", name="test_pool")
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+        en_uso = get_pool_metrics()["test_pool"]["in_use"]
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    metricas = get_pool_metrics()["test_pool"]
+    assert en_uso == 1
+    assert metricas["in_use"] == 0
+    assert metricas["checkouts"] == 2
+    assert metricas["checkins"] == 2
+    assert metricas["connects"] == 1
+    assert metricas["checkout_wait_ms"]["count"] == 2
+    assert metricas["pool_class"] == "InstrumentedQueuePool"
+    engine.dispose()
+
+
+def test_pool_health_endpoint() -> None:
+    """Test que verifica el endpoint interno de métricas del pool"""
+    response = TestClient(app).get("/health/pool")
+    assert response.status_code == 200
+    assert "primary" in response.json()["engines"]
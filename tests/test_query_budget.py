@@ -0,0 +1,85 @@
+"""
+Presupuestos de consultas SQL por endpoint
+"""
+
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from app.db.query_stats import QueryStats
+from app.models import Habitacion, Hospedaje, LineaPedido, Pedido, Producto
+
+Budget = Callable[[int], AbstractContextManager[QueryStats]]
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "/api/v1/habitaciones/",
+        "/api/v1/hospedajes/",
+        "/api/v1/productos/",
+        "/api/v1/tarifas/",
+    ],
+)
+def test_listados_una_consulta(
+    db_client: TestClient, query_budget: Budget, url: str
+) -> None:
+    """Test que verifica que los listados emiten una sola consulta de filas"""
+    # La página y el agregado max(fecha_actualizacion)/count del ETag
+    with query_budget(2):
+        assert db_client.get(url).status_code == 200
+
+
+def test_dashboard_ejecutivo(db_client: TestClient, query_budget: Budget) -> None:
+    """Test que fija el presupuesto del dashboard ejecutivo"""
+    with query_budget(6):
+        response = db_client.get("/api/v1/reportes/dashboard-ejecutivo/")
+    assert response.status_code == 200
+
+
+def test_detecta_n_mas_uno_en_lineas(db_session: Session, query_budget: Budget):
+    """Test que verifica que un acceso N+1 a Pedido.lineas rompe el presupuesto"""
+    hospedaje = Hospedaje(
+        nombre_huesped="Ana",
+        numero_habitacion="101",
+        tipo_habitacion="doble",
+        fecha_check_in=date(2025, 1, 1),
+        fecha_check_out=date(2025, 1, 2),
+        precio_por_noche=80,
+        numero_noches=1,
+        total_hospedaje=80,
+    )
+    producto = Producto(nombre="Café", categoria="bebidas", precio=2)
+    db_session.add_all(
+        [hospedaje, producto, Habitacion(numero="101", tipo="doble", precio_noche=80)]
+    )
+    db_session.flush()
+    for _ in range(3):
+        pedido = Pedido(hospedaje_id=hospedaje.id, numero_habitacion="101")
+        pedido.lineas.append(
+            LineaPedido(
+                producto_id=producto.id,
+                nombre_producto="Café",
+                precio_unitario=2,
+                subtotal_linea=2,
+            )
+        )
+        db_session.add(pedido)
+    db_session.commit()
+    db_session.expire_all()
+
+    with pytest.raises(AssertionError), query_budget(2):
+        for pedido in db_session.scalars(select(Pedido)):
+            _ = pedido.lineas
+    db_session.expire_all()
+
+    with query_budget(2):
+        pedidos = db_session.scalars(
+            select(Pedido).options(selectinload(Pedido.lineas))
+        )
+        assert sum(len(p.lineas) for p in pedidos) == 3
@@ -0,0 +1,81 @@
+"""
+Tests del enrutado de lecturas hacia la réplica
+"""
+
+from collections.abc import Generator
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.api import deps
+from app.db.base_class import Base
+from app.db.session import PRIMARY_SESSION, ReadOnlySession, create_app_engine
+from app.main import app
+from app.models import Habitacion
+
+
+@pytest.fixture
+def client(tmp_path: Path) -> Generator[TestClient, None, None]:
+    """Cliente con primario y réplica apuntando a dos ficheros SQLite"""
+    primario = create_app_engine(f"sqlite:///{tmp_path}/primario.db", "t_primario")
+    replica = create_app_engine(f"sqlite:///{tmp_path}/replica.db", "t_replica")
+    for engine, numero in ((primario, "P1"), (replica, "R1")):
+        Base.metadata.create_all(bind=engine)
+        with Session(engine) as db:
+            db.add(Habitacion(numero=numero, tipo="doble", precio_noche=80))
+            db.commit()
+
+    sesion_primario = sessionmaker(bind=primario)
+    sesion_replica = sessionmaker(
+        bind=replica, class_=ReadOnlySession, info={PRIMARY_SESSION: sesion_primario}
+    )
+
+    def get_db() -> Generator[Session, None, None]:
+        with sesion_primario() as db:
+            yield db
+
+    def get_read_db() -> Generator[Session, None, None]:
+        with sesion_replica() as db:
+            yield db
+
+    app.dependency_overrides[deps.get_db] = get_db
+    app.dependency_overrides[deps.get_read_db] = get_read_db
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    primario.dispose()
+    replica.dispose()
+
+
+def test_listados_leen_de_la_replica(client: TestClient) -> None:
+    """Test que verifica que los listados usan la réplica y el detalle el primario"""
+    response = client.get("/api/v1/habitaciones/")
+    assert [h["numero"] for h in response.json()] == ["R1"]
+
+    assert client.get("/api/v1/habitaciones/P1").status_code == 200
+    assert client.get("/api/v1/habitaciones/R1").status_code == 404
+
+
+def test_catalogo_en_cache_se_llena_desde_el_primario(client: TestClient) -> None:
+    """Test que verifica que la caché no guarda lo que aún no llegó a la réplica"""
+    response = client.post(
+        "/api/v1/productos/",
+        json={"nombre": "Café", "categoria": "bebidas", "precio": 2.5},
+    )
+    assert response.status_code == 200, response.text
+
+    for _ in range(2):
+        response = client.get("/api/v1/productos/", params={"activos_solo": True})
+        assert [p["nombre"] for p in response.json()] == ["Café"]
+
+
+def test_sesion_replica_rechaza_escrituras(tmp_path: Path) -> None:
+    """Test que verifica que la sesión de réplica es de solo lectura"""
+    engine = create_app_engine(f"sqlite:///{tmp_path}/ro.db", "t_solo_lectura")
+    Base.metadata.create_all(bind=engine)
+    with ReadOnlySession(engine) as db:
+        db.add(Habitacion(numero="X1", tipo="doble", precio_noche=80))
+        with pytest.raises(RuntimeError):
+            db.flush()
+    engine.dispose()
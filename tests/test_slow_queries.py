@@ -0,0 +1,70 @@
+"""
+Tests del registro de consultas lentas
+"""
+
+from collections.abc import Generator
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select, text
+from sqlalchemy.orm import Session
+
+from app.api.endpoints.auth import get_current_superuser
+from app.core.config import get_settings
+from app.crud.crud_usuario import get_usuario_by_email
+from app.db.slow_queries import _explain, clear_slow_queries, get_slow_queries
+from app.main import app
+from app.models import Usuario
+
+
+@pytest.fixture
+def registro_lento(monkeypatch: pytest.MonkeyPatch) -> Generator[None, None, None]:
+    """Registrar todas las consultas como lentas, con EXPLAIN"""
+    settings = get_settings()
+    monkeypatch.setattr(settings, "SLOW_QUERY_THRESHOLD_MS", 0.0)
+    monkeypatch.setattr(settings, "DEBUG", True)
+    clear_slow_queries()
+    yield
+    clear_slow_queries()
+
+
+@pytest.mark.usefixtures("registro_lento")
+def test_registra_consulta_con_plan_y_redaccion(db_session: Session) -> None:
+    """Test que verifica la redacción de parámetros y la captura del plan"""
+    get_usuario_by_email(db_session, email="secreto@hotel.com")
+
+    entrada = get_slow_queries(limit=1)[0]
+    assert "FROM usuarios" in entrada["statement"]
+    assert "secreto@hotel.com" not in str(entrada["parameters"])
+    assert "***" in entrada["parameters"]
+    assert any("usuarios" in paso for paso in entrada["plan"])
+
+
+@pytest.mark.usefixtures("registro_lento")
+def test_endpoint_admin_consultas_lentas(db_client: TestClient) -> None:
+    """Test que verifica el endpoint de administración y la ruta registrada"""
+    db_client.get("/api/v1/habitaciones/")
+
+    app.dependency_overrides[get_current_superuser] = lambda: Usuario(
+        email="admin@hotel.com", is_superuser=True
+    )
+    response = db_client.get("/api/v1/admin/consultas-lentas?limit=1")
+    assert response.status_code == 200
+    assert response.json()[0]["endpoint"] == "GET /api/v1/habitaciones/"
+
+
+def test_explain_fallido_no_rompe_la_transaccion(db_session: Session) -> None:
+    """Test que verifica que un EXPLAIN que falla se deshace en su SAVEPOINT"""
+    db_session.add(
+        Usuario(nombre_completo="A", email="a@hotel.com", hashed_password="x")
+    )
+    db_session.flush()
+    conn = db_session.connection()
+
+    plan = _explain(conn, "SELECT * FROM no_existe", ())
+    assert plan.startswith("No se pudo obtener el plan")
+    assert conn.connection.dbapi_connection.in_transaction
+    assert db_session.execute(text("SELECT count(*) FROM usuarios")).scalar() == 1
+
+    db_session.commit()
+    assert db_session.scalar(select(Usuario.email)) == "a@hotel.com"
@@ -0,0 +1,36 @@
+"""
+Tests del perfil de rendimiento de SQLite
+"""
+
+from pathlib import Path
+
+from sqlalchemy import text
+
+from app.db.session import create_app_engine
+
+
+def test_perfil_sqlite_performance(tmp_path: Path) -> None:
+    """Test que verifica los PRAGMAs del perfil sqlite-performance"""
+    engine = create_app_engine(
+        f"sqlite:///{tmp_path}/perf.db",
+        name="t_sqlite_performance",
+        sqlite_profile="sqlite-performance",
+    )
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+    engine.dispose()
+
+
+def test_perfil_sqlite_default(tmp_path: Path) -> None:
+    """Test que verifica que el perfil por defecto no cambia el journal"""
+    engine = create_app_engine(
+        f"sqlite:///{tmp_path}/default.db",
+        name="t_sqlite_default",
+        sqlite_profile="default",
+    )
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "delete"
+    engine.dispose()
@@ -0,0 +1,112 @@
+"""
+Tests de los listados en streaming
+"""
+
+import json
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.api.streaming import NDJSON_MEDIA_TYPE, STREAM_REQUIRES_ACTIVOS
+from app.models import Hospedaje, Producto
+
+
+@pytest.fixture
+def hospedajes(db_session: Session) -> None:
+    """Cinco hospedajes en check_in"""
+    db_session.add_all(
+        Hospedaje(
+            nombre_huesped=f"Huésped {i}",
+            numero_habitacion="101",
+            tipo_habitacion="doble",
+            fecha_check_in=date(2025, 1, 1),
+            fecha_check_out=date(2025, 1, 2),
+            precio_por_noche=80,
+            numero_noches=1,
+            total_hospedaje=80,
+            estado="check_in",
+        )
+        for i in range(5)
+    )
+    db_session.commit()
+
+
+@pytest.mark.usefixtures("hospedajes")
+def test_stream_json_igual_al_listado(
+    db_client: TestClient, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test que verifica que el array en streaming coincide con el listado"""
+    # Bloques de 2 filas para cubrir varios fragmentos y el separador
+    monkeypatch.setattr("app.core.config.settings.STREAM_YIELD_PER", 2)
+    url = "/api/v1/hospedajes/estado/check_in"
+
+    esperado = db_client.get(url).json()
+    response = db_client.get(url, params={"stream": True})
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == esperado
+    assert len(esperado) == 5
+
+
+@pytest.mark.usefixtures("hospedajes")
+def test_stream_ndjson(db_client: TestClient) -> None:
+    """Test que verifica un objeto JSON por línea con Accept NDJSON"""
+    response = db_client.get(
+        "/api/v1/hospedajes/habitacion/101",
+        params={"stream": True},
+        headers={"Accept": NDJSON_MEDIA_TYPE},
+    )
+
+    assert response.headers["content-type"] == NDJSON_MEDIA_TYPE
+    filas = [json.loads(linea) for linea in response.text.splitlines()]
+    assert [f["nombre_huesped"] for f in filas] == [f"Huésped {i}" for i in range(5)]
+
+
+def test_stream_vacio(db_client: TestClient) -> None:
+    """Test que verifica un array vacío válido sin filas"""
+    response = db_client.get(
+        "/api/v1/productos/", params={"activos_solo": True, "stream": True}
+    )
+    assert response.json() == []
+
+
+def test_stream_sin_activos_solo(
+    db_client: TestClient, async_db_client: TestClient
+) -> None:
+    """Test que verifica que stream=true sin activos_solo se rechaza con 422"""
+    for cliente in (db_client, async_db_client):
+        response = cliente.get("/api/v1/productos/", params={"stream": True})
+        assert response.status_code == 422
+        assert response.json()["detail"] == STREAM_REQUIRES_ACTIVOS
+
+
+@pytest.mark.parametrize("accept", ["application/json", NDJSON_MEDIA_TYPE])
+def test_stream_productos_asincrono(
+    async_db_client: TestClient,
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+    accept: str,
+) -> None:
+    """Test que verifica stream=true en el listado asíncrono de productos"""
+    monkeypatch.setattr("app.core.config.settings.STREAM_YIELD_PER", 2)
+    db_session.add_all(
+        Producto(nombre=f"Producto {i}", categoria="bebidas", precio=2.5)
+        for i in range(5)
+    )
+    db_session.commit()
+    url = "/api/v1/productos/"
+
+    esperado = async_db_client.get(url, params={"activos_solo": True}).json()
+    response = async_db_client.get(
+        url, params={"activos_solo": True, "stream": True}, headers={"Accept": accept}
+    )
+
+    assert response.headers["content-type"] == accept
+    if accept == NDJSON_MEDIA_TYPE:
+        filas = [json.loads(linea) for linea in response.text.splitlines()]
+    else:
+        filas = response.json()
+    assert filas == esperado
+    assert len(filas) == 5
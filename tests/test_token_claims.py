@@ -0,0 +1,172 @@
+"""
+Tests de los claims del token de acceso, los tokens de refresco y la revocación
+"""
+
+from collections.abc import Callable
+from contextlib import AbstractContextManager
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core import revocation, security
+from app.core.cache_backends import SQLiteBackend
+from app.core.config import settings
+from app.core.password_pool import password_pool
+from app.crud import crud_usuario
+from app.crud.crud_usuario import user_cache
+from app.db.query_stats import QueryStats
+from app.models import Usuario
+from app.schemas.usuario import UsuarioUpdate
+
+CONSULTAS_LENTAS = "/api/v1/admin/consultas-lentas"
+
+
+@pytest.fixture(autouse=True)
+def _bcrypt_rapido(monkeypatch: pytest.MonkeyPatch) -> None:
+    """bcrypt con 4 rondas, en línea"""
+    monkeypatch.setattr(password_pool, "workers", 0)
+    monkeypatch.setattr(
+        security, "pwd_context", security.build_password_context(bcrypt_rounds=4)
+    )
+
+
+@pytest.fixture
+def admin(db_session: Session, _bcrypt_rapido: None) -> Usuario:
+    """Superusuario activo con contraseña real"""
+    usuario = Usuario(
+        nombre_completo="Admin",
+        email="admin@hotel.com",
+        hashed_password=security.get_password_hash("secreto"),
+        is_active=True,
+        is_superuser=True,
+    )
+    db_session.add(usuario)
+    db_session.commit()
+    return usuario
+
+
+def _login(client: TestClient) -> dict[str, str]:
+    response = client.post(
+        "/api/v1/auth/login",
+        data={"username": "admin@hotel.com", "password": "secreto"},
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def _auth(token: str) -> dict[str, str]:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_autoriza_sin_consultas(
+    db_client: TestClient,
+    admin: Usuario,
+    query_budget: Callable[[int], AbstractContextManager[QueryStats]],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """Test que verifica que el superusuario se autoriza con los claims"""
+    compartido = SQLiteBackend(str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(revocation, "get_backend", lambda: compartido)
+    tokens = _login(db_client)
+    assert tokens["refresh_token"]
+    assert tokens["expires_in"] == settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+    with query_budget(0):
+        response = db_client.get(
+            CONSULTAS_LENTAS, headers=_auth(tokens["access_token"])
+        )
+    assert response.status_code == 200
+
+
+def test_almacen_del_proceso_consulta_la_base(
+    db_client: TestClient, db_session: Session, admin: Usuario
+) -> None:
+    """Test que verifica que con CACHE_BACKEND=memory no basta con los claims"""
+    tokens = _login(db_client)
+    # Baja hecha en otro worker: su lista de revocación no es la de este
+    db_session.execute(update(Usuario).values(is_active=False))
+    db_session.commit()
+    user_cache.clear()
+
+    response = db_client.get(CONSULTAS_LENTAS, headers=_auth(tokens["access_token"]))
+    assert response.status_code == 400
+
+
+def test_refresco_rota_y_detecta_reutilizacion(
+    db_client: TestClient, admin: Usuario
+) -> None:
+    """Test que verifica la rotación y la revocación de la familia al reutilizar"""
+    primero = _login(db_client)["refresh_token"]
+    response = db_client.post("/api/v1/auth/refresh", json={"refresh_token": primero})
+    assert response.status_code == 200
+    segundo = response.json()["refresh_token"]
+    assert segundo != primero
+    assert (
+        db_client.get(
+            CONSULTAS_LENTAS, headers=_auth(response.json()["access_token"])
+        ).status_code
+        == 200
+    )
+
+    # Reutilizar el primero revoca también el segundo
+    for token in (primero, segundo):
+        response = db_client.post("/api/v1/auth/refresh", json={"refresh_token": token})
+        assert response.status_code == 401
+
+
+def test_logout_y_baja_revocan(
+    db_client: TestClient, db_session: Session, admin: Usuario
+) -> None:
+    """Test que verifica la revocación por token y por usuario"""
+    tokens = _login(db_client)
+    response = db_client.post(
+        "/api/v1/auth/logout",
+        headers=_auth(tokens["access_token"]),
+        json={"refresh_token": tokens["refresh_token"]},
+    )
+    assert response.status_code == 204
+    assert (
+        db_client.get(
+            CONSULTAS_LENTAS, headers=_auth(tokens["access_token"])
+        ).status_code
+        == 401
+    )
+    assert (
+        db_client.post(
+            "/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+        ).status_code
+        == 401
+    )
+
+    # Cambiar el puesto invalida los claims firmados antes del cambio
+    tokens = _login(db_client)
+    crud_usuario.update_usuario(
+        db_session, db_usuario=admin, usuario_in=UsuarioUpdate(puesto="Gerencia")
+    )
+    assert (
+        db_client.get(
+            CONSULTAS_LENTAS, headers=_auth(tokens["access_token"])
+        ).status_code
+        == 401
+    )
+    # El token de refresco sigue valiendo y emite los claims actualizados
+    response = db_client.post(
+        "/api/v1/auth/refresh", json={"refresh_token": tokens["refresh_token"]}
+    )
+    claims = security.decode_access_token(response.json()["access_token"])
+    assert claims["pst"] == "Gerencia"
+    assert claims["su"] is True
+
+    # La baja cierra además todas las sesiones
+    crud_usuario.delete_usuario(db_session, usuario_id=admin.id)
+    assert (
+        db_client.post(
+            "/api/v1/auth/refresh",
+            json={"refresh_token": response.json()["refresh_token"]},
+        ).status_code
+        == 401
+    )
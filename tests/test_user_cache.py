@@ -0,0 +1,74 @@
+"""
+Tests de la caché de usuarios autenticados
+"""
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.api.endpoints.auth import get_current_user
+from app.core.security import create_access_token
+from app.crud import crud_usuario
+from app.db.query_stats import count_queries
+from app.models import Usuario
+from app.schemas.usuario import UsuarioUpdate
+
+
+@pytest.fixture
+def token(db_session: Session) -> str:
+    """Token de un usuario activo"""
+    db_session.add(
+        Usuario(
+            nombre_completo="Ana Recepción",
+            email="ana@hotel.com",
+            hashed_password="x",
+            is_active=True,
+        )
+    )
+    db_session.commit()
+    return create_access_token(subject="ana@hotel.com")
+
+
+def test_usuario_cacheado_sin_consultas(db_engine: Engine, token: str) -> None:
+    """Test que verifica que la segunda petición no consulta la base"""
+    with Session(db_engine) as db:
+        assert get_current_user(db, token).email == "ana@hotel.com"
+
+    with Session(db_engine) as db, count_queries() as stats:
+        usuario = get_current_user(db, token)
+    assert stats.count == 0
+    assert usuario.nombre_completo == "Ana Recepción"
+
+
+def test_update_y_delete_invalidan(db_engine: Engine, token: str) -> None:
+    """Test que verifica que los cambios y la baja se aplican de inmediato"""
+    with Session(db_engine) as db:
+        get_current_user(db, token)
+        crud_usuario.update_usuario(
+            db,
+            db_usuario=crud_usuario.get_usuario(db, 1),
+            usuario_in=UsuarioUpdate(nombre_completo="Ana García"),
+        )
+    with Session(db_engine) as db:
+        assert get_current_user(db, token).nombre_completo == "Ana García"
+
+        crud_usuario.delete_usuario(db, usuario_id=1)
+        with pytest.raises(HTTPException) as exc:
+            get_current_user(db, token)
+    assert exc.value.status_code == 400
+
+
+def test_email_desconocido_no_se_cachea(db_engine: Engine) -> None:
+    """Test que verifica que un usuario creado después sí se encuentra"""
+    token = create_access_token(subject="nuevo@hotel.com")
+    with Session(db_engine) as db:
+        with pytest.raises(HTTPException):
+            get_current_user(db, token)
+        db.add(
+            Usuario(
+                nombre_completo="Nuevo", email="nuevo@hotel.com", hashed_password="x"
+            )
+        )
+        db.commit()
+        assert get_current_user(db, token).email == "nuevo@hotel.com"